@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+bench_config.py
+───────────────
+Measure ConfigManager first-load (startup) cost with and without on-disk snapshots.
+
+Every timed load uses a fresh ConfigManager, as a new pabot worker or suite
+would. "cold" parses YAML and substitutes env vars; "snapshot" reads the
+compiled snapshot written by an earlier process. The --subprocess rows time
+the first load_config inside freshly spawned interpreters.
+
+The interpolation table compares the legacy eager ${VAR} substitution (the
+original _substitute_env_vars, reproduced below) with compiling the plan
+once and resolving only the keys a suite reads.
+
+Usage:
+    uv run python benchmarks/bench_config.py [--devices 500] [--repeat 20]
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+LIB_DIR = os.path.join(os.path.dirname(__file__), "..", "libraries", "base")
+FRAMEWORK_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, LIB_DIR)
+
+import config_manager  # noqa: E402
+from config_manager import ConfigManager  # noqa: E402
+
+CHILD = """
+import logging, sys, time
+logging.disable(logging.WARNING)
+sys.path.insert(0, {lib!r})
+import config_manager
+config_manager.SNAPSHOT_DIR = config_manager.Path({snap!r})
+manager = config_manager.ConfigManager({cfg!r}, use_snapshots={snap_on})
+start = time.perf_counter()
+manager.load_config({name!r})
+print(time.perf_counter() - start)
+"""
+
+
+def legacy_substitute(value):
+    """Original eager substitution: recompiles the pattern and rebuilds the whole tree."""
+    if isinstance(value, str):
+        def replace_env_var(match):
+            env_var = match.group(1)
+            if ':' in env_var:
+                var_name, default_val = env_var.split(':', 1)
+                return os.getenv(var_name, default_val)
+            env_value = os.getenv(env_var)
+            return env_value or f"${{{env_var}}}"
+        return re.sub(r'\$\{([^}]+)\}', replace_env_var, value)
+    elif isinstance(value, dict):
+        return {k: legacy_substitute(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [legacy_substitute(item) for item in value]
+    return value
+
+
+def bench_interpolation(config_dir, name, repeat, reads=10):
+    """Per-load interpolation cost on an already-parsed tree."""
+    raw = config_manager.yaml.safe_load((Path(config_dir) / f"{name}.yaml").read_bytes())
+    plan_bytes = pickle.dumps(config_manager._compile_plan(raw), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def eager():
+        legacy_substitute(raw)
+
+    def compile_plan():
+        config_manager._compile_plan(raw)
+
+    def lazy_reads():
+        devices = pickle.loads(plan_bytes)["devices"]
+        for i in range(reads):
+            devices[f"device_{i}"]["deviceName"]
+
+    results = {}
+    for label, fn in (("eager substitution of every leaf", eager),
+                      ("compile plan (once per YAML change)", compile_plan),
+                      (f"snapshot plan + resolve {reads} devices", lazy_reads)):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        results[label] = min(timings)
+    return results
+
+
+def write_device_matrix(config_dir, devices):
+    """Synthetic large config: per-device capabilities with ${VAR:default} references."""
+    lines = ["devices:"]
+    for i in range(devices):
+        lines += [
+            f"  device_{i}:",
+            f"    platformName: {'Android' if i % 2 else 'iOS'}",
+            f"    deviceName: ${{DEVICE_{i % 10}_NAME:emulator-{5554 + i}}}",
+            f"    platformVersion: '{11 + i % 4}.0'",
+            "    appium_url: ${APPIUM_URL:http://127.0.0.1:4723}",
+            "    timeouts: {implicit: 10, new_command: 120}",
+            f"    tags: [smoke, regression, shard_{i % 8}]",
+        ]
+    path = Path(config_dir) / "device_matrix.yaml"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def best_load(config_dir, name, use_snapshots, repeat):
+    timings = []
+    for _ in range(repeat):
+        manager = ConfigManager(config_dir, use_snapshots=use_snapshots)
+        start = time.perf_counter()
+        manager.load_config(name)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def best_subprocess(config_dir, name, snap_dir, use_snapshots, repeat):
+    code = CHILD.format(lib=os.path.abspath(LIB_DIR), snap=str(snap_dir), cfg=str(config_dir),
+                        snap_on=use_snapshots, name=name)
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             check=True).stdout.strip().splitlines()[-1])
+        for _ in range(repeat)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--devices", type=int, default=500, help="devices in the synthetic matrix")
+    parser.add_argument("--repeat", type=int, default=20, help="best-of-N repetitions")
+    parser.add_argument("--subprocess", action="store_true", help="also time loads in fresh interpreters")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # missing .env files are expected here
+
+    with tempfile.TemporaryDirectory() as snap_dir, tempfile.TemporaryDirectory() as matrix_dir:
+        config_manager.SNAPSHOT_DIR = Path(snap_dir)
+        write_device_matrix(matrix_dir, args.devices)
+        cases = [("dev.yaml", FRAMEWORK_DIR, "dev"),
+                 (f"device_matrix.yaml ({args.devices} devices)", matrix_dir, "device_matrix")]
+
+        print(f"First load_config per fresh ConfigManager (best of {args.repeat})")
+        print("-" * 72)
+        for label, config_dir, name in cases:
+            cold = best_load(config_dir, name, False, args.repeat)
+            ConfigManager(config_dir).load_config(name)  # prime the snapshot
+            warm = best_load(config_dir, name, True, args.repeat)
+            print(f"  {label:<34} cold {cold * 1000:8.3f} ms   snapshot {warm * 1000:7.3f} ms   "
+                  f"x{cold / warm:6.1f}")
+            if args.subprocess:
+                cold = best_subprocess(config_dir, name, snap_dir, False, min(args.repeat, 5))
+                warm = best_subprocess(config_dir, name, snap_dir, True, min(args.repeat, 5))
+                print(f"  {'  └ fresh interpreter':<34} cold {cold * 1000:8.3f} ms   snapshot "
+                      f"{warm * 1000:7.3f} ms   x{cold / warm:6.1f}")
+
+        print(f"\nInterpolation on device_matrix.yaml ({args.devices} devices, best of {args.repeat})")
+        print("-" * 72)
+        results = bench_interpolation(matrix_dir, "device_matrix", args.repeat)
+        baseline = next(iter(results.values()))
+        for label, elapsed in results.items():
+            print(f"  {label:<42} {elapsed * 1000:8.3f} ms   x{baseline / elapsed:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
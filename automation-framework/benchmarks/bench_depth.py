@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+bench_depth.py
+──────────────
+Time DepthBook invariant checks and cumulative depth on large synthetic books.
+
+Compares the NumPy path against the array('d') fallback and naive per-level
+Python loops (what Robot FOR loops would do, minus keyword overhead). The
+"checks only" rows exclude the one-off list → array conversion.
+
+Usage:
+    uv run python benchmarks/bench_depth.py [--levels 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "libraries", "api"))
+
+import depth_book  # noqa: E402
+from depth_book import DepthBook  # noqa: E402
+
+BANDS = (0.1, 0.5, 1.0, 2.0)
+
+
+def make_depth(levels, seed=42):
+    """Synthetic btc_idr book; amounts as strings like the live API."""
+    rng = random.Random(seed)
+    mid = 650_000_000
+    buy = [[mid - 1000 * (i + 1), f"{rng.uniform(0.001, 2):.8f}"] for i in range(levels)]
+    sell = [[mid + 1000 * (i + 1), f"{rng.uniform(0.001, 2):.8f}"] for i in range(levels)]
+    return {"buy": buy, "sell": sell}
+
+
+def naive_check(depth):
+    """Per-level loops over the raw lists: invariants, then one pass per band."""
+    buy, sell = depth["buy"], depth["sell"]
+    for side, descending in ((buy, True), (sell, False)):
+        prev = None
+        for price, amount in side:
+            price, amount = float(price), float(amount)
+            assert price > 0 and amount > 0
+            if prev is not None:
+                assert price < prev if descending else price > prev
+            prev = price
+    best_bid, best_ask = float(buy[0][0]), float(sell[0][0])
+    assert best_bid < best_ask
+    mid = (best_bid + best_ask) / 2
+    report = []
+    for band in BANDS:
+        bid_amount = sum(float(a) for p, a in buy if float(p) >= mid * (1 - band / 100))
+        ask_amount = sum(float(a) for p, a in sell if float(p) <= mid * (1 + band / 100))
+        report.append((band, bid_amount, ask_amount))
+    return report
+
+
+def timed(fn, depth):
+    start = time.perf_counter()
+    fn(depth)
+    return time.perf_counter() - start
+
+
+def run_depth_book(depth):
+    book = DepthBook(depth)
+    book.validate(max_spread_pct=5)
+    book.cumulative_depth(BANDS)
+
+
+def run_checks_only(book):
+    book.validate(max_spread_pct=5)
+    book.cumulative_depth(BANDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--levels", type=int, default=10000, help="price levels per side")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of-N repetitions")
+    args = parser.parse_args()
+
+    depth = make_depth(args.levels)
+    results = {"naive per-level loop": min(timed(naive_check, depth) for _ in range(args.repeat))}
+
+    numpy = depth_book.np
+    for label, backend in (("numpy", numpy), ("array('d')", None)):
+        if label == "numpy" and numpy is None:
+            continue
+        depth_book.np = backend
+        results[f"DepthBook ({label})"] = min(timed(run_depth_book, depth) for _ in range(args.repeat))
+        book = DepthBook(depth)
+        results[f"  checks only ({label})"] = min(timed(run_checks_only, book) for _ in range(args.repeat))
+    depth_book.np = numpy
+
+    baseline = results["naive per-level loop"]
+    print(f"Depth book with {args.levels} levels/side (best of {args.repeat})")
+    print("-" * 60)
+    for name, elapsed in results.items():
+        print(f"  {name:<28} {elapsed * 1000:8.2f} ms  x{baseline / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
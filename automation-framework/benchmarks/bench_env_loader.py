@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+bench_env_loader.py
+───────────────────
+Time the mobile suite-setup env loading: Get File + one Get Regexp Matches per
+variable (the original Load Mobile Environment Variables body) versus one
+Set Suite Variables From Env File call.
+
+Both variants run as real Robot Framework keywords inside a generated suite;
+per-setup time is (run with N iterations - run with 0 iterations) / N.
+
+Usage:
+    uv run python benchmarks/bench_env_loader.py [--iterations 200]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from robot import run
+
+CONFIG_MANAGER = (Path(__file__).parent.parent / "libraries" / "base" / "config_manager.py").resolve()
+
+ENV_TEXT = """\
+# Mobile env used by bench_env_loader.py
+APPIUM_SERVER=http://127.0.0.1:4723
+ANDROID_DEVICE_NAME=emulator-5554
+ANDROID_PLATFORM_VERSION=14
+ANDROID_APP_PACKAGE=id.co.bitcoin
+ANDROID_APP_ACTIVITY=id.co.bitcoin.MainActivity
+ANDROID_AUTOMATION_NAME=UiAutomator2
+NO_RESET=True
+AUTO_GRANT_PERMISSIONS=True
+RESET_KEYBOARD=True
+DISABLE_WINDOW_ANIMATION=True
+"""
+
+SUITE = r"""
+*** Settings ***
+Library    Collections
+Library    OperatingSystem
+Library    String
+Library    {config_manager}    AS    ConfigManager
+
+*** Variables ***
+${{ITERATIONS}}    0
+${{VARIANT}}       legacy
+
+*** Test Cases ***
+Suite Setup Env Loading
+    FOR    ${{i}}    IN RANGE    ${{ITERATIONS}}
+        Run Keyword    Load Env ${{VARIANT}}
+    END
+
+*** Keywords ***
+Load Env Legacy
+    ${{appium_content}}=    Get File    {env_file}
+    ${{m}}=    Get Regexp Matches    ${{appium_content}}    APPIUM_SERVER=([^\n]+)    1
+    Set Suite Variable    ${{APPIUM_SERVER}}    ${{m}}[0]
+    ${{m}}=    Get Regexp Matches    ${{appium_content}}    ANDROID_DEVICE_NAME=([^\n]+)    1
+    Set Suite Variable    ${{ANDROID_DEVICE_NAME}}    ${{m}}[0]
+    ${{m}}=    Get Regexp Matches    ${{appium_content}}    ANDROID_PLATFORM_VERSION=([^\n]+)    1
+    Set Suite Variable    ${{ANDROID_PLATFORM_VERSION}}    ${{m}}[0]
+    ${{m}}=    Get Regexp Matches    ${{appium_content}}    ANDROID_APP_PACKAGE=([^\n]+)    1
+    Set Suite Variable    ${{ANDROID_APP_PACKAGE}}    ${{m}}[0]
+    ${{m}}=    Get Regexp Matches    ${{appium_content}}    ANDROID_APP_ACTIVITY=([^\n]+)    1
+    Set Suite Variable    ${{ANDROID_APP_ACTIVITY}}    ${{m}}[0]
+    ${{m}}=    Get Regexp Matches    ${{appium_content}}    ANDROID_AUTOMATION_NAME=([^\n]+)    1
+    Set Suite Variable    ${{ANDROID_AUTOMATION_NAME}}    ${{m}}[0]
+    FOR    ${{name}}    IN    AUTO_GRANT_PERMISSIONS    RESET_KEYBOARD    NO_RESET    DISABLE_WINDOW_ANIMATION
+        ${{m}}=    Get Regexp Matches    ${{appium_content}}    ${{name}}=([^\n]+)    1
+        ${{s}}=    Set Variable If    ${{m}}    ${{m}}[0]    false
+        ${{b}}=    Set Variable If    '${{s.lower()}}' == 'true'    ${{TRUE}}    ${{FALSE}}
+        Set Suite Variable    ${{${{name}}}}    ${{b}}
+    END
+
+Load Env Single Pass
+    Set Suite Variables From Env File    {env_file}
+    ...    APPIUM_SERVER    ANDROID_DEVICE_NAME    ANDROID_PLATFORM_VERSION
+    ...    ANDROID_APP_PACKAGE    ANDROID_APP_ACTIVITY    ANDROID_AUTOMATION_NAME
+    ...    AUTO_GRANT_PERMISSIONS:bool=false    RESET_KEYBOARD:bool=false
+    ...    NO_RESET:bool=false    DISABLE_WINDOW_ANIMATION:bool=false
+    Should Be Equal    ${{NO_RESET}}    ${{TRUE}}
+"""
+
+
+def timed_run(suite, variant, iterations):
+    start = time.perf_counter()
+    rc = run(suite, variable=[f"ITERATIONS:{iterations}", f"VARIANT:{variant}"],
+             output="NONE", log="NONE", report="NONE", stdout=open(os.devnull, "w"))
+    elapsed = time.perf_counter() - start
+    if rc:
+        raise SystemExit(f"{variant} run failed (rc={rc})")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--iterations", type=int, default=200, help="setups per variant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = Path(tmp) / ".env.mobile.bench"
+        env_file.write_text(ENV_TEXT, encoding="utf-8")
+        suite = Path(tmp) / "env_loading.robot"
+        suite.write_text(SUITE.format(config_manager=CONFIG_MANAGER, env_file=env_file), encoding="utf-8")
+
+        results = {}
+        for variant in ("Legacy", "Single Pass"):
+            base = timed_run(str(suite), variant, 0)
+            total = timed_run(str(suite), variant, args.iterations)
+            results[variant] = (total - base) / args.iterations
+
+    baseline = results["Legacy"]
+    print(f"Mobile env loading per suite setup ({args.iterations} setups, 10 variables)")
+    print("-" * 60)
+    for variant, per_setup in results.items():
+        print(f"  {variant:<14} {per_setup * 1000:8.3f} ms / setup   x{baseline / per_setup:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+bench_schema.py
+───────────────
+Compare per-call schema file loading + jsonschema.validate against SchemaRegistry.
+
+The legacy path mirrors JSONLibrary's "Validate Json By Schema File": read and
+parse the schema file, then jsonschema.validate (which re-checks the schema
+and builds a new validator) on every call.
+
+Usage:
+    uv run python benchmarks/bench_schema.py [--levels 200] [--calls 100] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "libraries", "api"))
+
+import jsonschema  # noqa: E402
+
+import schema_registry  # noqa: E402
+from schema_registry import SchemaRegistry  # noqa: E402
+
+DEPTH_SCHEMA = os.path.join(schema_registry.DEFAULT_SCHEMA_DIR, "depth_schema.json")
+
+
+def make_depth(levels, seed=42):
+    """Synthetic btc_idr order book with `levels` price levels per side."""
+    rng = random.Random(seed)
+    mid = 650_000_000
+    buy = [[mid - 1000 * (i + 1), round(rng.uniform(0.001, 2), 8)] for i in range(levels)]
+    sell = [[mid + 1000 * (i + 1), round(rng.uniform(0.001, 2), 8)] for i in range(levels)]
+    return {"buy": buy, "sell": sell}
+
+
+def bench_legacy(payload, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        with open(DEPTH_SCHEMA, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        jsonschema.validate(payload, schema)
+    return time.perf_counter() - start
+
+
+def bench_registry(payload, calls, codegen):
+    registry = SchemaRegistry(codegen=codegen)
+    start = time.perf_counter()
+    for _ in range(calls):
+        registry.validate(payload, "depth")
+    return time.perf_counter() - start
+
+
+def check_equivalence(payload):
+    """Registry must accept what jsonschema accepts and reject what it rejects."""
+    for codegen in (False, True):
+        registry = SchemaRegistry(codegen=codegen)
+        registry.validate(payload, "depth")
+        broken = {"buy": payload["buy"][:3] + [["x", 1]], "sell": payload["sell"]}
+        try:
+            registry.validate(broken, "depth")
+        except AssertionError as e:
+            assert "buy/3/0" in str(e), e
+        else:
+            raise AssertionError("invalid payload accepted")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--levels", type=int, default=200, help="price levels per side")
+    parser.add_argument("--calls", type=int, default=100, help="validations per run")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of-N repetitions")
+    args = parser.parse_args()
+
+    payload = make_depth(args.levels)
+    check_equivalence(payload)
+
+    runs = [("per-call load + validate", lambda: bench_legacy(payload, args.calls)),
+            ("registry (jsonschema)", lambda: bench_registry(payload, args.calls, False))]
+    if schema_registry.fastjsonschema is not None:
+        runs.append(("registry (codegen)", lambda: bench_registry(payload, args.calls, True)))
+    else:
+        print("fastjsonschema not installed — skipping codegen run")
+
+    results = {name: min(fn() for _ in range(args.repeat)) for name, fn in runs}
+
+    baseline = results["per-call load + validate"]
+    print(f"Validating depth ({args.levels} levels/side) x{args.calls} (best of {args.repeat})")
+    print("-" * 66)
+    for name, elapsed in results.items():
+        per_call_us = elapsed / args.calls * 1e6
+        print(f"  {name:<26} {elapsed * 1000:8.2f} ms  {per_call_us:8.1f} µs/call  "
+              f"x{baseline / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
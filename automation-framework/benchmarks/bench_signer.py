@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+bench_signer.py
+───────────────
+Compare the legacy per-call Indodax signing path against IndodaxSigner.sign_many.
+
+The legacy path is reproduced verbatim from the original create_request_body:
+a fresh hmac.new(secret.encode(), ...) plus urllib.parse.urlencode per request.
+
+Usage:
+    uv run python benchmarks/bench_signer.py [--requests 1000] [--repeat 5]
+"""
+
+import argparse
+import hashlib
+import hmac
+import os
+import sys
+import time
+import urllib.parse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "libraries", "api"))
+
+from indodax_signer import IndodaxSigner  # noqa: E402
+
+API_KEY = "bench_key_" + "k" * 30
+API_SECRET = "bench_secret_" + "s" * 67
+
+WORKLOAD = [
+    ("getInfo", None),
+    ("getBalance", None),
+    ("openOrders", {"pair": "btc_idr"}),
+    ("tradeHistory", {"pair": "eth_idr", "count": 100}),
+    ("trade", {"pair": "btc_idr", "type": "buy", "price": 650000000, "idr": 50000}),
+    ("cancelOrder", {"pair": "btc_idr", "order_id": 123456789, "type": "buy"}),
+]
+
+
+def legacy_sign(api_key, api_secret, method, params, nonce):
+    """Original per-call signing path (pre sign_many)."""
+    body_params = {"method": method, "nonce": nonce}
+    if params:
+        body_params.update(params)
+    request_body = urllib.parse.urlencode(body_params)
+    sign = hmac.new(
+        api_secret.encode("utf-8"),
+        request_body.encode("utf-8"),
+        hashlib.sha512,
+    ).hexdigest()
+    headers = {
+        "Key": api_key,
+        "Sign": sign,
+        "Content-Type": "application/x-www-form-urlencoded",
+    }
+    return request_body, headers
+
+
+def bench_legacy(batch):
+    nonce = int(time.time() * 1000)
+    start = time.perf_counter()
+    for i, (method, params) in enumerate(batch):
+        legacy_sign(API_KEY, API_SECRET, method, params, nonce + i)
+    return time.perf_counter() - start
+
+
+def bench_per_call(batch):
+    signer = IndodaxSigner(API_KEY, API_SECRET)
+    start = time.perf_counter()
+    for method, params in batch:
+        signer.create_request_body(method, params)
+    return time.perf_counter() - start
+
+
+def bench_sign_many(batch):
+    signer = IndodaxSigner(API_KEY, API_SECRET)
+    start = time.perf_counter()
+    signer.sign_many(batch)
+    return time.perf_counter() - start
+
+
+def check_equivalence():
+    """Batch output must verify and match the legacy encoding byte-for-byte."""
+    signer = IndodaxSigner(API_KEY, API_SECRET)
+    signed = signer.sign_many(WORKLOAD)
+    for (method, params), (body, headers) in zip(WORKLOAD, signed):
+        nonce = int(urllib.parse.parse_qs(body)["nonce"][0])
+        legacy_body, legacy_headers = legacy_sign(API_KEY, API_SECRET, method, params, nonce)
+        assert body == legacy_body, (body, legacy_body)
+        assert headers == legacy_headers
+        assert signer.verify_signature(body, headers["Sign"])
+    nonces = [int(urllib.parse.parse_qs(b)["nonce"][0]) for b, _ in signed]
+    assert nonces == sorted(set(nonces)), "nonces must be strictly increasing"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--requests", type=int, default=1000, help="requests per batch")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of-N repetitions")
+    args = parser.parse_args()
+
+    check_equivalence()
+    batch = [WORKLOAD[i % len(WORKLOAD)] for i in range(args.requests)]
+
+    results = {}
+    for name, fn in (("legacy per-call", bench_legacy),
+                     ("create_request_body", bench_per_call),
+                     ("sign_many", bench_sign_many)):
+        results[name] = min(fn(batch) for _ in range(args.repeat))
+
+    baseline = results["legacy per-call"]
+    print(f"Signing {args.requests} requests (best of {args.repeat})")
+    print("-" * 58)
+    for name, elapsed in results.items():
+        per_req_us = elapsed / args.requests * 1e6
+        print(f"  {name:<22} {elapsed * 1000:8.2f} ms  {per_req_us:6.2f} µs/req  "
+              f"x{baseline / elapsed:4.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+bench_tracer.py
+───────────────
+Time the per-action logging/tracing overhead of BasePage on a no-op action.
+
+Compares the old setup (logger forced to DEBUG with a StreamHandler and an
+f-string INFO message per action) against lazy %-style messages with the
+ActionTracer recording every call's duration, with and without DEBUG trace
+lines. Playwright is not involved: only the overhead around the call is timed.
+
+Usage:
+    uv run python benchmarks/bench_tracer.py [--calls 200000] [--repeat 5]
+"""
+
+import argparse
+import io
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from libraries.web.action_tracer import ActionTracer, traced  # noqa: E402
+
+SELECTORS = ["#buy_orders tbody tr:first-child td:first-child", "strong.price_usdtidr_val[data-sort]", "css=h1"]
+
+
+def make_logger(name, level, handler=True):
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    if handler:
+        stream = logging.StreamHandler(io.StringIO())
+        stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        logger.addHandler(stream)
+    logger.setLevel(level)
+    return logger
+
+
+class LegacyPage:
+    def __init__(self):
+        self.logger = make_logger("bench.legacy", logging.DEBUG)
+
+    def click(self, selector):
+        self.logger.info(f"Clicking: {selector}")
+
+
+class TracedPage:
+    def __init__(self, level, sample_rate=1.0):
+        self.logger = make_logger(f"bench.traced.{level}.{sample_rate}", level)
+        self.tracer = ActionTracer(sample_rate=sample_rate)
+
+    @traced("click")
+    def click(self, selector):
+        self.logger.info("Clicking: %s", selector)
+
+
+class BarePage:
+    def click(self, selector):
+        pass
+
+
+def best_of(page, calls, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(calls):
+            page.click(SELECTORS[i % 3])
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[3])
+    parser.add_argument("--calls", type=int, default=200000, help="actions per run")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of-N repetitions")
+    args = parser.parse_args()
+
+    variants = [
+        ("No logging, no tracing (floor)", BarePage()),
+        ("f-string INFO, logger forced to DEBUG (original)", LegacyPage()),
+        ("Lazy INFO + tracer, logger at WARNING", TracedPage(logging.WARNING)),
+        ("Lazy INFO + tracer, logger at DEBUG, traces 1%", TracedPage(logging.DEBUG, 0.01)),
+    ]
+    baseline = None
+    print(f"{'Variant':<52} {'per action':>12} {'vs original':>12}")
+    for name, page in variants:
+        per_call = best_of(page, args.calls, args.repeat)
+        if isinstance(page, LegacyPage):
+            baseline = per_call
+        ratio = f"x{baseline / per_call:.1f}" if baseline else ""
+        print(f"{name:<52} {per_call:>9.2f} µs {ratio:>12}")
+
+    tracer = variants[2][1].tracer
+    print()
+    for line in tracer.format_summary():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
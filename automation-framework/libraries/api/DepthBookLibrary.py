@@ -0,0 +1,86 @@
+"""
+Robot Framework library for semantic order-book (depth) validation.
+
+Wraps depth_book.DepthBook so a whole /api/depth response — thousands of
+levels — is checked in one keyword call instead of Robot-level loops.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from depth_book import DepthBook
+
+
+class DepthBookLibrary:
+    """Robot Framework library for vectorised depth invariants."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+
+    @staticmethod
+    def _parse_bands(bands):
+        if isinstance(bands, str):
+            return [float(b) for b in bands.split(',') if b.strip()]
+        return [float(b) for b in bands]
+
+    @keyword('Validate Depth Book')
+    def validate_depth_book(self, depth, max_spread_pct=None, allow_empty=False):
+        """
+        Validate order-book invariants of a depth response body.
+
+        Checks positive prices/amounts, bids strictly descending, asks strictly
+        ascending, no crossed book and (optionally) a bounded spread.
+
+        Args:
+            depth: Parsed depth JSON with 'buy' and 'sell'
+            max_spread_pct: Maximum spread in percent of mid (default: unchecked)
+            allow_empty: Accept an empty buy or sell side (default: False)
+
+        Returns:
+            The DepthBook, for Get Cumulative Depth without converting again
+
+        Raises:
+            AssertionError: Listing every violated invariant
+
+        Example:
+            ${book}=    Validate Depth Book    ${RESPONSE_BODY}    max_spread_pct=5
+        """
+        book = DepthBook(depth)
+        book.validate(max_spread_pct, str(allow_empty).lower() == 'true')
+        spread = book.spread_pct
+        self.builtin.log(
+            '✓ Depth book valid: {} bids, {} asks, spread {}'.format(
+                len(book.bid_prices), len(book.ask_prices),
+                '{:.4f}%'.format(spread) if spread is not None else 'n/a'),
+            'INFO'
+        )
+        return book
+
+    @keyword('Get Cumulative Depth')
+    def get_cumulative_depth(self, depth, bands='0.1,0.5,1,2'):
+        """
+        Get cumulative liquidity within ±band percent of the mid price.
+
+        Args:
+            depth: Parsed depth JSON with 'buy' and 'sell', or the book
+                   returned by Validate Depth Book (not converted again)
+            bands: Comma-separated percents or a list (default: 0.1,0.5,1,2)
+
+        Returns:
+            List of dicts: band_pct, bid_levels, bid_amount, bid_value,
+            ask_levels, ask_amount, ask_value
+
+        Example:
+            ${book}=    Validate Depth Book    ${RESPONSE_BODY}
+            ${bands}=    Get Cumulative Depth    ${book}    0.5,1
+        """
+        book = depth if isinstance(depth, DepthBook) else DepthBook(depth)
+        report = book.cumulative_depth(self._parse_bands(bands))
+        for row in report:
+            self.builtin.log(
+                'Depth ±{band_pct}%: bids {bid_levels} lvls / {bid_amount:.8f}, '
+                'asks {ask_levels} lvls / {ask_amount:.8f}'.format(**row),
+                'INFO'
+            )
+        return report
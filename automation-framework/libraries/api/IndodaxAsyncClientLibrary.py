@@ -0,0 +1,167 @@
+"""
+Robot Framework library for concurrent Indodax Private API calls.
+
+Reuses the signer created by IndodaxSignerLibrary ('Create Indodax Signer')
+and runs batches of signed calls over pooled keep-alive connections. Sends
+are serialised so nonces reach the server in order (see indodax_async_client).
+"""
+
+import asyncio
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from indodax_async_client import IndodaxAsyncClient
+
+
+class IndodaxAsyncClientLibrary:
+    """Robot Framework library for concurrent Indodax private API calls."""
+
+    ROBOT_LIBRARY_SCOPE = 'SUITE'
+
+    def __init__(self):
+        self.client = None
+        self.builtin = BuiltIn()
+        # One loop per library instance so pooled connections survive across keywords
+        self._loop = None
+
+    def _run(self, coroutine):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    def _get_signer(self):
+        signer_library = self.builtin.get_library_instance('IndodaxSignerLibrary')
+        if not signer_library.signer:
+            raise Exception('Signer not initialized. Call "Create Indodax Signer" first.')
+        return signer_library.signer
+
+    def _rate_limit_hook(self):
+        """
+        Return RateLimiterLibrary's shared buckets as a token hook if that library is imported.
+
+        The hook runs on executor threads, so it calls the limiter directly
+        instead of the keyword (Robot logging only works on the main thread).
+        """
+        try:
+            rate_limiter = self.builtin.get_library_instance('RateLimiterLibrary')
+        except RuntimeError:
+            return None
+        return lambda endpoint: (
+            rate_limiter.limiter.acquire(endpoint) if rate_limiter.limiter else 0.0)
+
+    @keyword('Create Indodax Async Client')
+    def create_client(self, base_url, max_concurrency=4, timeout=10, verify_ssl=True,
+                      rate_limit_endpoint='tapi'):
+        """
+        Create the concurrent private API client.
+
+        Every request first takes a token for rate_limit_endpoint from
+        RateLimiterLibrary when that library is imported.
+
+        Args:
+            base_url: Private API URL (e.g. ${API_BASE_URL})
+            max_concurrency: Maximum in-flight requests / pooled connections
+            timeout: Per-request timeout in seconds
+            verify_ssl: Verify TLS certificates
+            rate_limit_endpoint: Token bucket used for the private API calls
+
+        Example:
+            Create Indodax Async Client    ${API_BASE_URL}    max_concurrency=4
+            ...    timeout=${API_TIMEOUT}
+        """
+        if self.client is not None:
+            self._run(self.client.aclose())
+
+        self.client = IndodaxAsyncClient(
+            self._get_signer(),
+            base_url,
+            max_concurrency=int(max_concurrency),
+            timeout=float(timeout),
+            verify_ssl=verify_ssl,
+            rate_limit=self._rate_limit_hook(),
+            rate_limit_endpoint=rate_limit_endpoint,
+        )
+        self.builtin.log(
+            'Created Indodax async client: {} (max_concurrency={})'.format(
+                base_url, max_concurrency),
+            'DEBUG'
+        )
+        return self.client
+
+    @keyword('Call Indodax Private Methods Concurrently')
+    def call_concurrently(self, calls):
+        """
+        Sign and send several private API calls concurrently.
+
+        Args:
+            calls: List of items, each either a bare method name, a
+                   [method, params] pair, or a dict with 'method' and
+                   optional 'params' keys
+
+        Returns:
+            List of result dictionaries (same order as calls) with keys
+            method, params, status_code, body, error, elapsed_ms, attempts;
+            error is set when the request failed or its nonce was still
+            rejected after the re-sign retries
+
+        Example:
+            ${calls}=      Create List    getInfo    getBalance    tradeHistory
+            ${results}=    Call Indodax Private Methods Concurrently    ${calls}
+            Should Be Equal As Integers    ${results}[0][status_code]    200
+        """
+        if self.client is None:
+            raise Exception(
+                'Async client not initialized. Call "Create Indodax Async Client" first.')
+
+        batch = []
+        for item in calls:
+            if isinstance(item, str):
+                method, params = item, None
+            elif isinstance(item, dict):
+                method, params = item['method'], item.get('params')
+            else:
+                method, params = item[0], (item[1] if len(item) > 1 else None)
+            batch.append((method, dict(params) if isinstance(params, dict) else None))
+
+        self.builtin.log('Dispatching {} private API calls concurrently'.format(len(batch)), 'INFO')
+        results = self._run(self.client.call_many(batch))
+
+        for result in results:
+            self.builtin.log(
+                '{method} → {status_code} in {elapsed_ms:.0f}ms '
+                '(attempts={attempts})'.format(**result),
+                'DEBUG'
+            )
+            if result['error']:
+                self.builtin.log('{method} failed: {error}'.format(**result), 'WARN')
+        return results
+
+    @keyword('Call Indodax Private Method For Pairs')
+    def call_for_pairs(self, method, pairs, **params):
+        """
+        Call one private method for many pairs concurrently.
+
+        Args:
+            method: API method (e.g. 'openOrders', 'tradeHistory')
+            pairs: List of pair ids (e.g. btc_idr, eth_idr)
+            **params: Extra parameters added to every call
+
+        Returns:
+            List of result dictionaries in pair order
+
+        Example:
+            ${pairs}=      Create List    btc_idr    eth_idr    xrp_idr
+            ${results}=    Call Indodax Private Method For Pairs    openOrders    ${pairs}
+        """
+        calls = [{'method': method, 'params': dict(params, pair=pair)} for pair in pairs]
+        return self.call_concurrently(calls)
+
+    @keyword('Close Indodax Async Client')
+    def close_client(self):
+        """Close pooled connections and the library's event loop."""
+        if self.client is not None:
+            self._run(self.client.aclose())
+            self.client = None
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
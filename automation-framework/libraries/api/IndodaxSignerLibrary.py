@@ -7,6 +7,7 @@ Provides keywords to sign and verify Indodax API requests.
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
 from indodax_signer import IndodaxSigner
+from nonce_allocator import NonceAllocator
 import json
 
 
@@ -20,18 +21,32 @@ class IndodaxSignerLibrary:
         self.builtin = BuiltIn()
     
     @keyword('Create Indodax Signer')
-    def create_signer(self, api_key, api_secret):
+    def create_signer(self, api_key, api_secret, shared_nonce=False,
+                      nonce_block_size=1, nonce_file=None):
         """
         Create an Indodax signer instance.
         
         Args:
             api_key: Indodax API Key
             api_secret: Indodax API Secret
+            shared_nonce: Use a cross-process nonce allocator so pabot
+                          workers / Locust users sharing one key never
+                          collide (default: False — millisecond timestamp).
+                          Needs POSIX file locks; fails on Windows
+            nonce_block_size: Nonces leased per counter-file lock (default 1
+                              keeps nonces ordered across processes)
+            nonce_file: Optional counter file path (default: per-key temp file)
         
         Returns:
             Signer instance stored in self.signer
+            
+        Example:
+            Create Indodax Signer    ${API_KEY}    ${API_SECRET}    shared_nonce=${True}
         """
-        self.signer = IndodaxSigner(api_key, api_secret)
+        allocator = None
+        if shared_nonce:
+            allocator = NonceAllocator(api_key, nonce_file, int(nonce_block_size))
+        self.signer = IndodaxSigner(api_key, api_secret, nonce_allocator=allocator)
         self.builtin.log('Created Indodax signer with API key: {}...'.format(api_key[:10]), 'DEBUG')
         return self.signer
     
@@ -67,13 +82,55 @@ class IndodaxSignerLibrary:
             'headers': headers
         }
     
+    @keyword('Sign Indodax Requests')
+    def sign_requests(self, requests):
+        """
+        Sign a batch of Indodax requests in one call.
+        
+        Uses the signer's precomputed HMAC key state; nonces are strictly
+        increasing in list order, so send the requests in the returned order.
+        
+        Args:
+            requests: List of items, each either a [method, params] pair,
+                      a bare method name, or a dict with 'method' and
+                      optional 'params' keys
+        
+        Returns:
+            List of dictionaries with 'body' and 'headers' keys
+            
+        Example:
+            ${pair_params}=    Create Dictionary    pair=btc_idr
+            ${batch}=          Create List    getInfo    ${{['openOrders', $pair_params]}}
+            ${signed}=         Sign Indodax Requests    ${batch}
+            ${first_body}=     Set Variable    ${signed}[0][body]
+        """
+        if not self.signer:
+            raise Exception('Signer not initialized. Call "Create Indodax Signer" first.')
+        
+        batch = []
+        for item in requests:
+            if isinstance(item, str):
+                method, params = item, None
+            elif isinstance(item, dict):
+                method, params = item['method'], item.get('params')
+            else:
+                method, params = item[0], (item[1] if len(item) > 1 else None)
+            batch.append((method, params if isinstance(params, dict) else None))
+        
+        self.builtin.log('Signing batch of {} requests'.format(len(batch)), 'DEBUG')
+        
+        return [
+            {'body': body, 'headers': headers}
+            for body, headers in self.signer.sign_many(batch)
+        ]
+    
     @keyword('Get Indodax Nonce')
     def get_nonce(self):
         """
         Get a new nonce value.
         
         Returns:
-            Nonce (millisecond timestamp)
+            Nonce (millisecond timestamp, or shared allocator value)
         """
         if not self.signer:
             raise Exception('Signer not initialized. Call "Create Indodax Signer" first.')
@@ -82,6 +139,26 @@ class IndodaxSignerLibrary:
         self.builtin.log('Generated nonce: {}'.format(nonce), 'DEBUG')
         return nonce
     
+    @keyword('Get Indodax Nonce Allocator Stats')
+    def get_nonce_allocator_stats(self):
+        """
+        Get lease utilisation of the shared nonce allocator.
+        
+        Returns:
+            Dictionary with leases, reserved, issued, unused_in_lease,
+            utilisation and lock_wait_ms — or an empty dictionary when the
+            signer uses timestamp nonces
+        """
+        if not self.signer:
+            raise Exception('Signer not initialized. Call "Create Indodax Signer" first.')
+        
+        if self.signer.nonce_allocator is None:
+            return {}
+        
+        stats = self.signer.nonce_allocator.get_stats()
+        self.builtin.log('Nonce allocator stats: {}'.format(stats), 'INFO')
+        return stats
+    
     @keyword('Get Indodax Timestamp')
     def get_timestamp(self):
         """
@@ -0,0 +1,89 @@
+"""
+Robot Framework library for pacing API requests with shared token buckets.
+
+Rates come from the `rate_limits` section of config/environments/<env>.yaml
+and are enforced across all pabot workers on the machine.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from rate_limiter import SharedRateLimiter
+
+
+class RateLimiterLibrary:
+    """Robot Framework library for cross-process API rate limiting."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.limiter = None
+        self.builtin = BuiltIn()
+
+    @keyword('Configure Rate Limits')
+    def configure_rate_limits(self, env_config, namespace='indodax'):
+        """
+        Configure per-endpoint token buckets from the environment YAML.
+
+        A 'global' entry adds a bucket every endpoint also draws from
+        (Indodax's per-IP limit).
+
+        Args:
+            env_config: Environment config dict (from Get Environment Config)
+                        or the `rate_limits` mapping itself
+            namespace: State namespace; runs sharing a namespace share buckets
+
+        Example:
+            ${yaml_config}=    Get Environment Config    ${TEST_ENV}
+            Configure Rate Limits    ${yaml_config}
+        """
+        limits = env_config.get('rate_limits', env_config) if isinstance(env_config, dict) else {}
+        if self.limiter is not None:
+            self.limiter.close()
+        self.limiter = SharedRateLimiter(limits or {}, namespace=namespace)
+        self.builtin.log('Rate limits configured: {}'.format(limits or 'disabled'), 'INFO')
+
+    @keyword('Acquire Rate Limit Token')
+    def acquire_token(self, endpoint):
+        """
+        Block until a request to endpoint is allowed.
+
+        Takes a token from the endpoint's bucket and from the 'global'
+        one. No-op when rate limits are not configured or neither the
+        endpoint (nor 'default') nor 'global' has a limit.
+
+        Args:
+            endpoint: Endpoint group (e.g. 'ticker', 'depth', 'trades', 'tapi')
+
+        Returns:
+            Seconds waited for the token
+        """
+        if self.limiter is None:
+            return 0.0
+
+        waited = self.limiter.acquire(endpoint)
+        if waited > 0:
+            self.builtin.log('Rate limit: waited {:.0f}ms for {} token'.format(waited * 1000, endpoint), 'DEBUG')
+        return waited
+
+    @keyword('Get Rate Limit Stats')
+    def get_stats(self):
+        """
+        Get per-endpoint token statistics for this process.
+
+        Returns:
+            Dictionary {endpoint: {rate, burst, acquired, waited,
+            wait_ms_total, wait_ms_max}}, with the shared bucket under 'global'
+        """
+        if self.limiter is None:
+            return {}
+        return self.limiter.get_stats()
+
+    @keyword('Log Rate Limit Stats')
+    def log_stats(self):
+        """Log time spent waiting for tokens per endpoint."""
+        for endpoint, stats in self.get_stats().items():
+            self.builtin.log(
+                'Rate limit [{}]: {acquired} requests, {waited} waited, '
+                'total wait {wait_ms_total:.0f}ms, max wait {wait_ms_max:.0f}ms'.format(endpoint, **stats),
+                'INFO'
+            )
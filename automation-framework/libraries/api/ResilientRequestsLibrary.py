@@ -0,0 +1,132 @@
+"""
+Robot Framework library for retried and hedged HTTP requests.
+
+Applies the retry policy from config/environments/<env>.yaml (api.max_retries,
+api.retry_delay, api.retry_budget, api.hedge_endpoints) to idempotent public
+GETs. Returned objects are plain requests.Response instances, so existing
+status/JSON keywords work unchanged.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from retry_engine import RetryEngine
+
+
+class ResilientRequestsLibrary:
+    """Robot Framework library for retry/backoff and request hedging."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.engine = None
+        self.builtin = BuiltIn()
+
+    def _rate_limit_hooks(self):
+        """
+        Return (acquire, try_acquire) on RateLimiterLibrary's buckets if that library is imported.
+
+        Hedged attempts run on executor threads, so the hooks call the
+        limiter directly instead of the keyword (Robot logging only works
+        on the main thread).
+        """
+        try:
+            rate_limiter = self.builtin.get_library_instance('RateLimiterLibrary')
+        except RuntimeError:
+            return None, None
+        return (
+            lambda endpoint: rate_limiter.limiter.acquire(endpoint) if rate_limiter.limiter else 0.0,
+            lambda endpoint: rate_limiter.limiter.try_acquire(endpoint) if rate_limiter.limiter else True,
+        )
+
+    @keyword('Configure Retry Policy')
+    def configure_retry_policy(self, env_config):
+        """
+        Configure retries and hedging from the environment YAML.
+
+        Reads api.max_retries, api.retry_delay and the optional
+        api.retry_budget (default 0.2), api.retry_max_delay (default 30),
+        api.hedge_endpoints (default: none), api.hedge_percentile
+        (default 0.95) and api.hedge_default_delay (seconds before hedging
+        until the percentile has enough samples, default 1). Every attempt
+        first takes a token from RateLimiterLibrary when it is imported; a
+        hedge is only sent when a token is free without waiting.
+
+        Args:
+            env_config: Environment config dict (from Get Environment Config)
+
+        Example:
+            ${yaml_config}=    Get Environment Config    ${TEST_ENV}
+            Configure Retry Policy    ${yaml_config}
+        """
+        api_cfg = env_config.get('api', {}) if isinstance(env_config, dict) else {}
+        if self.engine is not None:
+            self.engine.close()
+
+        acquire, try_acquire = self._rate_limit_hooks()
+        self.engine = RetryEngine(
+            max_retries=api_cfg.get('max_retries', 0),
+            retry_delay=api_cfg.get('retry_delay', 1),
+            max_delay=api_cfg.get('retry_max_delay', 30),
+            retry_budget=api_cfg.get('retry_budget', 0.2),
+            hedge_endpoints=api_cfg.get('hedge_endpoints') or (),
+            hedge_percentile=api_cfg.get('hedge_percentile', 0.95),
+            hedge_default_delay=api_cfg.get('hedge_default_delay', 1.0),
+            before_attempt=acquire,
+            before_hedge=try_acquire,
+        )
+        self.builtin.log(
+            'Retry policy: retries={} delay={}s budget={} hedge={}'.format(
+                self.engine.max_retries, self.engine.retry_delay,
+                self.engine.retry_budget, sorted(self.engine.hedge_endpoints) or 'off'),
+            'INFO'
+        )
+
+    @keyword('Send Resilient GET')
+    def send_get(self, url, endpoint='default', timeout=None, **kwargs):
+        """
+        Send a GET request with retries, backoff and optional hedging.
+
+        Args:
+            url: Request URL
+            endpoint: Endpoint group (e.g. 'ticker', 'depth', 'trades')
+            timeout: Request timeout in seconds
+            **kwargs: Extra requests arguments (headers, params, ...)
+
+        Returns:
+            requests.Response — the successful response, or the last one
+            received when retries or the retry budget are exhausted
+
+        Example:
+            ${response}=    Send Resilient GET    ${url}    ticker    timeout=${API_TIMEOUT}
+        """
+        if self.engine is None:
+            acquire, try_acquire = self._rate_limit_hooks()
+            self.engine = RetryEngine(before_attempt=acquire, before_hedge=try_acquire)
+
+        if timeout is not None:
+            kwargs['timeout'] = float(timeout)
+        return self.engine.request('GET', url, endpoint, **kwargs)
+
+    @keyword('Get Retry Stats')
+    def get_stats(self):
+        """
+        Get per-endpoint retry and hedge counters.
+
+        Returns:
+            Dictionary {endpoint: {requests, retries, hedges, hedge_wins,
+            hedges_skipped, failures, budget_exhausted, p95_ms}}
+        """
+        if self.engine is None:
+            return {}
+        return self.engine.get_stats()
+
+    @keyword('Log Retry Stats')
+    def log_stats(self):
+        """Log retry and hedge counts per endpoint."""
+        for endpoint, stats in self.get_stats().items():
+            p95 = '{:.0f}ms'.format(stats['p95_ms']) if stats['p95_ms'] is not None else 'n/a'
+            self.builtin.log(
+                'Retry [{}]: {requests} requests, {retries} retries, {hedges} hedges '
+                '({hedge_wins} won, {hedges_skipped} skipped), {failures} failed, p95={p95}'.format(endpoint, p95=p95, **stats),
+                'INFO'
+            )
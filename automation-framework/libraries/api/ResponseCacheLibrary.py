@@ -0,0 +1,123 @@
+"""
+Robot Framework library for caching public market-data GETs within a suite.
+
+Configured from api.response_cache in config/environments/<env>.yaml. One
+cache exists per suite (library scope SUITE), so suites never see each
+other's data. Misses are fetched through ResilientRequestsLibrary, keeping
+retries, hedging and rate limiting. Tests tagged `no-cache` always hit the
+network (and refresh the cached entry).
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from response_cache import ResponseCache
+
+BYPASS_TAG = 'no-cache'
+
+
+class ResponseCacheLibrary:
+    """Robot Framework library for a per-suite TTL/LRU response cache."""
+
+    ROBOT_LIBRARY_SCOPE = 'SUITE'
+
+    def __init__(self):
+        self.cache = None
+        self.builtin = BuiltIn()
+
+    def _bypass(self):
+        tags = self.builtin.get_variable_value('@{TEST TAGS}') or []
+        return BYPASS_TAG in [str(tag).lower() for tag in tags]
+
+    @keyword('Configure Response Cache')
+    def configure_response_cache(self, env_config):
+        """
+        Enable the cache from the environment YAML.
+
+        Reads api.response_cache.{enabled, ttl, max_entries}. The cache
+        stays off unless enabled is true.
+
+        Args:
+            env_config: Environment config dict (from Get Environment Config)
+
+        Example:
+            ${yaml_config}=    Get Environment Config    ${TEST_ENV}
+            Configure Response Cache    ${yaml_config}
+        """
+        api_cfg = env_config.get('api', {}) if isinstance(env_config, dict) else {}
+        cache_cfg = api_cfg.get('response_cache') or {}
+        if not cache_cfg.get('enabled', False):
+            self.cache = None
+            self.builtin.log('Response cache: disabled', 'INFO')
+            return
+
+        self.cache = ResponseCache(
+            ttl=cache_cfg.get('ttl', 5),
+            max_entries=cache_cfg.get('max_entries', 256),
+        )
+        self.builtin.log(
+            'Response cache: ttl={}s max_entries={} (bypass tag: {})'.format(
+                self.cache.ttl, self.cache.max_entries, BYPASS_TAG),
+            'INFO'
+        )
+
+    @keyword('Send Cached GET')
+    def send_cached_get(self, url, endpoint='default', timeout=None, **kwargs):
+        """
+        Send a GET request, serving repeats within the TTL from the cache.
+
+        Args:
+            url: Request URL
+            endpoint: Endpoint group (e.g. 'ticker', 'depth', 'trades')
+            timeout: Request timeout in seconds
+            **kwargs: Extra requests arguments (headers, params, ...)
+
+        Returns:
+            requests.Response — cached or fresh
+
+        Example:
+            ${response}=    Send Cached GET    ${url}    ticker    timeout=${API_TIMEOUT}
+        """
+        resilient = self.builtin.get_library_instance('ResilientRequestsLibrary')
+        if self.cache is None:
+            return resilient.send_get(url, endpoint, timeout, **kwargs)
+
+        key = ResponseCache.make_key('GET', url, kwargs.get('params'))
+        if self._bypass():
+            self.cache.count_bypass(endpoint)
+        else:
+            response = self.cache.get(key, endpoint)
+            if response is not None:
+                self.builtin.log('Response cache hit: GET {}'.format(url), 'INFO')
+                return response
+
+        response = resilient.send_get(url, endpoint, timeout, **kwargs)
+        self.cache.put(key, response, endpoint)
+        return response
+
+    @keyword('Clear Response Cache')
+    def clear_response_cache(self):
+        """Drop every cached response for this suite."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    @keyword('Get Response Cache Stats')
+    def get_stats(self):
+        """
+        Get per-endpoint cache counters for this suite.
+
+        Returns:
+            Dictionary {endpoint: {hits, misses, expired, evictions, bypassed}}
+        """
+        if self.cache is None:
+            return {}
+        return self.cache.get_stats()
+
+    @keyword('Log Response Cache Stats')
+    def log_stats(self):
+        """Log cache hits and misses per endpoint."""
+        for endpoint, stats in self.get_stats().items():
+            self.builtin.log(
+                'Cache [{}]: {hits} hits, {misses} misses ({expired} expired), '
+                '{evictions} evictions, {bypassed} bypassed'.format(endpoint, **stats),
+                'INFO'
+            )
@@ -1,15 +1,59 @@
 """
 Response Validation Library for Robot Framework
 
-Provides keywords for validating HTTP response codes from RequestsLibrary.
+Provides keywords for validating HTTP responses from RequestsLibrary.
+
+Each response body is parsed at most once: the parsed JSON is cached per
+response object, so status checks, key checks and schema checks on the same
+response share one parse. orjson is used for parsing when installed.
 """
 
+import weakref
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
 
 class ResponseValidator:
     """Robot Framework library for validating HTTP responses."""
 
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
 
+    def __init__(self):
+        # Parsed bodies keyed by response object; entries vanish with the response
+        self._parsed = weakref.WeakKeyDictionary()
+
+    def _parse(self, response):
+        """Return the parsed JSON body of response, parsing it only once."""
+        try:
+            return self._parsed[response]
+        except KeyError:
+            pass
+
+        if orjson is not None:
+            body = orjson.loads(response.content)
+        else:
+            body = response.json()
+
+        self._parsed[response] = body
+        return body
+
+    def get_response_json(self, response):
+        """
+        Get the parsed JSON body of a response.
+
+        Args:
+            response: Response object from RequestsLibrary or parsed JSON dict/list
+
+        Returns:
+            Parsed JSON body (cached per response object)
+        """
+        if isinstance(response, (dict, list)):
+            return response
+        return self._parse(response)
+
     def verify_response_status_code(self, response, expected_status_code=200):
         """
         Verify HTTP response status code.
@@ -36,4 +80,50 @@ class ResponseValidator:
                 f"Expected status code {expected_status_code} but got {status_code}"
             )
         
-        return response.json()
+        return self._parse(response)
+
+    def verify_response_status_and_keys(self, response, *keys, expected_status_code=200):
+        """
+        Verify status code and that the JSON body contains every key.
+
+        Args:
+            response: Response object from RequestsLibrary or parsed JSON dict
+            *keys: Top-level keys that must be present
+            expected_status_code: Expected HTTP status code (default: 200), named only
+
+        Returns:
+            Response JSON body
+
+        Raises:
+            AssertionError: If the status differs or a key is missing
+        """
+        body = self.verify_response_status_code(response, expected_status_code)
+        missing = [key for key in keys if key not in body]
+        if missing:
+            raise AssertionError(f"Response is missing key(s): {', '.join(missing)}")
+        return body
+
+    def verify_response_status_keys_and_schema(self, response, schema_name, *keys,
+                                               expected_status_code=200):
+        """
+        Verify status code, key presence and JSON schema in one pass.
+
+        Args:
+            response: Response object from RequestsLibrary or parsed JSON dict
+            schema_name: Registered schema name (e.g. 'ticker', 'depth_schema.json')
+            *keys: Top-level keys that must be present
+            expected_status_code: Expected HTTP status code (default: 200), named only
+
+        Returns:
+            Response JSON body
+
+        Raises:
+            AssertionError: If the status differs, a key is missing or the
+                            body does not match the schema
+        """
+        from schema_registry import get_schema_registry
+
+        body = self.verify_response_status_and_keys(
+            response, *keys, expected_status_code=expected_status_code)
+        get_schema_registry().validate(body, schema_name)
+        return body
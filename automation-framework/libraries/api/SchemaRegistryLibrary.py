@@ -0,0 +1,57 @@
+"""
+Robot Framework library for validating JSON against precompiled schemas.
+
+Schemas under test_data/api/schemas/ are compiled once per process by the
+shared SchemaRegistry and reloaded only when a schema file changes.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from schema_registry import get_schema_registry
+
+
+class SchemaRegistryLibrary:
+    """Robot Framework library for cached JSON-schema validation."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+
+    @keyword('Validate Json With Schema')
+    def validate_json_with_schema(self, json_object, schema_name):
+        """
+        Validate a parsed JSON object against a registered schema.
+
+        Args:
+            json_object: Parsed JSON (dict/list)
+            schema_name: Schema name — 'ticker', 'ticker_schema' or 'ticker_schema.json'
+
+        Raises:
+            AssertionError: If the object does not match the schema
+
+        Example:
+            Validate Json With Schema    ${RESPONSE_BODY}    ticker
+        """
+        get_schema_registry().validate(json_object, schema_name)
+        self.builtin.log('✓ JSON matches schema: {}'.format(schema_name), 'DEBUG')
+
+    @keyword('Reload Json Schemas')
+    def reload_json_schemas(self):
+        """
+        Re-scan the schema directory and recompile every schema.
+
+        Returns:
+            List of registered schema names
+        """
+        return get_schema_registry().load_all()
+
+    @keyword('Get Schema Registry Stats')
+    def get_schema_registry_stats(self):
+        """
+        Get validation counts per schema.
+
+        Returns:
+            Dictionary {schema_file_stem: {validations, codegen}}
+        """
+        return get_schema_registry().get_stats()
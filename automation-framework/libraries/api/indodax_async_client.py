@@ -0,0 +1,186 @@
+"""
+Asyncio Indodax Private API client
+
+Runs batches of signed private API calls (getInfo, getBalance, openOrders,
+tradeHistory, ...) over one pooled keep-alive HTTP/1.1 connection, instead
+of one blocking POST per call with a fresh connection each.
+
+Nonce ordering:
+- Indodax rejects a nonce that is not greater than the last one it
+  processed for the key. Requests on separate connections can be
+  processed in any order once they leave the client, so TAPI sends are
+  serialised: a request is signed, sent and answered under one lock
+  before the next one is signed. Rate-limit waits of the queued calls
+  still overlap with the request in flight.
+- A response still rejected with an invalid-nonce error (e.g. another
+  client using the same key) is re-signed with a fresh nonce and retried
+  (bounded by nonce_retries); a call rejected after its last retry is
+  returned with error set.
+
+Rate limiting:
+- With a rate_limit hook (RateLimiterLibrary's shared buckets) every
+  attempt, including nonce retries, takes a token for rate_limit_endpoint
+  first. The hook blocks, so it runs in the loop's default executor.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from indodax_signer import IndodaxSigner
+
+
+class IndodaxAsyncClient:
+    """Concurrent, connection-pooled client for the Indodax TAPI endpoint."""
+
+    def __init__(
+        self,
+        signer: IndodaxSigner,
+        base_url: str,
+        max_concurrency: int = 4,
+        timeout: float = 10.0,
+        verify_ssl: bool = True,
+        nonce_retries: int = 2,
+        rate_limit: Optional[Callable[[str], float]] = None,
+        rate_limit_endpoint: str = 'tapi'
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            signer: IndodaxSigner holding the API credentials
+            base_url: Private API URL (e.g. https://indodax.com/tapi)
+            max_concurrency: Calls waiting for a rate-limit token at once
+                             (also the pool size; TAPI sends are serialised)
+            timeout: Per-request timeout in seconds
+            verify_ssl: Verify TLS certificates
+            nonce_retries: Re-sign attempts after an invalid-nonce rejection
+            rate_limit: Blocking token hook called with the endpoint before
+                        each attempt (e.g. SharedRateLimiter.acquire)
+            rate_limit_endpoint: Endpoint group passed to rate_limit
+        """
+        if int(max_concurrency) < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self.signer = signer
+        self.base_url = base_url
+        self.max_concurrency = int(max_concurrency)
+        self.timeout = float(timeout)
+        self.verify_ssl = verify_ssl
+        self.nonce_retries = int(nonce_retries)
+        self.rate_limit = rate_limit
+        self.rate_limit_endpoint = rate_limit_endpoint
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client on first use (bound to the running loop)."""
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            )
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=limits,
+            )
+        return self._client
+
+    @staticmethod
+    def _is_nonce_rejection(body: Any) -> bool:
+        """Return True when Indodax rejected the request because of its nonce."""
+        if not isinstance(body, dict) or body.get('success', 1) != 0:
+            return False
+        error_code = str(body.get('error_code', '')).lower()
+        error = str(body.get('error', '')).lower()
+        return 'nonce' in error_code or 'nonce' in error
+
+    async def _call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+        sign_lock: asyncio.Lock
+    ) -> Dict[str, Any]:
+        """Sign and send one private API call, re-signing on nonce rejection."""
+        client = await self._get_client()
+        loop = asyncio.get_running_loop()
+        attempts = 0
+
+        async with semaphore:
+            while True:
+                if self.rate_limit is not None:
+                    await loop.run_in_executor(None, self.rate_limit, self.rate_limit_endpoint)
+
+                # Hold the lock until the response is back: the server may process
+                # requests on different connections in any order, so no other
+                # nonce may be in flight while this one is
+                async with sign_lock:
+                    body, headers = self.signer.create_request_body(method, params)
+                    started = time.perf_counter()
+                    try:
+                        response = await client.post(self.base_url, content=body, headers=headers)
+                    except httpx.HTTPError as e:
+                        return {
+                            'method': method,
+                            'params': params or {},
+                            'status_code': None,
+                            'body': None,
+                            'error': f"{e.__class__.__name__}: {e}",
+                            'elapsed_ms': (time.perf_counter() - started) * 1000,
+                            'attempts': attempts + 1,
+                        }
+
+                try:
+                    parsed = response.json()
+                except ValueError:
+                    parsed = response.text
+
+                error = None
+                if self._is_nonce_rejection(parsed):
+                    if attempts < self.nonce_retries:
+                        attempts += 1
+                        continue
+                    error = "Nonce still rejected after {} attempts: {}".format(
+                        attempts + 1, parsed.get('error'))
+
+                return {
+                    'method': method,
+                    'params': params or {},
+                    'status_code': response.status_code,
+                    'body': parsed,
+                    'error': error,
+                    'elapsed_ms': (time.perf_counter() - started) * 1000,
+                    'attempts': attempts + 1,
+                }
+
+    async def call_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run private API calls as one batch (sends serialised, see module docstring).
+
+        Args:
+            calls: Sequence of (method, params) tuples; params may be None
+
+        Returns:
+            List of result dictionaries in input order, each with method,
+            params, status_code, body, error, elapsed_ms and attempts;
+            error is set for transport failures and for calls whose nonce
+            was still rejected after nonce_retries re-signs
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        sign_lock = asyncio.Lock()
+        return await asyncio.gather(*(
+            self._call(method, params, semaphore, sign_lock)
+            for method, params in calls
+        ))
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -13,36 +13,118 @@ Reference:
 import hashlib
 import hmac
 import json
+import threading
 import time
 import urllib.parse
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 
 class IndodaxSigner:
     """HMAC-SHA512 signer for Indodax Private API requests."""
 
-    def __init__(self, api_key: str, api_secret: str):
+    CONTENT_TYPE = 'application/x-www-form-urlencoded'
+    QUOTE_CACHE_SIZE = 1024
+
+    def __init__(self, api_key: str, api_secret: str, nonce_allocator=None):
         """
         Initialize signer with API credentials.
         
         Args:
             api_key: Indodax API Key
             api_secret: Indodax API Secret
+            nonce_allocator: Optional NonceAllocator shared with other
+                             threads/processes using the same API key.
+                             If None, millisecond timestamps are used,
+                             bumped when needed to stay increasing.
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self.nonce_allocator = nonce_allocator
+        # Encoded keys/values repeat across requests ('method', 'pair', 'btc_idr', ...)
+        self._quoted_keys: Dict[str, str] = {}
+        self._quoted_values: Dict[str, str] = {}
+        self._nonce_lock = threading.Lock()
+        self._last_nonce = 0
+
+    @property
+    def api_secret(self) -> str:
+        """API secret used as the HMAC key."""
+        return self._api_secret
+
+    @api_secret.setter
+    def api_secret(self, value: str) -> None:
+        # Key the HMAC once per secret; each signature copies this prototype
+        # instead of re-encoding the secret and re-deriving the key pads.
+        self._api_secret = value
+        self._hmac_prototype = hmac.new(value.encode('utf-8'), digestmod=hashlib.sha512)
+
+    def _sign(self, message: bytes) -> str:
+        """Return the hex HMAC-SHA512 of message using the keyed prototype."""
+        mac = self._hmac_prototype.copy()
+        mac.update(message)
+        return mac.hexdigest()
+
+    def _urlencode(self, body_params: Dict[str, Any], buffer: List[str]) -> str:
+        """
+        URL-encode body_params into buffer and return the joined string.
+        
+        Produces the same output as urllib.parse.urlencode for flat dicts,
+        but caches quoted keys/values and writes into a caller-owned list so batch
+        signing does not allocate a new parts list per request.
+        """
+        buffer.clear()
+        quoted_keys = self._quoted_keys
+        quoted_values = self._quoted_values
+        quote_plus = urllib.parse.quote_plus
+        for key, value in body_params.items():
+            quoted_key = quoted_keys.get(key)
+            if quoted_key is None:
+                quoted_key = quote_plus(key if isinstance(key, bytes) else str(key)) + '='
+                quoted_keys[key] = quoted_key
+            if type(value) is int:
+                # Digits (and a leading '-') never need quoting
+                buffer.append(quoted_key + str(value))
+                continue
+            if type(value) is not str:
+                # Like urlencode: bytes are quoted as-is, anything else via str()
+                buffer.append(quoted_key + quote_plus(value if isinstance(value, bytes) else str(value)))
+                continue
+            quoted_value = quoted_values.get(value)
+            if quoted_value is None:
+                quoted_value = quote_plus(value)
+                if len(quoted_values) >= self.QUOTE_CACHE_SIZE:
+                    quoted_values.clear()
+                quoted_values[value] = quoted_value
+            buffer.append(quoted_key + quoted_value)
+        return '&'.join(buffer)
+
+    def _build_headers(self, sign: str) -> Dict[str, str]:
+        """Build request headers for a computed signature."""
+        return {
+            'Key': self.api_key,
+            'Sign': sign,
+            'Content-Type': self.CONTENT_TYPE
+        }
 
     def get_nonce(self) -> int:
         """
         Generate a nonce (number used once).
         
         Indodax requires nonce to be unique and increasing.
-        Using millisecond timestamp ensures uniqueness.
+        With a nonce allocator the value comes from the shared counter,
+        which is strictly increasing across threads and processes.
+        Otherwise the millisecond timestamp is used, bumped past the last
+        nonce this signer issued, so it is strictly increasing within the
+        signer (not across processes sharing the key).
         
         Returns:
-            Nonce value (millisecond timestamp)
+            Nonce value (millisecond timestamp or allocator value)
         """
-        return int(time.time() * 1000)
+        if self.nonce_allocator is not None:
+            return self.nonce_allocator.next()
+        with self._nonce_lock:
+            self._last_nonce = max(int(time.time() * 1000), self._last_nonce + 1)
+            return self._last_nonce
 
     def get_timestamp(self) -> int:
         """
@@ -89,18 +171,10 @@ class IndodaxSigner:
         request_body = urllib.parse.urlencode(body_params)
         
         # Calculate HMAC-SHA512 signature
-        sign = hmac.new(
-            self.api_secret.encode('utf-8'),
-            request_body.encode('utf-8'),
-            hashlib.sha512
-        ).hexdigest()
+        sign = self._sign(request_body.encode('utf-8'))
         
         # Create headers
-        headers = {
-            'Key': self.api_key,
-            'Sign': sign,
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
+        headers = self._build_headers(sign)
         
         return request_body, headers
 
@@ -123,6 +197,51 @@ class IndodaxSigner:
         """
         return self.create_request_body(method, params, include_nonce=True)
 
+    def sign_many(
+        self,
+        requests: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+        include_nonce: bool = True,
+        include_timestamp: bool = False
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Sign a batch of Indodax Private API requests in one call.
+        
+        Every request reuses the keyed HMAC prototype and a single encode
+        buffer. Nonces come from get_nonce, so they are strictly increasing
+        across the batch and any other request this signer signs, and
+        requests signed within the same millisecond are still accepted by
+        Indodax when sent in order.
+        
+        Args:
+            requests: Iterable of (method, params) tuples; params may be None
+            include_nonce: Whether to include nonce (default: True)
+            include_timestamp: Whether to include timestamp (default: False)
+        
+        Returns:
+            List of (request_body_string, headers_dict) tuples, in input order
+        """
+        signed = []
+        buffer: List[str] = []
+        timestamp = self.get_timestamp() if include_timestamp else None
+        
+        for method, params in requests:
+            body_params = {'method': method}
+            
+            if include_nonce:
+                body_params['nonce'] = self.get_nonce()
+            
+            if timestamp is not None:
+                body_params['timestamp'] = timestamp
+            
+            if params:
+                body_params.update(params)
+            
+            request_body = self._urlencode(body_params, buffer)
+            sign = self._sign(request_body.encode('utf-8'))
+            signed.append((request_body, self._build_headers(sign)))
+        
+        return signed
+
     def verify_signature(self, message: str, signature: str) -> bool:
         """
         Verify a signature (for validation purposes).
@@ -134,11 +253,7 @@ class IndodaxSigner:
         Returns:
             True if signature is valid, False otherwise
         """
-        expected_sig = hmac.new(
-            self.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha512
-        ).hexdigest()
+        expected_sig = self._sign(message.encode('utf-8'))
         
         return hmac.compare_digest(signature, expected_sig)
 
@@ -0,0 +1,310 @@
+"""
+Cross-process token-bucket rate limiter for API suites
+
+Each endpoint group (ticker, depth, trades, tapi, ...) has a token bucket
+whose state — available tokens and last refill time — lives in a small
+memory-mapped file. All pabot workers on the machine lock the same file, so
+the configured rate is enforced for the whole run rather than per process.
+
+Indodax also limits the total per IP (180 requests/min), which the
+endpoint rates add up to more than. A 'global' entry adds one more bucket
+that every request draws from as well, whatever its endpoint.
+
+Acquiring a token is a reservation: the caller deducts one token under the
+lock (the balance may go negative) and then sleeps for its own deficit
+outside the lock. Concurrent callers therefore queue in lock order without
+spinning, and the aggregate request rate never exceeds `rate` after the
+initial `burst`.
+"""
+
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+_STATE = struct.Struct('<dd')  # tokens, last_refill (unix seconds)
+GLOBAL = 'global'  # limits entry for the bucket shared by every endpoint
+
+
+class TokenBucket:
+    """Token bucket whose state is shared through a locked memory-mapped file."""
+
+    def __init__(self, name: str, rate: float, burst: float, state_file: Path):
+        """
+        Initialize the bucket.
+
+        Args:
+            name: Endpoint group name (for reporting)
+            rate: Tokens added per second
+            burst: Bucket capacity
+            state_file: Shared state file path
+
+        Raises:
+            RuntimeError: If the platform has no fcntl file locks
+            ValueError: If rate is not positive
+        """
+        if fcntl is None:
+            raise RuntimeError(
+                "TokenBucket needs fcntl file locks, which this platform lacks; "
+                "without them processes sharing the state file would overspend the rate"
+            )
+        if float(rate) <= 0:
+            raise ValueError(f"rate for '{name}' must be > 0, got {rate}")
+
+        self.name = name
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.state_file = Path(state_file)
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._fd = None
+        self._map = None
+
+        self.acquired = 0
+        self.declined = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _open(self) -> None:
+        self.close()
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o600)
+        is_new = os.fstat(fd).st_size < _STATE.size
+        if is_new:
+            os.ftruncate(fd, _STATE.size)
+        self._fd = fd
+        self._map = mmap.mmap(fd, _STATE.size)
+        self._pid = os.getpid()
+        if is_new:
+            self._locked(lambda: _STATE.pack_into(self._map, 0, self.burst, time.time()))
+
+    def _locked(self, func):
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            return func()
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _refill(self) -> Tuple[float, float]:
+        """Current token balance and time, after adding the tokens earned since the last update."""
+        tokens, last = _STATE.unpack_from(self._map, 0)
+        now = time.time()
+        if last <= 0 or now < last:
+            tokens, last = self.burst, now
+        return min(self.burst, tokens + (now - last) * self.rate), now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        tokens, now = self._refill()
+        tokens -= 1
+        _STATE.pack_into(self._map, 0, tokens, now)
+        return -tokens / self.rate if tokens < 0 else 0.0
+
+    def _take_available(self) -> bool:
+        """Take one token only if it is available now."""
+        tokens, now = self._refill()
+        taken = tokens >= 1
+        _STATE.pack_into(self._map, 0, tokens - 1 if taken else tokens, now)
+        return taken
+
+    def _with_state(self, func):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._open()
+            return self._locked(func)
+
+    def reserve(self) -> float:
+        """
+        Take one token without sleeping.
+
+        Returns:
+            Seconds until the token is due; the caller must wait that long
+            and then report it with note()
+        """
+        return self._with_state(self._reserve)
+
+    def note(self, wait: float) -> None:
+        """Count an acquisition that waited `wait` seconds."""
+        with self._lock:
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+    def refund(self) -> None:
+        """Give back a token taken by try_acquire that was not used."""
+        def give_back():
+            tokens, now = self._refill()
+            _STATE.pack_into(self._map, 0, min(self.burst, tokens + 1), now)
+
+        self._with_state(give_back)
+        with self._lock:
+            self.acquired -= 1
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available.
+
+        Returns:
+            Seconds spent waiting for the token
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        self.note(wait)
+        return wait
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token without waiting (for optional requests such as hedges).
+
+        Returns:
+            True if a token was taken, False if none is available right now
+        """
+        taken = self._with_state(self._take_available)
+        with self._lock:
+            if taken:
+                self.acquired += 1
+            else:
+                self.declined += 1
+        return taken
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Return acquisition and wait statistics for this process."""
+        return {
+            'rate': self.rate,
+            'burst': self.burst,
+            'acquired': self.acquired,
+            'declined': self.declined,
+            'waited': self.waited,
+            'wait_ms_total': self.wait_seconds * 1000,
+            'wait_ms_max': self.max_wait_seconds * 1000,
+        }
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._pid = None
+
+
+class SharedRateLimiter:
+    """Per-endpoint token buckets shared across processes on one machine."""
+
+    def __init__(
+        self,
+        limits: Dict[str, Dict[str, float]],
+        state_dir: Optional[Union[str, Path]] = None,
+        namespace: str = 'indodax'
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: {endpoint: {'rate': per_second, 'burst': capacity}}.
+                    The 'default' entry applies to endpoints not listed;
+                    the 'global' entry is a bucket every request also
+                    takes a token from (the per-IP limit).
+            state_dir: Directory for bucket state files
+                       (default: <tmpdir>/<namespace>_ratelimit)
+            namespace: Prefix separating unrelated runs on the same host
+        """
+        if state_dir is None:
+            state_dir = Path(tempfile.gettempdir()) / f"{namespace}_ratelimit"
+        self.state_dir = Path(state_dir)
+        self.limits = {name: dict(cfg) for name, cfg in (limits or {}).items()}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._global: Optional[TokenBucket] = None
+        cfg = self.limits.get(GLOBAL)
+        if cfg:
+            self._global = TokenBucket(
+                GLOBAL, float(cfg['rate']), float(cfg.get('burst', cfg['rate'])), self.state_dir / '_global.bin')
+
+    def _bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(endpoint)
+        if bucket is not None:
+            return bucket
+
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                cfg = (self.limits.get(endpoint) if endpoint != GLOBAL else None) or self.limits.get('default')
+                if not cfg:
+                    return None
+                rate = float(cfg['rate'])
+                burst = float(cfg.get('burst', rate))
+                safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', endpoint)
+                bucket = TokenBucket(endpoint, rate, burst, self.state_dir / f"{safe_name}.bin")
+                self._buckets[endpoint] = bucket
+            return bucket
+
+    def _buckets_for(self, endpoint: str) -> List[TokenBucket]:
+        return [bucket for bucket in (self._bucket(endpoint), self._global) if bucket is not None]
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Wait for a token for endpoint.
+
+        Args:
+            endpoint: Endpoint group (e.g. 'ticker', 'depth', 'tapi')
+
+        Returns:
+            Seconds waited (0.0 when the endpoint has no configured limit)
+        """
+        buckets = self._buckets_for(endpoint)
+        # Both tokens are reserved at once; the request may go when the later one is due
+        wait = max((bucket.reserve() for bucket in buckets), default=0.0)
+        if wait > 0:
+            time.sleep(wait)
+        for bucket in buckets:
+            bucket.note(wait)
+        return wait
+
+    def try_acquire(self, endpoint: str) -> bool:
+        """
+        Take a token for endpoint only if one is available now.
+
+        Returns:
+            True if a token was taken from the endpoint and global buckets
+            (or they have no limit)
+        """
+        taken = []
+        for bucket in self._buckets_for(endpoint):
+            if not bucket.try_acquire():
+                for earlier in taken:
+                    earlier.refund()
+                return False
+            taken.append(bucket)
+        return True
+
+    def get_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """Return per-endpoint (and 'global') statistics for this process."""
+        stats = {name: bucket.get_stats() for name, bucket in self._buckets.items()}
+        if self._global is not None:
+            stats[GLOBAL] = self._global.get_stats()
+        return stats
+
+    def close(self) -> None:
+        for bucket in self._buckets.values():
+            bucket.close()
+        self._buckets.clear()
+        if self._global is not None:
+            self._global.close()
@@ -0,0 +1,114 @@
+"""
+TTL + LRU cache for idempotent public market-data responses
+
+Public ticker/depth/trades GETs are often repeated within one suite (the same
+pair in several scenarios). Responses are cached by (method, URL, params)
+for `ttl` seconds; the least recently used entry is evicted once
+`max_entries` is reached. Hits, misses, expirations and evictions are counted
+per endpoint group.
+
+Only HTTP 200 responses are stored, so transient failures are always retried
+against the network.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+STAT_KEYS = ('hits', 'misses', 'expired', 'evictions', 'bypassed')
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with per-entry expiry."""
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a response stays fresh
+            max_entries: Maximum cached responses before LRU eviction
+        """
+        if float(ttl) <= 0:
+            raise ValueError(f"ttl must be > 0, got {ttl}")
+        if int(max_entries) < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
+        self.ttl = float(ttl)
+        self.max_entries = int(max_entries)
+        # key -> (expires, endpoint, response)
+        self._entries: 'OrderedDict[Hashable, Tuple[float, str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: defaultdict(int))
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+        """Build a cache key; params order does not matter."""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return method.upper(), url, items
+
+    def get(self, key: Hashable, endpoint: str = 'default') -> Optional[Any]:
+        """
+        Return a fresh cached response, or None.
+
+        Args:
+            key: Key from make_key
+            endpoint: Endpoint group for stats
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats[endpoint]['misses'] += 1
+                return None
+            expires, _, response = entry
+            if expires <= now:
+                del self._entries[key]
+                self._stats[endpoint]['expired'] += 1
+                self._stats[endpoint]['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats[endpoint]['hits'] += 1
+            return response
+
+    def put(self, key: Hashable, response: Any, endpoint: str = 'default') -> bool:
+        """
+        Store a response if it is an HTTP 200.
+
+        Returns:
+            True if the response was cached
+        """
+        if getattr(response, 'status_code', None) != 200:
+            return False
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, endpoint, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (_, evicted_endpoint, _) = self._entries.popitem(last=False)
+                self._stats[evicted_endpoint]['evictions'] += 1
+        return True
+
+    def count_bypass(self, endpoint: str = 'default') -> None:
+        with self._lock:
+            self._stats[endpoint]['bypassed'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return per-endpoint counters.
+
+        Returns:
+            {endpoint: {hits, misses, expired, evictions, bypassed}}
+        """
+        with self._lock:
+            return {
+                name: {key: counters.get(key, 0) for key in STAT_KEYS}
+                for name, counters in self._stats.items()
+            }
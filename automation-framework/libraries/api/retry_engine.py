@@ -0,0 +1,243 @@
+"""
+Adaptive retry engine with jittered exponential backoff and request hedging
+
+Policy (driven by config/environments/<env>.yaml → api.*):
+- max_retries / retry_delay: retries after connection errors, timeouts,
+  HTTP 429 and HTTP 5xx, sleeping random.uniform(0, min(max_delay,
+  retry_delay * 2**attempt)) between attempts ("full jitter").
+- retry_budget: retries are allowed only while
+  retries <= retry_budget * requests + max_retries, so a failing endpoint
+  cannot multiply its own load. Once the budget is spent the last
+  response/error is returned as-is — real failures are never masked.
+- hedge_endpoints: for idempotent GETs, if the first attempt has not
+  answered after the endpoint's observed p95 latency (hedge_default_delay
+  until hedge_min_samples latencies exist), a second identical request is
+  sent and the first response to arrive wins. A hedge only goes out if a
+  rate-limit token is free right now; the losing request cannot be
+  interrupted, so its response is closed as soon as it arrives.
+"""
+
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import requests
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class LatencyTracker:
+    """Sliding window of recent latencies per endpoint."""
+
+    def __init__(self, window: int = 200):
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[endpoint].append(seconds)
+
+    def percentile(self, endpoint: str, pct: float, min_samples: int) -> Optional[float]:
+        """Return the pct-th latency in seconds, or None with too few samples."""
+        with self._lock:
+            samples = sorted(self._samples[endpoint])
+        if len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(pct * len(samples)))]
+
+
+class RetryEngine:
+    """Retries and hedges HTTP requests according to the environment policy."""
+
+    def __init__(
+        self,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_budget: float = 0.2,
+        hedge_endpoints: Iterable[str] = (),
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_default_delay: Optional[float] = 1.0,
+        before_attempt: Optional[Callable[[str], Any]] = None,
+        before_hedge: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            max_retries: Retries per request after the first attempt
+            retry_delay: Backoff base in seconds
+            max_delay: Backoff cap in seconds
+            retry_budget: Allowed retries as a fraction of requests
+            hedge_endpoints: Endpoint groups safe to hedge (idempotent GETs)
+            hedge_percentile: Latency percentile that triggers the hedge
+            hedge_min_samples: Samples needed before the percentile is trusted
+            hedge_default_delay: Hedge delay (s) until enough samples exist;
+                                 None disables hedging during warm-up
+            before_attempt: Called with the endpoint before every attempt
+                            (e.g. a rate limiter's acquire)
+            before_hedge: Non-blocking check before a hedge; returns False
+                          when no token is free and the hedge is skipped
+                          (e.g. a rate limiter's try_acquire)
+        """
+        self.max_retries = int(max_retries)
+        self.retry_delay = float(retry_delay)
+        self.max_delay = float(max_delay)
+        self.retry_budget = float(retry_budget)
+        self.hedge_endpoints = frozenset(hedge_endpoints or ())
+        self.hedge_percentile = float(hedge_percentile)
+        self.hedge_min_samples = int(hedge_min_samples)
+        self.hedge_default_delay = float(hedge_default_delay) if hedge_default_delay is not None else None
+        self.before_attempt = before_attempt
+        self.before_hedge = before_hedge
+
+        self.latency = LatencyTracker()
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._stats = defaultdict(lambda: defaultdict(int))
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _count(self, endpoint: str, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[endpoint][key] += amount
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.retry_delay * (2 ** attempt)))
+
+    def _take_retry_budget(self) -> bool:
+        with self._lock:
+            if self._retries >= self.retry_budget * self._requests + self.max_retries:
+                return False
+            self._retries += 1
+            return True
+
+    def _send(self, endpoint: str, method: str, url: str, kwargs: Dict[str, Any]):
+        started = time.perf_counter()
+        response = self._session().request(method, url, **kwargs)
+        self.latency.record(endpoint, time.perf_counter() - started)
+        return response
+
+    def _hedge_delay(self, endpoint: str) -> Optional[float]:
+        if endpoint not in self.hedge_endpoints:
+            return None
+        delay = self.latency.percentile(endpoint, self.hedge_percentile, self.hedge_min_samples)
+        return delay if delay is not None else self.hedge_default_delay
+
+    @staticmethod
+    def _discard(future) -> None:
+        """Close a losing hedge's response once it arrives, returning its connection to the pool"""
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    def _attempt(self, endpoint: str, method: str, url: str, kwargs: Dict[str, Any]):
+        """One logical attempt, hedged when the endpoint allows it."""
+        # Wait for the rate limit here, so the hedge delay only measures the request
+        if self.before_attempt is not None:
+            self.before_attempt(endpoint)
+        delay = self._hedge_delay(endpoint) if method == 'GET' else None
+        if delay is None:
+            return self._send(endpoint, method, url, kwargs)
+
+        primary = self._executor.submit(self._send, endpoint, method, url, kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        if self.before_hedge is not None and not self.before_hedge(endpoint):
+            self._count(endpoint, 'hedges_skipped')
+            return primary.result()
+
+        self._count(endpoint, 'hedges')
+        hedge = self._executor.submit(self._send, endpoint, method, url, kwargs)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._count(endpoint, 'hedge_wins')
+                    for loser in {primary, hedge} - {future}:
+                        loser.add_done_callback(self._discard)
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def request(self, method: str, url: str, endpoint: str = 'default', **kwargs) -> requests.Response:
+        """
+        Send a request with retries and optional hedging.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            endpoint: Endpoint group for stats, hedging and rate limiting
+            **kwargs: Passed to requests.Session.request (timeout, headers, ...)
+
+        Returns:
+            The first successful response, or the last response if retries
+            or the retry budget ran out
+
+        Raises:
+            requests.RequestException: If the final attempt failed to connect
+        """
+        method = method.upper()
+        with self._lock:
+            self._requests += 1
+        self._count(endpoint, 'requests')
+
+        attempt = 0
+        while True:
+            try:
+                response = self._attempt(endpoint, method, url, kwargs)
+                error = None
+            except requests.RequestException as e:
+                response, error = None, e
+
+            retryable = error is not None or response.status_code in RETRYABLE_STATUS
+            if not retryable:
+                return response
+
+            if attempt >= self.max_retries or not self._take_retry_budget():
+                self._count(endpoint, 'failures')
+                if attempt < self.max_retries:
+                    self._count(endpoint, 'budget_exhausted')
+                if error is not None:
+                    raise error
+                return response
+
+            self._count(endpoint, 'retries')
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return per-endpoint counters.
+
+        Returns:
+            {endpoint: {requests, retries, hedges, hedge_wins, hedges_skipped,
+            failures, budget_exhausted, p95_ms}}
+        """
+        with self._lock:
+            snapshot = {name: dict(counters) for name, counters in self._stats.items()}
+        for name, counters in snapshot.items():
+            for key in ('requests', 'retries', 'hedges', 'hedge_wins', 'hedges_skipped', 'failures', 'budget_exhausted'):
+                counters.setdefault(key, 0)
+            p95 = self.latency.percentile(name, 0.95, 1)
+            counters['p95_ms'] = p95 * 1000 if p95 is not None else None
+        return snapshot
+
+    def close(self) -> None:
+        """Wait for in-flight (including losing hedge) requests, then stop the hedge threads"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
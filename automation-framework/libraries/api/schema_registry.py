@@ -0,0 +1,177 @@
+"""
+Precompiled JSON-schema validator registry
+
+Loads every schema under test_data/api/schemas/ once per process and keeps
+a compiled validator per schema name, so validating a response no longer
+re-reads, re-parses and re-checks the schema file.
+
+- Schemas are keyed by file stem ('ticker_schema') and by short name
+  ('ticker').
+- A schema is reloaded only when its file mtime changes.
+- Hot schemas (validated at least hot_threshold times) are compiled to
+  specialised Python code with fastjsonschema when it is installed;
+  codegen=True compiles every schema up front. Failures on the generated
+  path are re-validated with jsonschema for a detailed error message.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import jsonschema
+
+try:
+    import fastjsonschema
+except ImportError:  # optional dependency
+    fastjsonschema = None
+
+
+DEFAULT_SCHEMA_DIR = Path(__file__).parent.parent.parent / "test_data" / "api" / "schemas"
+
+
+class _SchemaEntry:
+    """Compiled validators for one schema file."""
+
+    __slots__ = ('name', 'path', 'mtime', 'schema', 'validator', 'fast', 'count')
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = path
+        self.mtime = None
+        self.schema = None
+        self.validator = None
+        self.fast = None
+        self.count = 0
+
+    def load(self, mtime: float) -> None:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.schema = schema
+        self.validator = validator_cls(schema)
+        self.fast = None
+        self.mtime = mtime
+
+
+class SchemaRegistry:
+    """Process-wide cache of compiled JSON-schema validators."""
+
+    def __init__(
+        self,
+        schema_dir: Optional[Union[str, Path]] = None,
+        codegen: Union[bool, str] = 'auto',
+        hot_threshold: int = 50
+    ):
+        """
+        Initialize the registry and compile every schema in schema_dir.
+
+        Args:
+            schema_dir: Directory of *.json schemas (default: test_data/api/schemas)
+            codegen: True — generate code for every schema; 'auto' — only for
+                     hot schemas; False — never. Code generation needs
+                     fastjsonschema and is off when it is not installed
+            hot_threshold: Validations before a schema counts as hot
+        """
+        self.schema_dir = Path(schema_dir) if schema_dir else DEFAULT_SCHEMA_DIR
+        self.codegen = codegen if fastjsonschema is not None else False
+        self.hot_threshold = int(hot_threshold)
+        self._entries: Dict[str, _SchemaEntry] = {}
+        self._lock = threading.Lock()
+        self.load_all()
+
+    def load_all(self) -> List[str]:
+        """
+        (Re)scan schema_dir and compile every schema.
+
+        Returns:
+            Sorted list of registered schema names
+        """
+        with self._lock:
+            for path in sorted(self.schema_dir.glob('*.json')):
+                entry = _SchemaEntry(path.stem, path)
+                entry.load(os.stat(path).st_mtime)
+                if self.codegen is True:
+                    self._compile_fast(entry)
+                self._entries[path.stem] = entry
+                if path.stem.endswith('_schema'):
+                    self._entries[path.stem[:-len('_schema')]] = entry
+            return sorted(self._entries)
+
+    def _compile_fast(self, entry: _SchemaEntry) -> None:
+        entry.fast = fastjsonschema.compile(entry.schema)
+
+    def _entry(self, name: str) -> _SchemaEntry:
+        key = Path(name).stem if name.endswith('.json') else name
+        entry = self._entries.get(key)
+        if entry is None:
+            raise KeyError(f"Unknown schema '{name}'. Registered: {', '.join(sorted(self._entries))}")
+
+        mtime = os.stat(entry.path).st_mtime
+        if mtime != entry.mtime:
+            with self._lock:
+                if mtime != entry.mtime:
+                    entry.load(mtime)
+                    if self.codegen is True:
+                        self._compile_fast(entry)
+        return entry
+
+    def validate(self, instance: Any, name: str) -> None:
+        """
+        Validate instance against a registered schema.
+
+        Args:
+            instance: Parsed JSON document
+            name: Schema name ('ticker', 'ticker_schema' or 'ticker_schema.json')
+
+        Raises:
+            AssertionError: If the instance does not match the schema
+            KeyError: If the schema is not registered
+        """
+        entry = self._entry(name)
+        entry.count += 1
+
+        if entry.fast is None and self.codegen == 'auto' and entry.count >= self.hot_threshold:
+            with self._lock:
+                if entry.fast is None:
+                    self._compile_fast(entry)
+
+        if entry.fast is not None:
+            try:
+                entry.fast(instance)
+                return
+            except fastjsonschema.JsonSchemaException:
+                pass  # fall through for jsonschema's detailed message
+
+        if entry.validator.is_valid(instance):
+            return
+
+        error = jsonschema.exceptions.best_match(entry.validator.iter_errors(instance))
+        if error is not None:
+            location = '/'.join(str(p) for p in error.absolute_path) or '<root>'
+            raise AssertionError(
+                f"Schema validation failed ({entry.path.name}) at {location}: {error.message}"
+            )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return validation counts and whether generated code is active, per schema file."""
+        return {
+            entry.path.stem: {'validations': entry.count, 'codegen': entry.fast is not None}
+            for entry in {id(e): e for e in self._entries.values()}.values()
+        }
+
+
+# Process-wide registry shared by every suite in a pabot worker
+_schema_registry = None
+
+
+def get_schema_registry(schema_dir: Optional[Union[str, Path]] = None) -> SchemaRegistry:
+    """Get or create the global SchemaRegistry instance"""
+    global _schema_registry
+
+    if _schema_registry is None:
+        _schema_registry = SchemaRegistry(schema_dir)
+
+    return _schema_registry
@@ -0,0 +1,196 @@
+"""
+Robot Framework library for policy-driven screenshots with Browser or AppiumLibrary.
+
+Replaces synchronous full-page PNG captures in failure hooks: the
+screenshots block of the env YAML decides when to capture (off, failure,
+sampled, always), the format and quality, and captures can be clipped to
+an element or region. Only the grab runs on the test thread; encoding and
+disk writes go to the background writer of screenshot_service.
+
+Web captures use the screenshot_grab.js Browser extension, which returns
+the bytes from Playwright directly (Browser's Take Screenshot always writes,
+re-reads and deletes a file on the test thread, even with return_as=bytes).
+The configured service is shared with the page objects (BasePage).
+"""
+
+import ast
+import base64
+import json
+import sys
+from pathlib import Path
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+# Page objects import screenshot_service by package path; use the same
+# module so both share one service (see set_screenshot_service)
+_FRAMEWORK_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if _FRAMEWORK_DIR not in sys.path:
+    sys.path.insert(0, _FRAMEWORK_DIR)
+
+from libraries.base.screenshot_service import (  # noqa: E402
+    ScreenshotPolicy, ScreenshotService, format_stats, set_screenshot_service
+)
+
+
+class ScreenshotServiceLibrary:
+    """Robot Framework library for asynchronous, failure-only and clipped screenshots."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+        self.service = None
+
+    def _service(self):
+        if self.service is None:
+            self.configure_screenshots({})
+        return self.service
+
+    def _log_link(self, path):
+        """Link the image in log.html (the file is written by the time the log is opened)."""
+        output_dir = Path(self.builtin.get_variable_value('${OUTPUT DIR}', '.'))
+        try:
+            src = path.relative_to(output_dir).as_posix()
+        except ValueError:
+            src = path.as_uri()
+        self.builtin.log(f'<a href="{src}"><img src="{src}" width="800px"></a>', 'INFO', html=True)
+
+    def _capture(self, grab, name, failed, force, captured_format):
+        path = self._service().capture(
+            grab, name, self._is_true(failed), self._is_true(force), captured_format)
+        if path is None:
+            self.builtin.log(
+                f'Screenshot {name} not captured ({self.service.policy.mode} mode)', 'DEBUG')
+            return None
+        self._log_link(path)
+        return str(path)
+
+    @staticmethod
+    def _is_true(value):
+        return value if isinstance(value, bool) else str(value).lower() == 'true'
+
+    @keyword('Configure Screenshots')
+    def configure_screenshots(self, env_config, output_dir=None):
+        """
+        Load the screenshot policy from the environment YAML.
+
+        Reads the screenshots block: mode (off | failure | sampled | always),
+        sample_rate, format (png | jpeg | webp), quality, full_page, max_queue.
+
+        Args:
+            env_config: Environment config dict (from Get Environment Config)
+            output_dir: Image directory (default: ${OUTPUT DIR}/screenshots)
+
+        Example:
+            Configure Screenshots    ${yaml_config}
+        """
+        env_config = env_config if isinstance(env_config, dict) else {}
+        policy = ScreenshotPolicy.from_config(env_config)
+        if not output_dir:
+            run_dir = Path(self.builtin.get_variable_value('${OUTPUT DIR}', '.'))
+            output_dir = str(run_dir / 'screenshots')
+        if self.service is not None:
+            current = (self.service.policy, str(self.service.output_dir))
+            if current == (policy, str(Path(output_dir))):
+                return
+            self.service.close()
+        self.service = ScreenshotService(output_dir, policy)
+        set_screenshot_service(self.service)
+        self.builtin.log(f'Screenshot policy: {policy}', 'INFO')
+
+    @keyword('Capture Web Screenshot')
+    def capture_web_screenshot(self, name='screenshot', selector=None, clip=None, failed=False,
+                               force=False):
+        """
+        Capture the current Browser page per the screenshot policy.
+
+        Needs screenshot_grab.js in the Browser library's jsextension list
+        (see web_settings.robot).
+
+        Args:
+            name: File name stem
+            selector: Capture only this element
+            clip: Capture only this region, e.g. {'x': 0, 'y': 0, 'width': 1280, 'height': 400}
+            failed: The test failed (failure / sampled policies capture it)
+            force: Capture regardless of the mode unless screenshots are off
+
+        Returns:
+            Path of the image, or None when the policy skipped it
+
+        Example:
+            Capture Web Screenshot    order_book    selector=${ORDER_BOOK_BUY_TABLE}    force=True
+        """
+        region = clip if clip is None or isinstance(clip, dict) else ast.literal_eval(str(clip))
+
+        def grab(options):
+            # Bytes straight from Playwright; the image is logged by _capture once queued
+            spec = dict(options, selector=selector or None, clip=None if selector else region)
+            encoded = self.builtin.run_keyword('Browser.Grab Screenshot', json.dumps(spec))
+            return base64.b64decode(encoded)
+
+        return self._capture(grab, name, failed, force, None)
+
+    @keyword('Capture Mobile Screenshot')
+    def capture_mobile_screenshot(self, name='screenshot', locator=None, failed=False, force=False):
+        """
+        Capture the current Appium screen (or one element) per the screenshot policy.
+
+        Appium returns PNG; conversion to the configured format happens on
+        the writer thread (needs Pillow, otherwise PNG is kept).
+
+        Args:
+            name: File name stem
+            locator: Capture only this element
+            failed: The test or step failed
+            force: Capture regardless of the mode unless screenshots are off
+
+        Returns:
+            Path of the image, or None when the policy skipped it
+        """
+        appium = self.builtin.get_library_instance('AppiumLibrary')
+
+        def grab(_options):
+            if locator:
+                return appium._element_find(locator, True, True).screenshot_as_png
+            return appium._current_application().get_screenshot_as_png()
+
+        return self._capture(grab, name, failed, force, 'png')
+
+    @keyword('Capture Test Screenshot')
+    def capture_test_screenshot(self, platform='web', selector=None):
+        """
+        Test Teardown capture: failed tests per the policy, passing ones in sampled / always mode.
+
+        Args:
+            platform: web (Browser) or mobile (AppiumLibrary)
+            selector: Capture only this element
+
+        Example:
+            Capture Test Screenshot    mobile
+        """
+        failed = self.builtin.get_variable_value('${TEST STATUS}') == 'FAIL'
+        test_name = self.builtin.get_variable_value('${TEST NAME}', 'test')
+        name = '{}_{}'.format('FAIL' if failed else 'PASS', test_name)
+        if platform == 'mobile':
+            return self.capture_mobile_screenshot(name, selector, failed)
+        return self.capture_web_screenshot(name, selector, failed=failed)
+
+    @keyword('Get Screenshot Stats')
+    def get_screenshot_stats(self):
+        """
+        Wait for pending writes and return the run's screenshot metrics.
+
+        Returns:
+            Dictionary with counts (captured, skipped, dropped, errors, written),
+            blocking_ms {p50, p95, max, total} on the test thread, encode_ms,
+            bytes_written, avg_kb, disk_files and disk_bytes
+        """
+        return self._service().stats()
+
+    @keyword('Log Screenshot Stats')
+    def log_screenshot_stats(self):
+        """Log test-thread blocking time, output size and disk usage of the run's screenshots."""
+        stats = self.get_screenshot_stats()
+        self.builtin.log(format_stats(stats), 'INFO')
+        return stats
@@ -5,11 +5,406 @@ Supports hybrid approach: YAML + .env files for configuration and secrets
 
 import yaml
 import os
+import hashlib
+import pickle
+import re
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 import logging
 
 
+# On-disk compiled config snapshots shared by the user's processes (pabot workers, Locust).
+# They are unpickled, so the directory is per-user and must stay private (see _snapshot_dir_is_private)
+SNAPSHOT_DIR = Path(os.getenv(
+    'CONFIG_SNAPSHOT_DIR',
+    Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'qa_config_snapshots'
+))
+_SNAPSHOT_VERSION = 2
+
+# ${ENV_VAR} or ${ENV_VAR:default}
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+_logger = logging.getLogger('ConfigManager')
+
+
+def _snapshot_dir_is_private(directory: Path) -> bool:
+    """
+    True when directory is a real directory (not a symlink) owned by this
+    user with no group/other permissions; pickles from anywhere else are
+    never loaded.
+    """
+    try:
+        info = os.lstat(directory)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(info.st_mode) or info.st_mode & 0o077:
+        return False
+    return not hasattr(os, 'getuid') or info.st_uid == os.getuid()
+
+
+class _Template:
+    """
+    A YAML string leaf containing ${VAR[:default]} references
+
+    Resolved on first access and memoised; the memo is reused until one of the
+    referenced environment variables changes.
+    """
+
+    __slots__ = ('text', 'names', '_env', '_value')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.names = tuple(dict.fromkeys(m.split(':', 1)[0] for m in _ENV_VAR_PATTERN.findall(text)))
+        self._env = None
+        self._value = None
+
+    def __getstate__(self):
+        return self.text, self.names
+
+    def __setstate__(self, state):
+        self.text, self.names = state
+        self._env = None
+        self._value = None
+
+    def __repr__(self):
+        return repr(self.resolve())
+
+    @staticmethod
+    def _replace(match) -> str:
+        env_var = match.group(1)
+
+        # Check for default value
+        if ':' in env_var:
+            var_name, default_val = env_var.split(':', 1)
+            return os.getenv(var_name, default_val)
+
+        env_value = os.getenv(env_var)
+        if env_value is None:
+            _logger.warning(f"Environment variable not found: {env_var}")
+        return env_value or f"${{{env_var}}}"
+
+    def resolve(self) -> str:
+        env = tuple(map(os.environ.get, self.names))
+        if env != self._env:
+            self._value = _ENV_VAR_PATTERN.sub(self._replace, self.text)
+            self._env = env
+        return self._value
+
+
+def _resolve(value: Any) -> Any:
+    return value.resolve() if type(value) is _Template else value
+
+
+def _negate(result: Any) -> Any:
+    return result if result is NotImplemented else not result
+
+
+class _LazyDict(dict):
+    """dict whose ${VAR} leaves are resolved on access (see _Template)"""
+
+    def __getitem__(self, key):
+        return _resolve(dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # Defined here so dict(lazy) / {**lazy} go through keys() + __getitem__
+        # instead of copying the raw _Template leaves
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        return _resolve(dict.get(self, key, default))
+
+    def pop(self, key, *default):
+        return _resolve(dict.pop(self, key, *default))
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, _resolve(value)
+
+    def setdefault(self, key, default=None):
+        return _resolve(dict.setdefault(self, key, default))
+
+    def items(self):
+        return [(k, _resolve(v)) for k, v in dict.items(self)]
+
+    def values(self):
+        return [_resolve(v) for v in dict.values(self)]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __reduce__(self):
+        # Pickle the unresolved plan, never resolved values
+        return _LazyDict, (dict(dict.items(self)),)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Fully resolved plain-dict copy (for json.dumps, deep comparisons, ...)"""
+        return {k: _materialise(v) for k, v in self.items()}
+
+    def __eq__(self, other):
+        # Key by key, resolving only until the first difference
+        if not isinstance(other, dict):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        for key, value in dict.items(self):
+            if key not in other or _resolve(value) != other[key]:
+                return False
+        return True
+
+    def __ne__(self, other):
+        return _negate(self.__eq__(other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class _LazyList(list):
+    """list whose ${VAR} items are resolved on access (see _Template)"""
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_resolve(v) for v in list.__getitem__(self, index)]
+        return _resolve(list.__getitem__(self, index))
+
+    def __iter__(self):
+        return map(_resolve, list.__iter__(self))
+
+    def __reduce__(self):
+        return _LazyList, (list(list.__iter__(self)),)
+
+    def to_list(self) -> list:
+        return [_materialise(v) for v in self]
+
+    def __eq__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        return _negate(self.__eq__(other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_list())
+
+
+def _materialise(value: Any) -> Any:
+    if isinstance(value, _LazyDict):
+        return value.to_dict()
+    if isinstance(value, _LazyList):
+        return value.to_list()
+    return value
+
+
+def _compile_plan(value: Any) -> Any:
+    """
+    Compile a parsed YAML tree into its interpolation plan
+
+    Leaves containing ${...} become _Template objects and only the containers
+    on the path to one become lazy; subtrees without references stay plain
+    dicts/lists with no access overhead.
+    """
+    if isinstance(value, str):
+        return _Template(value) if '${' in value and _ENV_VAR_PATTERN.search(value) else value
+
+    if isinstance(value, dict):
+        compiled = {k: _compile_plan(v) for k, v in value.items()}
+        lazy = any(type(v) in (_Template, _LazyDict, _LazyList) for v in compiled.values())
+        return _LazyDict(compiled) if lazy else compiled
+
+    if isinstance(value, list):
+        compiled = [_compile_plan(item) for item in value]
+        lazy = any(type(v) in (_Template, _LazyDict, _LazyList) for v in compiled)
+        return _LazyList(compiled) if lazy else compiled
+
+    return value
+
+
+def _flatten(value: Any, prefix: str = '', out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Resolved leaves of a config tree keyed by dot-path (lists are leaves)"""
+    if out is None:
+        out = {}
+    if isinstance(value, dict) and value:
+        for key, item in dict.items(value):
+            _flatten(_resolve(item), f"{prefix}.{key}" if prefix else str(key), out)
+    else:
+        out[prefix] = _materialise(value)
+    return out
+
+
+def _diff_configs(old: Any, new: Any) -> Dict[str, Tuple[Any, Any]]:
+    """{dot.path: (old, new)} for every leaf that was added, removed or changed"""
+    before, after = _flatten(old), _flatten(new)
+    return {
+        path: (before.get(path), after.get(path))
+        for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path) or (path in before) != (path in after)
+    }
+
+
+def _build_index(config: Any) -> Dict[str, Any]:
+    """
+    Precompute every dot-path of a config tree -> its (unresolved) value
+
+    Both leaves and intermediate mappings are indexed, so 'api' and
+    'api.timeout' are single dictionary hits.
+    """
+    index: Dict[str, Any] = {}
+    stack = [('', config)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in dict.items(node):
+            path = f"{prefix}.{key}" if prefix else str(key)
+            index[path] = value
+            if isinstance(value, dict):
+                stack.append((path, value))
+    return index
+
+
+# 1.5, '1.5', '500ms', '30s', '2m', '1h' -> seconds
+_DURATION_PATTERN = re.compile(r'^\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|s|m|h)?\s*$', re.IGNORECASE)
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None when it does not exist"""
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+# Parsed .env files shared by every ConfigManager and keyword in this process:
+# resolved path -> (mtime_ns, size, {KEY: value})
+_ENV_FILE_CACHE: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+_FRAMEWORK_DIR = Path(__file__).parent.parent.parent
+
+_TRUE_STRINGS = frozenset({'true', '1', 'yes', 'on'})
+_FALSE_STRINGS = frozenset({'false', '0', 'no', 'off', ''})
+
+
+def _parse_env_text(text: str) -> Dict[str, str]:
+    """
+    Parse .env content in one pass
+
+    KEY=VALUE per line; blank lines and # comments are skipped. Values are
+    kept verbatim apart from surrounding whitespace, and the first occurrence
+    of a key wins (same as the anchored regex lookups it replaces).
+    """
+    values: Dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        values.setdefault(key.strip(), value.strip())
+    return values
+
+
+def _resolve_env_path(env_file: Union[str, Path]) -> Path:
+    """Absolute paths are used as-is; bare names resolve against automation-framework/"""
+    path = Path(env_file)
+    return path if path.is_absolute() else _FRAMEWORK_DIR / path
+
+
+def _read_env_file(env_file: Union[str, Path]) -> Dict[str, str]:
+    """
+    Return the parsed mapping of an env file, re-reading it only when it changed
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = _resolve_env_path(env_file)
+    file_stat = os.stat(path)
+    key = str(path)
+    cached = _ENV_FILE_CACHE.get(key)
+    if (cached is not None and cached[0] == file_stat.st_mtime_ns
+            and cached[1] == file_stat.st_size):
+        return cached[2]
+    with open(path, 'r', encoding='utf-8') as f:
+        values = _parse_env_text(f.read())
+    _ENV_FILE_CACHE[key] = (file_stat.st_mtime_ns, file_stat.st_size, values)
+    return values
+
+
+def _convert(name: str, value: str, type_name: str) -> Any:
+    if type_name == 'str':
+        return value
+    if type_name == 'bool':
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"{name}: cannot convert '{value}' to bool")
+    if type_name in ('int', 'float'):
+        try:
+            return int(value) if type_name == 'int' else float(value)
+        except ValueError:
+            raise ValueError(f"{name}: cannot convert '{value}' to {type_name}")
+    raise ValueError(f"{name}: unknown type '{type_name}' (use str, int, float or bool)")
+
+
+def _coerce(name: str, value: Any, type_name: str) -> Any:
+    """Convert a YAML value (already typed, or a string) to int, float, bool, str or duration"""
+    if type_name == 'duration':
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        match = _DURATION_PATTERN.match(value) if isinstance(value, str) else None
+        if match is None:
+            raise ValueError(f"{name}: cannot convert '{value}' to duration (e.g. 30, 1.5s, 500ms, 2m, 1h)")
+        return float(match.group(1)) * _DURATION_UNITS[(match.group(2) or 's').lower()]
+    if isinstance(value, str):
+        return _convert(name, value, type_name)
+    if type_name == 'str':
+        return str(value)
+    if type_name == 'bool' and isinstance(value, (bool, int)):
+        return bool(value)
+    if type_name == 'float' and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if type_name == 'int' and isinstance(value, (int, float)) and not isinstance(value, bool):
+        if value == int(value):
+            return int(value)
+    if type_name not in ('int', 'float', 'bool'):
+        raise ValueError(f"{name}: unknown type '{type_name}' (use str, int, float, bool or duration)")
+    raise ValueError(f"{name}: cannot convert {value!r} to {type_name}")
+
+
+_NO_DEFAULT = object()
+
+
+def _parse_spec(spec: str) -> Tuple[str, str, Any]:
+    """Split NAME[:type][=default] into (name, type or '', default or _NO_DEFAULT)"""
+    name, sep, default = spec.partition('=')
+    name, _, type_name = name.partition(':')
+    return name.strip(), type_name.strip(), (default if sep else _NO_DEFAULT)
+
+
+def _lookup(values: Dict[str, str], env_file: Union[str, Path], spec: str) -> Tuple[str, Any]:
+    """
+    Resolve one NAME[:type][=default] spec against a parsed env file
+
+    The default applies when the variable is missing or empty; without a
+    default a missing variable is an error.
+    """
+    name, type_name, default = _parse_spec(spec)
+    type_name = type_name or 'str'
+
+    value = values.get(name)
+    if value is None or (value == '' and default is not _NO_DEFAULT):
+        if default is _NO_DEFAULT:
+            raise ValueError(f"{name} not found in {_resolve_env_path(env_file)}")
+        value = default
+    return name, _convert(name, value, type_name)
+
+
 class ConfigManager:
     """
     Manages configuration loading and access with hybrid YAML + .env approach
@@ -17,9 +412,12 @@ class ConfigManager:
     Features:
     - Load .env files for secrets (dev, staging, production)
     - Load YAML configuration files
-    - Environment variable substitution
-    - Configuration caching
-    - Type-safe access
+    - Environment variable substitution (compiled once, resolved lazily on access)
+    - Configuration caching (per instance + on-disk snapshots across processes)
+    - Type-safe access: every config is flattened into a dot-path index at
+      load time; get_int/get_float/get_bool/get_duration convert once
+    - Watch mode: background polling reloads only the YAML/.env files that
+      changed and notifies subscribers with the changed keys
     
     Hybrid Approach:
     1. .env files store secrets (passwords, tokens, API keys)
@@ -27,7 +425,8 @@ class ConfigManager:
     3. ConfigManager loads .env first, then resolves YAML variables
     """
     
-    def __init__(self, config_dir: Optional[Path] = None, env_file: Optional[str] = None):
+    def __init__(self, config_dir: Optional[Path] = None, env_file: Optional[str] = None,
+                 use_snapshots: Optional[bool] = None):
         """
         Initialize Config Manager
 
@@ -36,10 +435,26 @@ class ConfigManager:
                        Accepts str or Path — will be coerced to Path.
             env_file: .env file to load (e.g., '.env.dev', '.env.staging')
                      If None, loads from TEST_ENV variable or .env.dev
+            use_snapshots: Reuse compiled configs from SNAPSHOT_DIR across processes.
+                          If None, enabled unless CONFIG_SNAPSHOT_CACHE=0
         """
         # Instance-level cache — isolated per ConfigManager instance (safe for parallel/pabot)
         self._config_cache: Dict[str, Any] = {}
         self._env_loaded: Dict[str, bool] = {}
+        # id(config) -> (config, {dot.path: value}, {(path, type): (raw, converted)})
+        self._indexes: Dict[int, Tuple[Any, Dict[str, Any], Dict[Tuple[str, str], Tuple[Any, Any]]]] = {}
+
+        # Watch-mode state: file signatures of everything loaded so far
+        self._sources: Dict[str, Tuple[Path, Optional[Tuple[int, int]]]] = {}
+        self._env_sources: Dict[str, Tuple[Path, Optional[Tuple[int, int]], Dict[str, str]]] = {}
+        self._subscribers: List[Callable[[str, Dict[str, Tuple[Any, Any]]], None]] = []
+        self._reload_lock = threading.Lock()
+        self._watch_stop = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+
+        if use_snapshots is None:
+            use_snapshots = os.getenv('CONFIG_SNAPSHOT_CACHE', '1') != '0'
+        self.use_snapshots = use_snapshots
 
         if config_dir is None:
             # __file__ = automation-framework/libraries/base/config_manager.py
@@ -88,69 +503,21 @@ class ConfigManager:
             return
         
         try:
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse KEY=VALUE
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Only set if not already in environment
-                        if key not in os.environ:
-                            os.environ[key] = value
-                            self.logger.debug(f"Loaded from {env_file}: {key}")
+            signature = _file_signature(env_path)
+            values = _read_env_file(env_path)
+            for key, value in values.items():
+                # Only set if not already in environment
+                if key not in os.environ:
+                    os.environ[key] = value
+                    self.logger.debug(f"Loaded from {env_file}: {key}")
             
             self._env_loaded[env_file] = True
+            self._env_sources[env_file] = (env_path, signature, values)
             self.logger.info(f"Loaded environment file: {env_file}")
         
         except Exception as e:
             self.logger.error(f"Error loading .env file {env_file}: {e}")
     
-    def _substitute_env_vars(self, value: Any) -> Any:
-        """
-        Recursively substitute environment variables in configuration
-        
-        Supports ${ENV_VAR} or ${ENV_VAR:default_value} syntax
-        
-        Args:
-            value: Configuration value
-            
-        Returns:
-            Value with substituted environment variables
-        """
-        if isinstance(value, str):
-            # Pattern: ${ENV_VAR} or ${ENV_VAR:default}
-            import re
-            
-            def replace_env_var(match):
-                env_var = match.group(1)
-                
-                # Check for default value
-                if ':' in env_var:
-                    var_name, default_val = env_var.split(':', 1)
-                    return os.getenv(var_name, default_val)
-                else:
-                    env_value = os.getenv(env_var)
-                    if env_value is None:
-                        self.logger.warning(f"Environment variable not found: {env_var}")
-                    return env_value or f"${{{env_var}}}"
-            
-            return re.sub(r'\$\{([^}]+)\}', replace_env_var, value)
-        
-        elif isinstance(value, dict):
-            return {k: self._substitute_env_vars(v) for k, v in value.items()}
-        
-        elif isinstance(value, list):
-            return [self._substitute_env_vars(item) for item in value]
-        
-        return value
-    
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """
         Load configuration from YAML file
@@ -176,22 +543,109 @@ class ConfigManager:
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
         
+        # Signature is taken before reading so an edit racing the read is seen by the watcher
+        signature = _file_signature(config_path)
+        config = self._compile_config(config_file, config_path, config_path.read_bytes())
+        
+        # Cache the configuration
+        self._config_cache[config_file] = config
+        self._indexes[id(config)] = (config, _build_index(config), {})
+        self._sources[config_file] = (config_path, signature)
+        return config
+    
+    def _compile_config(self, config_file: str, config_path: Path, raw: bytes) -> Dict[str, Any]:
+        """
+        Parse and compile YAML bytes, going through the on-disk snapshot
+
+        Raises:
+            ValueError: If the YAML is invalid
+        """
+        snapshot_path = self._snapshot_path(config_path, raw) if self.use_snapshots else None
+        
+        # Reuse the compiled plan from any earlier process when the YAML is unchanged
+        config = self._read_snapshot(snapshot_path) if snapshot_path else None
+        if config is not None:
+            self.logger.info(f"Configuration loaded from snapshot: {config_file}")
+            return config
+        
         # Load YAML
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+            config = yaml.safe_load(raw) or {}
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {config_file}: {str(e)}")
         
-        # Substitute environment variables
-        config = self._substitute_env_vars(config)
+        # Compile ${VAR} leaves once; they resolve on first access and track env changes
+        config = _compile_plan(config)
         
-        # Cache the configuration
-        self._config_cache[config_file] = config
+        if snapshot_path:
+            self._write_snapshot(snapshot_path, config)
         
         self.logger.info(f"Configuration loaded: {config_file}")
         return config
     
+    def _snapshot_path(self, config_path: Path, raw: bytes) -> Path:
+        """
+        Snapshot file for a config: <name>-<path hash>-<content hash>.pickle
+
+        The content hash covers the YAML bytes, so any edit selects a new file.
+        """
+        # __name__ is part of the key: pickled plan classes are looked up by module name
+        key = f"{__name__}:{config_path.resolve()}"
+        path_hash = hashlib.blake2b(key.encode('utf-8'), digest_size=6).hexdigest()
+        content_hash = hashlib.blake2b(raw, digest_size=12).hexdigest()
+        return SNAPSHOT_DIR / f"{config_path.stem}-{path_hash}-{content_hash}.pickle"
+    
+    def _read_snapshot(self, snapshot_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load a compiled snapshot if it exists.
+
+        Snapshots hold the interpolation plan, not resolved values, so they
+        stay valid when env vars change.
+
+        Returns:
+            Compiled configuration, or None when missing, unreadable or
+            when SNAPSHOT_DIR is not private to this user
+        """
+        if not _snapshot_dir_is_private(snapshot_path.parent):
+            return None
+        try:
+            with open(snapshot_path, 'rb') as f:
+                version, config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable config snapshot {snapshot_path.name}: {e}")
+            return None
+        
+        if version != _SNAPSHOT_VERSION:
+            return None
+        return config
+    
+    def _write_snapshot(self, snapshot_path: Path, config: Dict[str, Any]) -> None:
+        """
+        Atomically write a snapshot and drop older ones for the same file.
+
+        The file is private to the user (0600) and holds ${VAR} templates,
+        never resolved values. Failures are logged and ignored — snapshots
+        are only an optimisation.
+        """
+        prefix = snapshot_path.name.rsplit('-', 1)[0]
+        try:
+            SNAPSHOT_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _snapshot_dir_is_private(SNAPSHOT_DIR):
+                self.logger.warning(
+                    f"Not writing config snapshots: {SNAPSHOT_DIR} is not a private directory owned by this user")
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=SNAPSHOT_DIR, prefix=f".{prefix}-", suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((_SNAPSHOT_VERSION, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_path)
+            for old in SNAPSHOT_DIR.glob(f"{prefix}-*.pickle"):
+                if old != snapshot_path:
+                    old.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Could not write config snapshot {snapshot_path.name}: {e}")
+    
     def _find_config_file(self, config_file: str) -> Path:
         """
         Find config file in config directory structure.
@@ -237,10 +691,19 @@ class ConfigManager:
         self.logger.debug(f"Loading environment config for: {env}")
         return self.load_config(env)
     
+    def _index_for(self, config: Any) -> Optional[Tuple[Any, Dict[str, Any], Dict[Tuple[str, str], Tuple[Any, Any]]]]:
+        """Index entry of a config loaded by this manager, or None for any other dict"""
+        entry = self._indexes.get(id(config))
+        return entry if entry is not None and entry[0] is config else None
+    
     def get(self, key: str, config: Dict[str, Any], default: Any = None) -> Any:
         """
         Get value from configuration with dot notation
         
+        Configs returned by load_config are looked up in their precomputed
+        dot-path index (one dict hit, treat them as read-only); other dicts
+        are walked key by key.
+        
         Args:
             key: Configuration key (supports dot notation: 'api.base_url')
             config: Configuration dictionary
@@ -249,6 +712,11 @@ class ConfigManager:
         Returns:
             Configuration value
         """
+        entry = self._index_for(config)
+        if entry is not None:
+            value = entry[1].get(key, _NO_DEFAULT)
+            return default if value is _NO_DEFAULT else _resolve(value)
+        
         keys = key.split('.')
         value = config
         
@@ -260,10 +728,220 @@ class ConfigManager:
         
         return value
     
+    def _get_typed(self, key: str, config: Dict[str, Any], type_name: str, default: Any) -> Any:
+        """
+        Typed lookup; the conversion is cached per (path, type) and redone
+        only when the underlying (resolved) value changes
+        """
+        value = self.get(key, config, _NO_DEFAULT)
+        if value is _NO_DEFAULT:
+            if default is _NO_DEFAULT:
+                raise ValueError(f"{key} not found in config")
+            return default
+        
+        entry = self._index_for(config)
+        if entry is None:
+            return _coerce(key, value, type_name)
+        cached = entry[2].get((key, type_name))
+        if cached is not None and cached[0] == value and type(cached[0]) is type(value):
+            return cached[1]
+        converted = _coerce(key, value, type_name)
+        entry[2][(key, type_name)] = (value, converted)
+        return converted
+    
+    def get_int(self, key: str, config: Dict[str, Any], default: Any = _NO_DEFAULT) -> int:
+        """
+        Get a dot-path value as int
+        
+        Raises:
+            ValueError: If the key is missing (and no default) or not an integer
+        """
+        return self._get_typed(key, config, 'int', default)
+    
+    def get_float(self, key: str, config: Dict[str, Any], default: Any = _NO_DEFAULT) -> float:
+        """Get a dot-path value as float (see get_int)"""
+        return self._get_typed(key, config, 'float', default)
+    
+    def get_bool(self, key: str, config: Dict[str, Any], default: Any = _NO_DEFAULT) -> bool:
+        """Get a dot-path value as bool; strings accept true/false, 1/0, yes/no, on/off"""
+        return self._get_typed(key, config, 'bool', default)
+    
+    def get_duration(self, key: str, config: Dict[str, Any], default: Any = _NO_DEFAULT) -> float:
+        """Get a dot-path value as seconds; accepts numbers (seconds) and '500ms', '30s', '2m', '1h'"""
+        return self._get_typed(key, config, 'duration', default)
+    
+    def get_many(self, config: Dict[str, Any], *specs: str) -> list:
+        """
+        Look up several dot-paths in one call
+        
+        Each spec is path[:type][=default]; type is str, int, float, bool or
+        duration (omitted: the YAML value as-is). A default (converted like
+        the value) applies when the path is missing; an empty default
+        ('path=') means None, and without one a missing path is an error.
+        
+        Returns:
+            List of values in spec order
+        """
+        values = []
+        for spec in specs:
+            path, type_name, default = _parse_spec(spec)
+            if default == '':
+                default = None
+            if type_name:
+                if default is not _NO_DEFAULT and default is not None:
+                    default = _coerce(path, default, type_name)
+                values.append(self._get_typed(path, config, type_name, default))
+                continue
+            value = self.get(path, config, default)
+            if value is _NO_DEFAULT:
+                raise ValueError(f"{path} not found in config")
+            values.append(value)
+        return values
+    
     def clear_cache(self) -> None:
         """Clear configuration cache"""
         self._config_cache.clear()
+        self._indexes.clear()
+        self._sources.clear()
         self.logger.debug("Configuration cache cleared")
+    
+    def subscribe(self, callback: Callable[[str, Dict[str, Tuple[Any, Any]]], None]) -> None:
+        """
+        Register a callback for watch-mode reloads
+        
+        Called as callback(source, changes) from the watcher thread, where
+        source is the config name (e.g. 'dev') or .env filename and changes
+        maps each changed dot-path or env key to (old, new); a side is None
+        when the key was added or removed.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[str, Dict[str, Tuple[Any, Any]]], None]) -> None:
+        """Remove a callback registered with subscribe"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def check_for_changes(self) -> Dict[str, Dict[str, Tuple[Any, Any]]]:
+        """
+        Poll every loaded YAML and .env file once and reload the changed ones
+        
+        Unchanged files cost one stat() each. A changed YAML file is re-parsed
+        on its own and swapped into the cache with a single assignment, so
+        readers never wait on a reload; configs already handed out keep their
+        old values until the caller loads again. A changed .env file updates
+        only the variables it set — ${VAR} templates pick them up lazily.
+        
+        Returns:
+            Dictionary {source: {key: (old, new)}} of what changed
+        """
+        changed = {}
+        with self._reload_lock:
+            for env_file, (path, signature, _) in list(self._env_sources.items()):
+                if _file_signature(path) != signature:
+                    changes = self._reload_env_file(env_file)
+                    if changes:
+                        changed[env_file] = changes
+            
+            for config_file, (path, signature) in list(self._sources.items()):
+                if _file_signature(path) != signature:
+                    changes = self._reload_config(config_file, path)
+                    if changes:
+                        changed[config_file] = changes
+        
+        for source, changes in changed.items():
+            self.logger.info(f"Config reloaded: {source} ({', '.join(sorted(changes))})")
+            for callback in list(self._subscribers):
+                try:
+                    callback(source, changes)
+                except Exception as e:
+                    self.logger.error(f"Config subscriber {callback!r} failed for {source}: {e}")
+        return changed
+    
+    def _reload_config(self, config_file: str, path: Path) -> Dict[str, Tuple[Any, Any]]:
+        """Re-parse one YAML file and swap it in; a broken edit keeps the old config"""
+        signature = _file_signature(path)
+        self._sources[config_file] = (path, signature)
+        if signature is None:
+            self.logger.warning(f"Config file removed, keeping last version: {path}")
+            return {}
+        
+        try:
+            config = self._compile_config(config_file, path, path.read_bytes())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Keeping previous {config_file} config: {e}")
+            return {}
+        
+        old = self._config_cache.get(config_file, {})
+        changes = _diff_configs(old, config)
+        self._indexes[id(config)] = (config, _build_index(config), {})
+        self._config_cache[config_file] = config
+        self._indexes.pop(id(old), None)
+        return changes
+    
+    def _reload_env_file(self, env_file: str) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Re-read one .env file and apply the variables that changed
+        
+        A variable is only updated while it still holds the value this file
+        set; values exported by the shell keep precedence, as on first load.
+        """
+        path, _, old_values = self._env_sources[env_file]
+        signature = _file_signature(path)
+        if signature is None:
+            self._env_sources[env_file] = (path, signature, old_values)
+            self.logger.warning(f".env file removed, keeping loaded values: {path}")
+            return {}
+        
+        try:
+            new_values = _read_env_file(path)
+        except OSError as e:
+            self.logger.warning(f"Could not reload {env_file}: {e}")
+            return {}
+        self._env_sources[env_file] = (path, signature, new_values)
+        
+        changes = {}
+        for key in old_values.keys() | new_values.keys():
+            old, new = old_values.get(key), new_values.get(key)
+            if old == new or (key in os.environ and os.environ[key] != old):
+                continue
+            if new is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = new
+            changes[key] = (old, new)
+        return changes
+    
+    def start_watching(self, interval: float = 1.0) -> None:
+        """
+        Start polling loaded files for changes on a daemon thread
+        
+        Args:
+            interval: Seconds between polls
+        """
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop, args=(float(interval),), name='ConfigWatcher', daemon=True
+        )
+        self._watch_thread.start()
+        self.logger.info(f"Watching config files every {float(interval)}s")
+    
+    def _watch_loop(self, interval: float) -> None:
+        while not self._watch_stop.wait(interval):
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                self.logger.error(f"Config watch poll failed: {e}")
+    
+    def stop_watching(self, timeout: Optional[float] = None) -> None:
+        """Stop the watcher thread started by start_watching"""
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout)
+            self._watch_thread = None
 
 
 # Global config manager instance
@@ -288,3 +966,158 @@ def load_config(config_file: str) -> Dict[str, Any]:
 def get_environment_config(env: str = None) -> Dict[str, Any]:
     """Get environment config using global ConfigManager"""
     return get_config_manager().get_environment_config(env)
+
+
+def get_config_value(config: Union[str, Dict[str, Any]], path: str, default: Any = None,
+                     type: Optional[str] = None) -> Any:
+    """
+    Get one config value by dot-path (an O(1) index hit)
+    
+    Args:
+        config: Config dict from Get Environment Config, or a config name
+        path: Dot-path, e.g. 'timeouts.browser_navigation_timeout'
+        default: Returned when the path is missing (None = required)
+        type: str, int, float, bool or duration; None returns the YAML value as-is
+    
+    Example:
+        ${nav_timeout}=    Get Config Value    ${yaml_config}    timeouts.browser_navigation_timeout
+    """
+    manager = get_config_manager()
+    if isinstance(config, str):
+        config = manager.load_config(config)
+    if default is None:
+        default = _NO_DEFAULT
+    if type:
+        return manager._get_typed(path, config, type, default)
+    value = manager.get(path, config, default)
+    if value is _NO_DEFAULT:
+        raise ValueError(f"{path} not found in config")
+    return value
+
+
+def get_config_values(config: Union[str, Dict[str, Any]], *specs: str) -> list:
+    """
+    Get several config values by dot-path in one call
+    
+    Each spec is path[:type][=default] — type is str, int, float, bool or
+    duration (seconds); without a type the YAML value is returned as-is.
+    A spec without a default is required.
+    
+    Args:
+        config: Config dict from Get Environment Config, or a config name
+        *specs: Dot-path specs
+    
+    Returns:
+        List of values in spec order
+    
+    Example:
+        ${timeout}    ${retries}    ${connect}=    Get Config Values    ${yaml_config}
+        ...    api.timeout:float    api.max_retries:int    timeouts.connect_timeout
+    """
+    manager = get_config_manager()
+    if isinstance(config, str):
+        config = manager.load_config(config)
+    return manager.get_many(config, *specs)
+
+
+def load_env_file(env_file: str) -> Dict[str, str]:
+    """
+    Parse a .env file once per process and return all its variables
+    
+    The parsed mapping is cached process-wide and re-read only when the
+    file changes. Relative names resolve against automation-framework/.
+    
+    Args:
+        env_file: Path or name, e.g. '.env.dev' or '.env.mobile.production'
+    
+    Returns:
+        Dictionary {KEY: value}
+    
+    Example:
+        ${env}=    Load Env File    .env.${TEST_ENV}
+    """
+    return dict(_read_env_file(env_file))
+
+
+def get_env_value(env_file: str, name: str, default: Any = None, type: str = 'str') -> Any:
+    """
+    Get one variable from a .env file
+    
+    Args:
+        env_file: Path or name of the .env file
+        name: Variable name
+        default: Used when the variable is missing or empty (None = required)
+        type: str, int, float or bool
+    
+    Example:
+        ${url}=    Get Env Value    .env.${TEST_ENV}    WEB_BASE_URL
+    """
+    spec = f"{name}:{type}" if default is None else f"{name}:{type}={default}"
+    return _lookup(_read_env_file(env_file), env_file, spec)[1]
+
+
+def get_env_values(env_file: str, *specs: str) -> list:
+    """
+    Get several variables from a .env file in one call
+    
+    Each spec is NAME[:type][=default] — type is str (default), int, float
+    or bool; the default applies when the variable is missing or empty.
+    A spec without a default is required.
+    
+    Args:
+        env_file: Path or name of the .env file
+        *specs: Variable specs
+    
+    Returns:
+        List of values in spec order
+    
+    Example:
+        ${url}    ${key}=    Get Env Values    .env.${TEST_ENV}
+        ...    PRIVATE_API_BASE_URL=https://indodax.com/tapi    INDODAX_API_KEY=
+    """
+    values = _read_env_file(env_file)
+    return [_lookup(values, env_file, spec)[1] for spec in specs]
+
+
+def set_suite_variables_from_env_file(env_file: str, *specs: str) -> Dict[str, Any]:
+    """
+    Set a suite variable ${NAME} for every spec, reading the file once
+    
+    Specs use the same NAME[:type][=default] syntax as Get Env Values.
+    
+    Returns:
+        Dictionary {NAME: value} of the variables set
+    
+    Example:
+        Set Suite Variables From Env File    .env.mobile.${TEST_ENV}
+        ...    APPIUM_SERVER    ANDROID_DEVICE_NAME    NO_RESET:bool=false
+    """
+    from robot.libraries.BuiltIn import BuiltIn
+    
+    values = _read_env_file(env_file)
+    resolved = dict(_lookup(values, env_file, spec) for spec in specs)
+    builtin = BuiltIn()
+    for name, value in resolved.items():
+        builtin.set_suite_variable(f"${{{name}}}", value)
+    return resolved
+
+
+def start_config_watch(interval: float = 1.0) -> None:
+    """
+    Reload changed YAML and .env files in the background (soak/long runs)
+    
+    Only files already loaded through the global ConfigManager are watched.
+    Call Get Environment Config again to read the reloaded values.
+    
+    Args:
+        interval: Seconds between polls
+    
+    Example:
+        Start Config Watch    interval=5
+    """
+    get_config_manager().start_watching(float(interval))
+
+
+def stop_config_watch() -> None:
+    """Stop the background reload started by Start Config Watch"""
+    get_config_manager().stop_watching()
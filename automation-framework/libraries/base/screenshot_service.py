@@ -0,0 +1,318 @@
+"""
+Screenshot capture pipeline shared by web and mobile suites
+
+A capture on the test thread is only the grab itself (Playwright
+page/element screenshot, Appium driver/element screenshot); re-encoding
+and disk writes run on a background writer thread. What is captured is
+decided by a policy from the env YAML's `screenshots` block:
+
+- mode: off | failure (only failing tests) | sampled (failures plus
+  sample_rate of the other captures) | always
+- format / quality: png, jpeg or webp; Playwright grabs JPEG directly in
+  the browser, other conversions (Appium PNG -> JPEG, anything -> WebP)
+  happen on the writer thread with Pillow
+- full_page, and a clip to an element or region per capture, keep the
+  image to the part that matters
+
+The writer queue is bounded (max_queue): when it is full the capture is
+dropped and counted, the test never waits on the disk. stats() reports
+test-thread blocking time (p50/p95/max/total), output size and the disk
+used by the run's screenshot directory.
+
+ScreenshotServiceLibrary registers the service it configures with
+set_screenshot_service; page objects pick it up via get_screenshot_service.
+"""
+
+import atexit
+import io
+import queue
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:  # optional dependency
+    Image = None
+
+_FRAMEWORK_DIR = Path(__file__).parent.parent.parent
+_MODES = ('off', 'failure', 'sampled', 'always')
+_FORMATS = ('png', 'jpeg', 'webp')
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class ScreenshotPolicy:
+    """
+    When and how screenshots are captured
+
+    Args:
+        mode: off | failure | sampled | always
+        sample_rate: Share of non-failure captures kept in sampled mode (0..1)
+        format: png | jpeg | webp
+        quality: JPEG / WebP quality (1..100)
+        full_page: Capture the whole scrollable page instead of the viewport (web)
+        max_queue: Pending writes before further captures are dropped
+    """
+    mode: str = 'failure'
+    sample_rate: float = 0.1
+    format: str = 'jpeg'
+    quality: int = 70
+    full_page: bool = False
+    max_queue: int = 32
+
+    def __post_init__(self):
+        if self.mode not in _MODES:
+            raise ValueError(
+                f"Screenshot mode must be one of {', '.join(_MODES)}, got '{self.mode}'")
+        if self.format not in _FORMATS:
+            raise ValueError(
+                f"Screenshot format must be one of {', '.join(_FORMATS)}, got '{self.format}'")
+        if not 0.0 <= float(self.sample_rate) <= 1.0:
+            raise ValueError(f"Screenshot sample_rate must be within 0..1, got {self.sample_rate}")
+        if not 1 <= int(self.quality) <= 100:
+            raise ValueError(f"Screenshot quality must be within 1..100, got {self.quality}")
+
+    @classmethod
+    def from_config(cls, env_config: Dict[str, Any]) -> 'ScreenshotPolicy':
+        """Build the policy from an env config's screenshots block (missing keys: defaults)"""
+        cfg = (env_config or {}).get('screenshots') or {}
+        fields = ('mode', 'sample_rate', 'format', 'quality', 'full_page', 'max_queue')
+        return cls(**{name: cfg[name] for name in fields if name in cfg})
+
+    def capture_options(self) -> Dict[str, Any]:
+        """
+        Playwright screenshot() options
+
+        JPEG is encoded by the browser; WebP is converted later from PNG.
+        """
+        if self.format == 'jpeg':
+            return {'type': 'jpeg', 'quality': int(self.quality), 'full_page': bool(self.full_page)}
+        return {'type': 'png', 'full_page': bool(self.full_page)}
+
+
+def _slug(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')[:80] or 'screenshot'
+
+
+class ScreenshotService:
+    """Policy-driven screenshots with a background writer."""
+
+    def __init__(
+        self,
+        output_dir: str = 'results/screenshots',
+        policy: Optional[ScreenshotPolicy] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Create the service; the writer thread starts with the first capture.
+
+        Args:
+            output_dir: Directory for the images (relative paths are under the framework root)
+            policy: Capture policy (default: failure-only JPEG)
+            seed: Seed for sampled mode, for reproducible runs
+        """
+        directory = Path(output_dir)
+        self.output_dir = directory if directory.is_absolute() else _FRAMEWORK_DIR / directory
+        self.policy = policy or ScreenshotPolicy()
+        self._random = random.Random(seed)
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=max(1, int(self.policy.max_queue)))
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._index = 0
+        self._blocking_ms: List[float] = []
+        self.paths: List[Path] = []
+        self.counts = {
+            'requested': 0, 'skipped': 0, 'captured': 0, 'dropped': 0, 'errors': 0, 'written': 0,
+        }
+        self.bytes_written = 0
+        self.encode_ms = 0.0
+        atexit.register(self.close)
+
+    def should_capture(self, failed: bool = False, force: bool = False) -> bool:
+        """Apply the policy to one capture request"""
+        mode = self.policy.mode
+        if force:
+            return mode != 'off'
+        if mode == 'always' or (failed and mode in ('failure', 'sampled')):
+            return True
+        return mode == 'sampled' and self._random.random() < self.policy.sample_rate
+
+    def capture(
+        self,
+        grab: Callable[[Dict[str, Any]], bytes],
+        name: str,
+        failed: bool = False,
+        force: bool = False,
+        captured_format: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Grab a screenshot on this thread and queue it for writing.
+
+        Args:
+            grab: Returns the image bytes; receives capture_options() for Playwright
+            name: File name stem
+            failed: The test (or step) failed
+            force: Capture regardless of mode unless screenshots are off (explicit screenshots)
+            captured_format: Format grab returns when it ignores the options (Appium: 'png')
+
+        Returns:
+            Path the image will be written to, or None when skipped or dropped
+        """
+        self.counts['requested'] += 1
+        if not self.should_capture(failed, force):
+            self.counts['skipped'] += 1
+            return None
+
+        started = time.perf_counter()
+        try:
+            options = self.policy.capture_options()
+            data = grab(options)
+            source = captured_format or options['type']
+            convertible = source == self.policy.format or Image is not None
+            target = self.policy.format if convertible else source
+            with self._lock:
+                self._index += 1
+                extension = 'jpg' if target == 'jpeg' else target
+                path = self.output_dir / f"{self._index:03d}_{_slug(name)}.{extension}"
+            self._ensure_writer()
+            try:
+                self._queue.put_nowait((data, source, target, path))
+            except queue.Full:
+                self.counts['dropped'] += 1
+                return None
+            self.counts['captured'] += 1
+            self.paths.append(path)
+            return path
+        except Exception:
+            self.counts['errors'] += 1
+            raise
+        finally:
+            self._blocking_ms.append((time.perf_counter() - started) * 1000)
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name='screenshot-writer', daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._write(*item)
+            except Exception:
+                self.counts['errors'] += 1
+            finally:
+                self._queue.task_done()
+
+    def _write(self, data: bytes, source: str, target: str, path: Path) -> None:
+        if source != target:
+            started = time.perf_counter()
+            image = Image.open(io.BytesIO(data))
+            buffer = io.BytesIO()
+            if target == 'png':
+                image.save(buffer, 'PNG', optimize=False)
+            else:
+                if target == 'jpeg' and image.mode not in ('RGB', 'L'):
+                    image = image.convert('RGB')
+                image.save(buffer, target.upper(), quality=int(self.policy.quality))
+            data = buffer.getvalue()
+            self.encode_ms += (time.perf_counter() - started) * 1000
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.counts['written'] += 1
+        self.bytes_written += len(data)
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Wait until every queued screenshot is written; False on timeout"""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Flush and stop the writer thread"""
+        self.flush(timeout)
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join(timeout)
+
+    def disk_usage(self) -> Tuple[int, int]:
+        """(files, bytes) currently in the output directory"""
+        if not self.output_dir.exists():
+            return 0, 0
+        sizes = [p.stat().st_size for p in self.output_dir.iterdir() if p.is_file()]
+        return len(sizes), sum(sizes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts, test-thread blocking time, output size and disk usage (after flushing)"""
+        self.flush()
+        blocking = sorted(self._blocking_ms)
+
+        def pick(pct: float) -> float:
+            if not blocking:
+                return 0.0
+            return round(blocking[min(len(blocking) - 1, int(pct * len(blocking)))], 2)
+
+        files, disk_bytes = self.disk_usage()
+        return {
+            'mode': self.policy.mode,
+            'format': self.policy.format,
+            'pillow': Image is not None,
+            **self.counts,
+            'blocking_ms': {
+                'p50': pick(0.50),
+                'p95': pick(0.95),
+                'max': round(blocking[-1], 2) if blocking else 0.0,
+                'total': round(sum(blocking), 2),
+            },
+            'encode_ms': round(self.encode_ms, 2),
+            'bytes_written': self.bytes_written,
+            'avg_kb': (round(self.bytes_written / 1024 / self.counts['written'], 1)
+                       if self.counts['written'] else 0.0),
+            'disk_files': files,
+            'disk_bytes': disk_bytes,
+            'output_dir': str(self.output_dir),
+        }
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """One log line of stats()"""
+    blocking = stats['blocking_ms']
+    return (
+        f"Screenshots [{stats['mode']}, {stats['format']}]: {stats['captured']} captured, "
+        f"{stats['skipped']} skipped, {stats['dropped']} dropped, {stats['errors']} errors | "
+        f"blocking p50 {blocking['p50']}ms p95 {blocking['p95']}ms total {blocking['total']}ms | "
+        f"encode {stats['encode_ms']}ms | {stats['bytes_written'] / 1024:.0f} KiB written "
+        f"(avg {stats['avg_kb']} KiB) | "
+        f"disk {stats['disk_files']} files, {stats['disk_bytes'] / 1048576:.1f} MiB"
+    )
+
+
+# Process-wide service shared by ScreenshotServiceLibrary and the page objects
+_screenshot_service: Optional[ScreenshotService] = None
+
+
+def get_screenshot_service() -> Optional[ScreenshotService]:
+    """The run's configured ScreenshotService, or None when none is configured"""
+    return _screenshot_service
+
+
+def set_screenshot_service(service: Optional[ScreenshotService]) -> None:
+    """Make service the one page objects created from now on use"""
+    global _screenshot_service
+    _screenshot_service = service
@@ -0,0 +1,127 @@
+"""
+Robot Framework library for a per-worker warm browser with Browser.
+
+Launches one browser per process (one pabot worker) and reuses it across
+tests and suites; every test gets a fresh context, so cookies, storage and
+permissions never leak between tests. Launch counts and setup times are
+reported so the per-test cost can be compared with New Browser per test.
+"""
+
+import time
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+
+class BrowserPoolLibrary:
+    """Robot Framework library for pooled browsers and per-test contexts."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+        self._browser_id = None
+        self._browser_options = ('chromium', True)
+        self._timings = {name: [] for name in ('browser_launch', 'context_launch', 'release')}
+
+    def _run(self, name, *args):
+        return self.builtin.run_keyword(f'Browser.{name}', *args)
+
+    def _timed(self, timing, name, *args):
+        started = time.perf_counter()
+        result = self._run(name, *args)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._timings[timing].append(elapsed_ms)
+        return result, elapsed_ms
+
+    def _browser_alive(self):
+        return self._browser_id is not None and self._browser_id in (self._run('Get Browser Ids') or [])
+
+    @keyword('Start Browser Pool')
+    def start_browser_pool(self, browser='chromium', headless=True):
+        """
+        Launch the worker's browser unless it is already running.
+
+        Args:
+            browser: chromium, firefox or webkit
+            headless: Run headless (default: True)
+
+        Example:
+            Start Browser Pool    chromium    headless=${HEADLESS}
+        """
+        options = (browser, str(headless).lower() != 'false')
+        if self._browser_alive() and options == self._browser_options:
+            self._run('Switch Browser', self._browser_id)
+            self.builtin.log(f'Reusing pooled browser {self._browser_id}', 'INFO')
+            return self._browser_id
+
+        self._browser_id, elapsed_ms = self._timed(
+            'browser_launch', 'New Browser', browser, f'headless={options[1]}')
+        self._browser_options = options
+        self.builtin.log(f'Launched pooled {browser} browser in {elapsed_ms:.0f}ms', 'INFO')
+        return self._browser_id
+
+    @keyword('Acquire Pooled Page')
+    def acquire_pooled_page(self, url=None):
+        """
+        Open a fresh context and page on the pooled browser.
+
+        Starts the pool with default arguments if Start Browser Pool was not
+        called, or relaunches the browser if it was closed.
+
+        Args:
+            url: Optional URL to open in the new page
+
+        Example:
+            Acquire Pooled Page
+        """
+        if not self._browser_alive():
+            self.start_browser_pool(*self._browser_options)
+        else:
+            self._run('Switch Browser', self._browser_id)
+
+        started = time.perf_counter()
+        context_id = self._run('New Context')
+        self._run('New Page', *((url,) if url else ()))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._timings['context_launch'].append(elapsed_ms)
+        self.builtin.log(f'Pooled context ready in {elapsed_ms:.0f}ms', 'INFO')
+        return context_id
+
+    @keyword('Release Pooled Page')
+    def release_pooled_page(self):
+        """
+        Close the current test's context; the pooled browser stays open.
+
+        Closing the context discards its cookies, storage, permissions and pages.
+        """
+        try:
+            self._timed('release', 'Close Context')
+        except Exception as e:
+            self.builtin.log(f'Context already closed: {e}', 'DEBUG')
+
+    @keyword('Get Browser Pool Stats')
+    def get_browser_pool_stats(self):
+        """
+        Get launch counts and timings.
+
+        Returns:
+            Dictionary {browser_launch|context_launch|release: {count, avg_ms, max_ms}}
+        """
+        return {
+            name: {
+                'count': len(samples),
+                'avg_ms': sum(samples) / len(samples) if samples else 0.0,
+                'max_ms': max(samples, default=0.0),
+            }
+            for name, samples in self._timings.items()
+        }
+
+    @keyword('Log Browser Pool Stats')
+    def log_browser_pool_stats(self):
+        """Log browser/context launch counts and average times."""
+        for name, stats in self.get_browser_pool_stats().items():
+            self.builtin.log(
+                'Browser pool [{}]: {count} × avg {avg_ms:.0f}ms (max {max_ms:.0f}ms)'.format(name, **stats),
+                'INFO'
+            )
@@ -0,0 +1,62 @@
+"""
+Robot Framework library for batched DOM text reads with Browser.
+
+Reads several locators in one Evaluate JavaScript call (see dom_snapshot)
+instead of one Get Text round trip per element.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import timestr_to_secs
+from dom_snapshot import SNAPSHOT_SCRIPT, collect_snapshot
+
+
+class DomSnapshotLibrary:
+    """Robot Framework library for single-round-trip page snapshots."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+
+    def _evaluate(self, specs):
+        browser = self.builtin.get_library_instance('Browser')
+        return browser.evaluate_javascript(None, SNAPSHOT_SCRIPT, arg=specs)
+
+    @keyword('Get Text Snapshot')
+    def get_text_snapshot(self, timeout='10s', allow_missing=False, **locators):
+        """
+        Get the text of several elements in one browser round trip.
+
+        Polls until every locator matches or the timeout expires. Like a
+        strict Get Text, each locator must match a single element and the
+        text is its trimmed innerText.
+
+        Args:
+            timeout: Time to wait for locators that match nothing yet
+            allow_missing: Return None for unmatched locators instead of failing
+            **locators: name=locator pairs (css=, xpath= or id= selectors)
+
+        Returns:
+            Dictionary {name: text}
+
+        Raises:
+            AssertionError: If a locator matched nothing within timeout
+            Error: If a locator matched more than one element
+
+        Example:
+            ${snapshot}=    Get Text Snapshot
+            ...    price=${CURRENT_PRICE_LOCATOR}    bid=${BID_PRICE_LOCATOR}
+        """
+        if not locators:
+            raise ValueError('Get Text Snapshot needs at least one name=locator pair')
+
+        values = collect_snapshot(self._evaluate, locators, timestr_to_secs(timeout))
+        missing = [name for name, text in values.items() if text is None]
+        if missing and str(allow_missing).lower() != 'true':
+            raise AssertionError(
+                'Snapshot locator(s) not found within {}: {}'.format(
+                    timeout, ', '.join(f"{name}={locators[name]}" for name in missing))
+            )
+        self.builtin.log(f'Text snapshot: {values}', 'DEBUG')
+        return values
@@ -0,0 +1,132 @@
+"""
+Robot Framework library for selector profiling with Browser.
+
+Times how long each locator takes to resolve in the page and how many
+nodes it matches, keeps a per-locator history across runs and learns
+faster CSS equivalents (id, data attribute, tight path) from the live
+DOM. The equivalents are validated against every loaded page before they
+are handed out (see locator_profiler).
+"""
+
+import sys
+from pathlib import Path
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+
+# locator_profiler imports its siblings by package path from the framework root
+_FRAMEWORK_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if _FRAMEWORK_DIR not in sys.path:
+    sys.path.insert(0, _FRAMEWORK_DIR)
+
+from libraries.web.locator_profiler import (  # noqa: E402
+    SIGNATURE_SCRIPT, VALIDATE_SCRIPT, LocatorCache, format_profiles, page_signature,
+    profile_locators
+)
+
+
+class LocatorProfilerLibrary:
+    """Robot Framework library for locator timings and the stable-locator cache."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self, cache_path='results/locators/locator_cache.json'):
+        self.builtin = BuiltIn()
+        self.cache = LocatorCache(cache_path)
+
+    def _browser(self):
+        return self.builtin.get_library_instance('Browser')
+
+    def _signature(self):
+        return page_signature(self._browser().evaluate_javascript(None, SIGNATURE_SCRIPT))
+
+    @keyword('Profile Locators')
+    def profile_locators(self, repeat=20, **locators):
+        """
+        Time the resolution of several locators on the current page.
+
+        CSS, xpath and id= locators are timed inside the page in one call;
+        Playwright-only ones (text=, :has-text()) by a Get Element Count
+        round trip. Faster equivalents are learnt and the cache file saved.
+
+        Args:
+            repeat: Resolutions averaged per locator
+            **locators: name=locator pairs
+
+        Returns:
+            List of dictionaries {name, locator, engine, count, resolve_ms,
+            stable, stable_ms, fingerprint, speedup}
+
+        Example:
+            ${profiles}=    Profile Locators
+            ...    price=${CURRENT_PRICE_LOCATOR}    bid=${BID_PRICE_LOCATOR}
+        """
+        if not locators:
+            raise ValueError('Profile Locators needs at least one name=locator pair')
+
+        browser = self._browser()
+        profiles = profile_locators(
+            lambda script, arg: browser.evaluate_javascript(None, script, arg=arg),
+            lambda selector, script: browser.evaluate_javascript(
+                selector, script, all_elements=True),
+            browser.get_element_count,
+            locators,
+            int(repeat)
+        )
+        learnt = self.cache.record(profiles, self._signature())
+        path = self.cache.save()
+
+        self.builtin.log(f'Locator profile:\n{format_profiles(profiles)}', 'INFO')
+        self.builtin.log(f'Learnt {len(learnt)} stable locator(s): {learnt}; cache: {path}', 'INFO')
+        return [profile.as_dict() for profile in profiles]
+
+    @keyword('Sync Locator Cache')
+    def sync_locator_cache(self):
+        """
+        Validate cached equivalents against the current page.
+
+        Everything is dropped when the page's script/stylesheet bundle
+        changed; otherwise equivalents whose match count or element
+        fingerprint drifted are dropped. Call after navigation.
+
+        Returns:
+            Locators whose equivalent was dropped
+        """
+        browser = self._browser()
+        dropped = self.cache.sync(
+            self._signature(),
+            lambda entries: browser.evaluate_javascript(None, VALIDATE_SCRIPT, arg=entries)
+        )
+        if dropped:
+            self.cache.save()
+            self.builtin.log(f'Dropped stale stable locator(s): {dropped}', 'INFO')
+        return dropped
+
+    @keyword('Get Stable Locator')
+    def get_stable_locator(self, locator):
+        """
+        Return the cached faster equivalent of a locator, or the locator itself.
+
+        Example:
+            ${price}=    Get Stable Locator    ${CURRENT_PRICE_LOCATOR}
+            Get Text    ${price}
+        """
+        return self.cache.lookup(locator)
+
+    @keyword('Drop Stable Locator')
+    def drop_stable_locator(self, locator):
+        """Forget a locator's equivalent, e.g. after it failed; profiling re-learns it."""
+        self.cache.invalidate(locator)
+        self.cache.save()
+
+    @keyword('Log Locator Cache Stats')
+    def log_locator_cache_stats(self):
+        """Log cache hits, misses, fallbacks and drops, and each locator's median resolve time."""
+        lines = [f'Locator cache: {len(self.cache.entries)} entries, {self.cache.stats}']
+        for locator in self.cache.history:
+            runs, median_ms = self.cache.trend(locator)
+            entry = self.cache.entries.get(locator)
+            lines.append(f'  {locator}: {runs} run(s), median {median_ms:.4f} ms'
+                         + (f" -> {entry['stable']}" if entry else ''))
+        self.builtin.log('\n'.join(lines), 'INFO')
+        return dict(self.cache.stats)
@@ -0,0 +1,98 @@
+"""
+Robot Framework library for concurrent multi-pair market sweeps.
+
+Drives AsyncIndodaxMarketPage from one asyncio event loop: every pair
+loads in its own browser context, a bounded number at a time, so a sweep
+over all pairs takes about as long as the slowest single pair.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import timestr_to_secs
+
+# Page objects import by package path from the framework root
+_FRAMEWORK_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if _FRAMEWORK_DIR not in sys.path:
+    sys.path.insert(0, _FRAMEWORK_DIR)
+
+from resources.page_objects.web.async_indodax_usdtidr_market_page import sweep_trading_pairs  # noqa: E402
+
+
+class MarketSweepLibrary:
+    """Robot Framework library for bounded-concurrency market page sweeps."""
+
+    ROBOT_LIBRARY_SCOPE = 'SUITE'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+        # One loop per library instance (see IndodaxAsyncClientLibrary)
+        self._loop = None
+
+    def _run(self, coroutine):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    def _route_rules(self):
+        """Rules from Configure Network Routes, if NetworkRoutesLibrary is in use."""
+        try:
+            return self.builtin.get_library_instance('NetworkRoutesLibrary').rules
+        except RuntimeError:
+            return None
+
+    @keyword('Sweep Market Pairs')
+    def sweep_market_pairs(self, pairs, base_url, max_concurrency=4, browser='chromium',
+                           headless=True, load_timeout='10s'):
+        """
+        Collect trading pair info for many pairs concurrently.
+
+        Network routes from Configure Network Routes (if called) are
+        applied to every context.
+
+        Args:
+            pairs: List of pair ids, or the pairs dict of test_data/api/base.json
+                   (btc_idr / btcidr both work)
+            base_url: Site root (e.g. ${WEB_BASE_URL})
+            max_concurrency: Pages loading at once
+            browser: chromium, firefox or webkit
+            headless: Run headless (default: True)
+            load_timeout: Time to wait for each page's price element
+
+        Returns:
+            List of dictionaries {pair, elapsed_ms, error, current_price,
+            price_change_24h, volume_24h, market_cap, bid, ask}, in input order
+
+        Example:
+            ${results}=    Sweep Market Pairs    ${BASE_DATA}[pairs]    ${WEB_BASE_URL}    max_concurrency=4
+        """
+        pairs = list(pairs.keys()) if isinstance(pairs, dict) else list(pairs)
+        if not pairs:
+            raise ValueError('Sweep Market Pairs needs at least one pair')
+
+        started = time.perf_counter()
+        results = self._run(sweep_trading_pairs(
+            pairs,
+            base_url=base_url,
+            max_concurrency=int(max_concurrency),
+            browser_type=browser,
+            launch_options={'headless': str(headless).lower() != 'false'},
+            routes=self._route_rules(),
+            load_timeout=int(timestr_to_secs(load_timeout) * 1000),
+        ))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        slowest = max(result.elapsed_ms for result in results)
+        self.builtin.log(
+            f'Swept {len(results)} pairs in {elapsed_ms:.0f}ms (slowest pair {slowest:.0f}ms, '
+            f'max_concurrency={max_concurrency})',
+            'INFO'
+        )
+        for result in results:
+            status = f'ERROR {result.error}' if result.error else f'price={result.info.current_price or "n/a"}'
+            self.builtin.log(f'  {result.pair}: {status} ({result.elapsed_ms:.0f}ms)', 'INFO')
+        return [result.as_dict() for result in results]
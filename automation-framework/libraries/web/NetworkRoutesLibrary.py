@@ -0,0 +1,85 @@
+"""
+Robot Framework library for declarative network routing with Browser.
+
+Compiles web.routing / web.har from the env YAML once per suite and
+installs them on each new browser context through the network_routes.js
+Browser extension; reports transferred bytes and load time per test.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from network_routes import NETWORK_SUMMARY_SCRIPT, RouteRules, summarise
+
+
+class NetworkRoutesLibrary:
+    """Robot Framework library for resource blocking, stubs and HAR replay."""
+
+    ROBOT_LIBRARY_SCOPE = 'SUITE'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+        self.rules = None
+        self._rules_json = None
+
+    @keyword('Configure Network Routes')
+    def configure_network_routes(self, env_config):
+        """
+        Compile routing rules from the environment YAML.
+
+        Reads web.routing (block_resource_types, block_urls, stubs) and
+        web.har (mode: off/record/replay, path, not_found). Missing blocks
+        mean no routing.
+
+        Args:
+            env_config: Environment config dict (from Get Environment Config)
+
+        Example:
+            ${yaml_config}=    Get Environment Config    ${TEST_ENV}
+            Configure Network Routes    ${yaml_config}
+        """
+        self.rules = RouteRules.from_config(env_config if isinstance(env_config, dict) else {})
+        self._rules_json = self.rules.to_json()
+        self.builtin.log(
+            'Network routes: {} resource types, {} URL blocks, {} stubs, HAR {}'.format(
+                len(self.rules.block_resource_types), len(self.rules.block_urls),
+                len(self.rules.stubs), self.rules.har_mode),
+            'INFO'
+        )
+
+    @keyword('Apply Network Routes')
+    def apply_network_routes(self):
+        """
+        Install the configured rules on the current browser context.
+
+        Call right after the context is created and before navigating.
+        Does nothing when Configure Network Routes found no rules.
+        """
+        if self.rules is None or (not self.rules.has_routes and self.rules.har_mode == 'off'):
+            return
+        self.builtin.run_keyword('Browser.Install Route Rules', self._rules_json)
+
+    @keyword('Get Page Network Summary')
+    def get_page_network_summary(self):
+        """
+        Get transferred bytes, resource count and load timings of the current page.
+
+        Byte counts come from the Performance API (cross-origin resources
+        without Timing-Allow-Origin report 0).
+
+        Returns:
+            Dictionary {transferred_bytes, resources, dom_content_loaded_ms,
+            load_ms, blocked, stubbed, passed}
+        """
+        summary = dict(self.builtin.run_keyword('Browser.Evaluate JavaScript', None, NETWORK_SUMMARY_SCRIPT))
+        if self.rules is not None and self.rules.has_routes:
+            summary.update(self.builtin.run_keyword('Browser.Get Route Rule Stats'))
+        return summary
+
+    @keyword('Log Page Network Summary')
+    def log_page_network_summary(self):
+        """Log the current page's transferred bytes, load time and routing counts."""
+        summary = self.get_page_network_summary()
+        stats = {k: summary[k] for k in ('blocked', 'stubbed', 'passed')} if 'blocked' in summary else None
+        for line in summarise(summary, stats):
+            self.builtin.log(line, 'INFO')
+        return summary
@@ -0,0 +1,104 @@
+"""
+Robot Framework library for web performance budgets with Browser.
+
+Collects Navigation Timing, LCP, long tasks, JS heap and transferred bytes
+from the current page (plus CDP counters in Chromium via the
+performance_metrics.js Browser extension), checks them against
+web.performance_budget from the env YAML and appends every result to a
+machine-readable JSON report for the run.
+"""
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from performance_budget import (
+    PERFORMANCE_SCRIPT, PerformanceBudget, PerformanceReport, merge_cdp_metrics, summarise
+)
+
+
+class PerformanceBudgetLibrary:
+    """Robot Framework library for page performance budgets and reports."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+        self.budget = PerformanceBudget()
+        self.report = None
+        self._report_options = ('results/performance', '')
+
+    @keyword('Configure Performance Budget')
+    def configure_performance_budget(self, env_config, environment='', report_dir=None):
+        """
+        Load the performance budget from the environment YAML.
+
+        Reads web.performance_budget ({max_<metric>|min_<metric>: limit}) and
+        web.performance_report_dir (default results/performance). One report
+        file is written per run and worker process.
+
+        Args:
+            env_config: Environment config dict (from Get Environment Config)
+            environment: Environment name recorded in the report
+            report_dir: Override for web.performance_report_dir
+
+        Example:
+            Configure Performance Budget    ${yaml_config}    environment=${TEST_ENV}
+        """
+        env_config = env_config if isinstance(env_config, dict) else {}
+        self.budget = PerformanceBudget.from_config(env_config)
+        web_cfg = env_config.get('web') or {}
+        report_dir = report_dir or web_cfg.get('performance_report_dir') or 'results/performance'
+        options = (report_dir, environment)
+        if options != self._report_options:
+            self._report_options = options
+            self.report = None
+        self.builtin.log(f'Performance budget: {self.budget.thresholds or "none"}', 'INFO')
+
+    @keyword('Get Page Performance Metrics')
+    def get_page_performance_metrics(self):
+        """
+        Get load and runtime metrics of the current page.
+
+        Returns:
+            Dictionary {ttfb_ms, dom_content_loaded_ms, load_ms, lcp_ms,
+            long_tasks, long_task_total_ms, total_blocking_ms, js_heap_mb,
+            transferred_kb, resources} plus CDP counters in Chromium; None
+            for metrics the browser does not report
+        """
+        metrics = self.builtin.run_keyword('Browser.Evaluate JavaScript', None, PERFORMANCE_SCRIPT)
+        cdp = self.builtin.run_keyword('Browser.Get Cdp Performance Metrics')
+        return merge_cdp_metrics(metrics, cdp)
+
+    @keyword('Page Should Meet Performance Budget')
+    def page_should_meet_performance_budget(self, name='page'):
+        """
+        Check the current page's metrics against the configured budget.
+
+        The result is appended to the run's JSON report whether it passes or not.
+
+        Args:
+            name: Label of this measurement in the report (e.g. market_usdtidr)
+
+        Returns:
+            The metrics dictionary
+
+        Raises:
+            AssertionError: If any budget is exceeded
+
+        Example:
+            Page Should Meet Performance Budget    market_usdtidr
+        """
+        metrics = self.get_page_performance_metrics()
+        violations, skipped = self.budget.check(metrics)
+        if self.report is None:
+            self.report = PerformanceReport(*self._report_options)
+        url = self.builtin.run_keyword('Browser.Get Url')
+        path = self.report.add(name, url, metrics, self.budget, violations, skipped)
+
+        self.builtin.log(f'Performance [{name}]: {summarise(metrics)}', 'INFO')
+        if skipped:
+            self.builtin.log(f'Not reported by this browser: {", ".join(skipped)}', 'INFO')
+        self.builtin.log(f'Performance report: {path}', 'INFO')
+        if violations:
+            raise AssertionError(
+                f'Performance budget exceeded for {name}: ' + '; '.join(violations))
+        return metrics
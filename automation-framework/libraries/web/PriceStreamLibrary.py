@@ -0,0 +1,163 @@
+"""
+Robot Framework library for WebSocket price-stream assertions with Browser.
+
+The price_stream.js Browser extension buffers the page's WebSocket frames;
+this library waits for them without polling the DOM, decodes them with
+price_stream.PriceStream and reports update rate and inter-message gaps.
+"""
+
+import time
+from dataclasses import asdict
+
+from robot.api.deco import keyword
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import timestr_to_secs
+from dom_snapshot import SNAPSHOT_SCRIPT, collect_snapshot
+from price_stream import PriceStream, bid_ask_mismatches, summarise
+
+
+class PriceStreamLibrary:
+    """Robot Framework library for event-driven market data waits."""
+
+    ROBOT_LIBRARY_SCOPE = 'SUITE'
+
+    def __init__(self):
+        self.builtin = BuiltIn()
+        self.stream = None
+        self._seq = 0
+
+    def _require_stream(self):
+        if self.stream is None:
+            raise AssertionError(
+                'Price stream not started (call Start Price Stream before navigating)')
+        return self.stream
+
+    def _fetch(self, timeout_s, count=1):
+        """Block until count new frames arrive (or timeout) and decode them; count 0 only drains."""
+        result = self.builtin.run_keyword(
+            'Browser.Wait For Stream Frames', self._seq, int(count), int(timeout_s * 1000), '')
+        for frame in result['frames']:
+            self.stream.feed(frame['payload'], frame['received_ms'])
+        self._seq = result['seq']
+        self.stream.sockets = result['sockets']
+
+    @keyword('Start Price Stream')
+    def start_price_stream(self, capacity=1000, pair=None):
+        """
+        Start capturing the current page's WebSocket frames.
+
+        Call after the page is created and before navigating, so the
+        market sockets opened on load are captured.
+
+        Args:
+            capacity: Frames / updates kept in the ring buffers
+            pair: Keep only this pair's updates (e.g. usdtidr); default all
+
+        Example:
+            Acquire Pooled Page
+            Start Price Stream    pair=usdtidr
+            Go To    ${url}
+        """
+        self.stream = PriceStream(int(capacity), pair or None)
+        self._seq = 0
+        self.builtin.run_keyword('Browser.Start Frame Capture', int(capacity))
+
+    @keyword('Wait For Stream Updates')
+    def wait_for_stream_updates(self, count=1, within='10s', kind='ticker'):
+        """
+        Wait until N updates arrive on the price stream within T.
+
+        Returns as soon as the updates have arrived; nothing is polled in
+        the page while waiting.
+
+        Args:
+            count: Updates to wait for
+            within: Time limit (Robot time string)
+            kind: ticker, orderbook, trade, or any
+
+        Returns:
+            List of updates {index, received_ms, kind, channel, pair, price, bid, ask,
+            side, server_ms}
+
+        Raises:
+            AssertionError: If fewer than count updates arrived within the time
+
+        Example:
+            Wait For Stream Updates    3    within=15s    kind=ticker
+        """
+        stream = self._require_stream()
+        kind = None if str(kind).lower() == 'any' else kind
+        # Frames buffered in the page before this call are not new updates:
+        # decode them first and count from there
+        self._fetch(0, count=0)
+        since = stream.last_index
+        updates = stream.wait_for_updates(
+            int(count), timestr_to_secs(within), kind, pump=self._fetch, since=since)
+        self.builtin.log(f'{len(updates)} {kind or "stream"} update(s) received', 'INFO')
+        return [asdict(update) for update in updates]
+
+    @keyword('Stream Bid Ask Should Match Page')
+    def stream_bid_ask_should_match_page(self, bid_locator, ask_locator, tolerance=0, timeout='10s',
+                                         decimal=','):
+        """
+        Assert the page shows the bid/ask of the latest order-book push.
+
+        The DOM renders a push shortly after it arrives, so the comparison
+        is repeated after each new frame until it matches or timeout expires.
+
+        Args:
+            bid_locator: Locator of the best bid text
+            ask_locator: Locator of the best ask text
+            tolerance: Allowed absolute price difference
+            timeout: Time to wait for a consistent state
+            decimal: Decimal separator of the page's numbers
+
+        Returns:
+            Dictionary {bid, ask} as streamed
+
+        Example:
+            Stream Bid Ask Should Match Page    ${BID_PRICE_LOCATOR}    ${ASK_PRICE_LOCATOR}
+        """
+        stream = self._require_stream()
+        locators = {'bid': bid_locator, 'ask': ask_locator}
+
+        def evaluate(specs):
+            return self.builtin.run_keyword(
+                'Browser.Evaluate JavaScript', None, SNAPSHOT_SCRIPT, specs)
+
+        deadline = time.monotonic() + timestr_to_secs(timeout)
+        while True:
+            update = stream.latest('orderbook')
+            texts = collect_snapshot(evaluate, locators, 0)
+            problems = bid_ask_mismatches(
+                update, texts['bid'], texts['ask'], float(tolerance), decimal)
+            if not problems:
+                self.builtin.log(
+                    f'✓ Page bid/ask match stream: {update.bid:g} / {update.ask:g}', 'INFO')
+                return {'bid': update.bid, 'ask': update.ask}
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AssertionError(
+                    f"Page bid/ask differ from price stream after {timeout}: {'; '.join(problems)}")
+            self._fetch(remaining)
+
+    @keyword('Get Price Stream Stats')
+    def get_price_stream_stats(self):
+        """
+        Get update counts, rates and latency distributions of the stream.
+
+        Returns:
+            Dictionary {frames, sockets, updates, dropped, rate_per_s, gap_ms, lag_ms}
+            (see PriceStream.get_stats)
+        """
+        return self._require_stream().get_stats()
+
+    @keyword('Log Price Stream Stats')
+    def log_price_stream_stats(self):
+        """Log update rate, inter-message gaps and server lag per stream kind."""
+        if self.stream is None:
+            return None
+        stats = self.stream.get_stats()
+        for line in summarise(stats):
+            self.builtin.log(line, 'INFO')
+        return stats
@@ -0,0 +1,335 @@
+"""
+Per-action latency tracing for page objects
+
+Every traced page-object action (click, fill_text, wait_for_selector,
+navigate_to, ...) adds its duration to a histogram keyed by
+(action, selector). Recording is a perf_counter() pair and one bisect;
+nothing is formatted unless a message will actually be emitted:
+
+- trace lines go out at DEBUG, only when the logger allows DEBUG and the
+  call is sampled (sample_rate)
+- actions slower than slow_ms are always logged at WARNING
+- summary() / export() report count, errors and p50/p95/max per action
+  and selector, sorted by total time, so slow selectors and waits stand out
+
+Histogram buckets grow geometrically (x1.25 from 0.1ms), so percentiles
+are bucket upper bounds: within 25% of the true value, never above max.
+
+Page objects share one tracer per process (get_action_tracer, called by
+BasePage / AsyncBasePage). When the process exits it writes its histograms
+to results/action_trace_<pid>.json, so every pabot worker keeps its own
+file; merge_worker_exports() combines them into results/action_trace.json
+(make merge-reports). ACTION_TRACE_FILE overrides the merged path (worker
+files go next to it), an empty value disables the export.
+"""
+
+import atexit
+import bisect
+import functools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+_FRAMEWORK_DIR = Path(__file__).parent.parent.parent
+DEFAULT_EXPORT_PATH = 'results/action_trace.json'
+
+# 0.1ms .. ~17 minutes
+_BUCKET_BOUNDS_MS = tuple(0.1 * 1.25 ** i for i in range(72))
+
+
+class _Histogram:
+    """Bucketed duration distribution of one (action, selector)"""
+
+    __slots__ = ('buckets', 'count', 'errors', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.buckets = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, elapsed_ms: float, failed: bool) -> None:
+        self.buckets[bisect.bisect_left(_BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.errors += failed
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, pct: float) -> float:
+        rank = max(1, int(pct * self.count + 0.5))
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS_MS[index] if index < len(_BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def merge(self, exported: Dict[str, Any]) -> None:
+        """Add the counts of an exported row (see ActionTracer.export)"""
+        for index, n in exported['buckets'].items():
+            self.buckets[int(index)] += n
+        self.count += exported['count']
+        self.errors += exported['errors']
+        self.total_ms += exported['total_ms']
+        self.max_ms = max(self.max_ms, exported['max_ms'])
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'p50_ms': round(self.percentile(0.5), 2),
+            'p95_ms': round(self.percentile(0.95), 2),
+            'max_ms': round(self.max_ms, 2),
+            'total_ms': round(self.total_ms, 2),
+        }
+
+
+class ActionTracer:
+    """Per-action, per-selector duration histograms with lazy trace logging."""
+
+    def __init__(self, sample_rate: float = 1.0, slow_ms: Optional[float] = None):
+        """
+        Initialize an empty tracer.
+
+        Args:
+            sample_rate: Share of actions (0..1) that emit a DEBUG trace line
+                         when DEBUG is enabled; durations are always recorded
+            slow_ms: Log actions slower than this at WARNING (None: never)
+        """
+        if not 0.0 <= float(sample_rate) <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.sample_rate = float(sample_rate)
+        self.slow_ms = float(slow_ms) if slow_ms is not None else None
+        self._histograms: Dict[Tuple[str, str], _Histogram] = {}
+        self._lock = threading.Lock()
+        self._export_paths: set = set()
+
+    def record(
+        self,
+        action: str,
+        selector: str,
+        started: float,
+        logger: Optional[logging.Logger] = None,
+        failed: bool = False
+    ) -> float:
+        """
+        Add one action's duration.
+
+        Args:
+            action: Action name, e.g. 'click'
+            selector: Selector / URL the action targeted ('' if none)
+            started: time.perf_counter() taken before the action
+            logger: Logger for trace and slow-action lines
+            failed: The action raised
+
+        Returns:
+            Elapsed milliseconds
+        """
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        key = (action, selector)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.add(elapsed_ms, failed)
+
+        if logger is not None:
+            if self.slow_ms is not None and elapsed_ms >= self.slow_ms:
+                logger.warning("Slow %s %r: %.1fms (threshold %.0fms)",
+                               action, selector, elapsed_ms, self.slow_ms)
+            elif logger.isEnabledFor(logging.DEBUG) and (
+                    self.sample_rate >= 1.0 or random.random() < self.sample_rate):
+                logger.debug("trace %s %r %.1fms%s",
+                             action, selector, elapsed_ms, " FAILED" if failed else "")
+        return elapsed_ms
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Latency summary, slowest total first.
+
+        Returns:
+            List of {action, selector, count, errors, p50_ms, p95_ms, max_ms, total_ms}
+        """
+        with self._lock:
+            rows = [
+                {'action': action, 'selector': selector, **histogram.as_dict()}
+                for (action, selector), histogram in self._histograms.items()
+            ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def format_summary(self, limit: int = 20) -> List[str]:
+        """Human-readable lines for the slowest `limit` entries of summary()"""
+        return [
+            '{action:<22} {count:>6} × p50 {p50_ms:>8.1f}ms  p95 {p95_ms:>8.1f}ms  '
+            'max {max_ms:>8.1f}ms  errors {errors:<3} {selector}'.format(**row)
+            for row in self.summary()[:limit]
+        ]
+
+    def export(self, path: str) -> Path:
+        """Write summary() plus the bucket counts (for merging) as JSON and return the file path"""
+        with self._lock:
+            buckets = {
+                key: {str(i): n for i, n in enumerate(histogram.buckets) if n}
+                for key, histogram in self._histograms.items()
+            }
+        rows = [
+            dict(row, buckets=buckets[(row['action'], row['selector'])]) for row in self.summary()
+        ]
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps({'pid': os.getpid(), 'actions': rows}, indent=2))
+        return target
+
+    def load(self, path: str) -> None:
+        """Add the histograms of an export() file to this tracer"""
+        for row in json.loads(Path(path).read_text())['actions']:
+            key = (row['action'], row['selector'])
+            with self._lock:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = _Histogram()
+                histogram.merge(row)
+
+    def export_at_exit(self, path: str) -> None:
+        """Export the summary to path when the process exits (registered once per path)"""
+        if path in self._export_paths:
+            return
+        self._export_paths.add(path)
+        atexit.register(self.export, path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+def _selector_key(args: Tuple, keyed: bool) -> str:
+    return args[0] if keyed and args and isinstance(args[0], str) else ''
+
+
+def traced(action: str, keyed: bool = True) -> Callable:
+    """
+    Decorator for page-object methods: record duration under `action`
+
+    The selector key is the first positional argument when it is a string.
+    Pass keyed=False for actions whose first argument is not a bounded
+    selector (file names, free text), so they get one histogram.
+    The instance must provide `tracer` (ActionTracer) and `logger`.
+    """
+    def decorate(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = method(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.tracer.record(action, _selector_key(args, keyed), started, self.logger, failed)
+        return wrapper
+    return decorate
+
+
+def traced_async(action: str, keyed: bool = True) -> Callable:
+    """traced() for coroutine methods of async page objects"""
+    def decorate(method: Callable) -> Callable:
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            failed = True
+            try:
+                result = await method(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.tracer.record(action, _selector_key(args, keyed), started, self.logger, failed)
+        return wrapper
+    return decorate
+
+
+def _export_path() -> str:
+    return os.getenv('ACTION_TRACE_FILE', str(_FRAMEWORK_DIR / DEFAULT_EXPORT_PATH))
+
+
+def worker_export_path(path: str, pid: Optional[int] = None) -> Path:
+    """This process's file for the merged export path: <stem>_<pid><suffix>"""
+    target = Path(path)
+    return target.with_name(f"{target.stem}_{pid or os.getpid()}{target.suffix}")
+
+
+def merge_worker_exports(
+    path: Optional[str] = None,
+    worker_files: Iterable[str] = ()
+) -> Optional[Path]:
+    """
+    Merge the per-process exports into one summary file
+
+    Args:
+        path: Merged file (default: ACTION_TRACE_FILE or results/action_trace.json)
+        worker_files: Files to merge (default: every <stem>_<pid><suffix> next to path)
+
+    Returns:
+        The merged file, or None when exporting is disabled or there is nothing to merge
+    """
+    path = path if path is not None else _export_path()
+    if not path:
+        return None
+    target = Path(path)
+    files = list(worker_files) or sorted(
+        f for f in target.parent.glob(f"{target.stem}_*{target.suffix}")
+        if f.stem[len(target.stem) + 1:].isdigit()
+    )
+    if not files:
+        return None
+    merged = ActionTracer()
+    for file in files:
+        merged.load(file)
+    return merged.export(str(target))
+
+
+# Process-wide tracer shared by all page objects
+_action_tracer = None
+
+
+def get_action_tracer(**options) -> ActionTracer:
+    """
+    Get or create the global ActionTracer instance
+
+    Options (ActionTracer arguments) apply on creation; the new tracer is
+    exported at exit (see the module docstring).
+
+    Raises:
+        ValueError: If options differ from those of the existing tracer
+    """
+    global _action_tracer
+
+    if _action_tracer is None:
+        _action_tracer = ActionTracer(**options)
+        export_path = _export_path()
+        if export_path:
+            _action_tracer.export_at_exit(str(worker_export_path(export_path)))
+    elif options:
+        requested = ActionTracer(**options)
+        conflicts = [
+            f"{name}={getattr(requested, name)!r} (current {getattr(_action_tracer, name)!r})"
+            for name in options if getattr(requested, name) != getattr(_action_tracer, name)
+        ]
+        if conflicts:
+            raise ValueError(
+                f"Action tracer already created with other options: {', '.join(conflicts)}")
+
+    return _action_tracer
+
+
+if __name__ == '__main__':
+    merged_path = merge_worker_exports(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"Action trace: {merged_path or 'no worker exports found'}")
@@ -0,0 +1,193 @@
+"""
+Warm browser / context pool for Playwright page objects
+
+Browser launch costs seconds; a new BrowserContext on an already running
+browser costs tens of milliseconds and starts with empty storage, cookies
+and permissions. The pool launches its browsers once per process (one pabot
+worker) and hands every test a fresh context:
+
+- acquire() returns a pre-warmed (context, page) when one is ready
+- release() closes the used context and immediately warms the next one,
+  so the cost lands between tests instead of in the next test's setup
+
+Playwright's sync API is bound to the thread that started it, so warming
+runs on that thread right after release rather than on a helper thread.
+"""
+
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+
+from libraries.web.network_routes import RouteRules
+
+
+class _Timings:
+    """Count and duration summary for one pool operation"""
+
+    __slots__ = ('count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, started: float) -> float:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        return elapsed_ms
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms,
+            'total_ms': self.total_ms,
+        }
+
+
+class BrowserPool:
+    """Per-process pool of launched browsers handing out fresh contexts."""
+
+    def __init__(
+        self,
+        browser_type: str = 'chromium',
+        size: int = 1,
+        launch_options: Optional[Dict[str, Any]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        prewarm: bool = True,
+        playwright: Optional[Playwright] = None,
+        routes: Optional[RouteRules] = None
+    ):
+        """
+        Initialize the pool (browsers launch on start() or first acquire()).
+
+        Args:
+            browser_type: 'chromium', 'firefox' or 'webkit'
+            size: Browsers to launch; contexts are spread round-robin
+            launch_options: Keyword arguments for browser_type.launch()
+            context_options: Keyword arguments for browser.new_context()
+            prewarm: Keep one context + page ready for the next acquire()
+            playwright: Running Playwright instance (default: started here)
+            routes: Network rules installed on every context before its page opens
+        """
+        if int(size) < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+
+        self.browser_type = browser_type
+        self.size = int(size)
+        self.launch_options = launch_options or {}
+        self.context_options = context_options or {}
+        self.prewarm = prewarm
+        self._playwright = playwright
+        self._owns_playwright = playwright is None
+        self.routes = routes
+        self._browsers: List[Browser] = []
+        self._next_browser = 0
+        self._warm: deque = deque()
+        self._in_use: Dict[int, BrowserContext] = {}
+        self._timings = {name: _Timings() for name in ('browser_launch', 'context_launch', 'acquire', 'release')}
+        self._warm_hits = 0
+
+    def start(self) -> 'BrowserPool':
+        """Launch the browsers and warm the first context."""
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        launcher = getattr(self._playwright, self.browser_type)
+        while len(self._browsers) < self.size:
+            started = time.perf_counter()
+            self._browsers.append(launcher.launch(**self.launch_options))
+            self._timings['browser_launch'].add(started)
+        if self.prewarm and not self._warm:
+            self._warm.append(self._new_context())
+        return self
+
+    def _new_context(self) -> Tuple[BrowserContext, Page]:
+        browser = self._browsers[self._next_browser % len(self._browsers)]
+        self._next_browser += 1
+        started = time.perf_counter()
+        context = browser.new_context(**self.context_options)
+        if self.routes is not None:
+            self.routes.apply(context)
+        page = context.new_page()
+        self._timings['context_launch'].add(started)
+        return context, page
+
+    def acquire(self) -> Tuple[BrowserContext, Page]:
+        """
+        Get a fresh context and its page for one test.
+
+        Returns:
+            (context, page) — release the context with release() when done
+        """
+        started = time.perf_counter()
+        if len(self._browsers) < self.size:
+            self.start()
+        if self._warm:
+            context, page = self._warm.popleft()
+            self._warm_hits += 1
+        else:
+            context, page = self._new_context()
+        self._in_use[id(context)] = context
+        self._timings['acquire'].add(started)
+        return context, page
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Close a context from acquire() and warm the next one.
+
+        Closing the context discards its cookies, storage, permissions and
+        pages, so nothing leaks into the next test.
+        """
+        started = time.perf_counter()
+        self._in_use.pop(id(context), None)
+        context.close()
+        self._timings['release'].add(started)
+        if self.prewarm and not self._warm and self._browsers:
+            self._warm.append(self._new_context())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Launch counts and timings.
+
+        Returns:
+            Dictionary with browser_launch, context_launch, acquire and
+            release ({count, avg_ms, max_ms, total_ms}), warm_hits and in_use
+        """
+        stats: Dict[str, Any] = {name: t.as_dict() for name, t in self._timings.items()}
+        stats['warm_hits'] = self._warm_hits
+        stats['in_use'] = len(self._in_use)
+        return stats
+
+    def close(self) -> None:
+        """Close every context and browser (and Playwright if started here)."""
+        for context in list(self._in_use.values()) + [c for c, _ in self._warm]:
+            try:
+                context.close()
+            except Exception:
+                pass  # already closed with its browser
+        self._in_use.clear()
+        self._warm.clear()
+        for browser in self._browsers:
+            browser.close()
+        self._browsers = []
+        if self._owns_playwright and self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+
+# Process-wide pool: one per pabot worker
+_browser_pool = None
+
+
+def get_browser_pool(**options) -> BrowserPool:
+    """Get or create the global BrowserPool instance (options apply on creation)"""
+    global _browser_pool
+
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(**options)
+
+    return _browser_pool
@@ -0,0 +1,215 @@
+"""
+Batched DOM text snapshots
+
+Reads the text of many named locators with one script evaluation in the
+page instead of one text_content / Get Text round trip per element.
+Tables (order books, trade history) are read the same way: every row is
+split into named columns and numeric columns are parsed inside the page,
+so Python receives columnar arrays from a single call.
+
+Locators are compiled once into [name, engine, selector] specs:
+- 'css=...' and plain CSS selectors use document.querySelector
+- 'xpath=...' and selectors starting with '//' or '(/' use document.evaluate
+- 'id=foo' becomes the CSS selector [id="foo"]
+
+Playwright-only engines (text=, :has-text(), >> chains) cannot run inside
+the page and are rejected; read those elements individually.
+
+Snapshots follow Get Text / Playwright strict mode: the text is the
+element's trimmed innerText, and a locator matching more than one element
+fails the whole snapshot instead of silently reading the first match.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# (specs) => {name: trimmed innerText | null}; no waiting, throws when a locator is ambiguous
+SNAPSHOT_SCRIPT = """(specs) => {
+    const out = {};
+    const ambiguous = [];
+    for (const [name, engine, selector] of specs) {
+        let count, el;
+        if (engine === 'xpath') {
+            const found = document.evaluate(selector, document, null,
+                                             XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            count = found.snapshotLength;
+            el = count ? found.snapshotItem(0) : null;
+        } else {
+            const found = document.querySelectorAll(selector);
+            count = found.length;
+            el = count ? found[0] : null;
+        }
+        if (count > 1) ambiguous.push(`${name} (${selector}) matched ${count} elements`);
+        out[name] = el === null ? null : (el.innerText ?? el.textContent).trim();
+    }
+    if (ambiguous.length) {
+        throw new Error('Snapshot locators must match one element: ' + ambiguous.join('; '));
+    }
+    return out;
+}"""
+
+# (tables) => {name: {column: [values]}}; rows missing a numeric value are skipped
+TABLE_SCRIPT = """([tables, decimal]) => {
+    const toNumber = (text) => {
+        const kept = text.replace(decimal === ',' ? /[^0-9,-]/g : /[^0-9.-]/g, '');
+        const value = parseFloat(decimal === ',' ? kept.replace(',', '.') : kept);
+        return Number.isFinite(value) ? value : null;
+    };
+    const out = {};
+    for (const [name, engine, selector, columns, numeric, limit] of tables) {
+        let rows;
+        if (engine === 'xpath') {
+            const found = document.evaluate(selector, document, null,
+                                            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            rows = Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+        } else {
+            rows = document.querySelectorAll(selector);
+        }
+        const data = {};
+        for (const [column] of columns) data[column] = [];
+        let count = 0;
+        for (const row of rows) {
+            if (limit && count >= limit) break;
+            const cells = row.querySelectorAll('td');
+            const values = [];
+            let complete = true;
+            for (const [column, index] of columns) {
+                const text = cells[index] ? cells[index].textContent.trim() : '';
+                const value = numeric.includes(column) ? toNumber(text) : text;
+                if (value === null) { complete = false; break; }
+                values.push(value);
+            }
+            if (!complete) continue;
+            columns.forEach(([column], i) => data[column].push(values[i]));
+            count++;
+        }
+        out[name] = data;
+    }
+    return out;
+}"""
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Columns to read from every row matched by a locator
+
+    Args:
+        rows: Row locator, e.g. '#buy_orders tbody tr'
+        columns: {column name: td index}
+        numeric: Column names parsed as numbers (rows where one is not a number are skipped)
+        limit: Maximum rows to read (0 = all)
+    """
+    rows: str
+    columns: Dict[str, int]
+    numeric: Tuple[str, ...] = ()
+    limit: int = 0
+
+
+_ENGINE_PREFIX = re.compile(r'^([a-z_-]+)\s*=\s*', re.IGNORECASE)
+_PLAYWRIGHT_ONLY = (':has-text(', ':text(', ':visible', ':has(', ':nth-match(', '>>')
+
+
+def _compile_locator(name: str, locator: str) -> List[str]:
+    locator = locator.strip()
+    match = _ENGINE_PREFIX.match(locator)
+    engine = match.group(1).lower() if match else None
+    selector = locator[match.end():] if match else locator
+
+    if engine is None and selector.startswith(('//', '(/')):
+        engine = 'xpath'
+    if engine in (None, 'css'):
+        if any(token in selector for token in _PLAYWRIGHT_ONLY):
+            raise ValueError(f"Locator '{name}' uses a Playwright-only selector: {locator}")
+        return [name, 'css', selector]
+    if engine == 'xpath':
+        return [name, 'xpath', selector]
+    if engine == 'id':
+        return [name, 'css', '[id="{}"]'.format(selector.replace('"', '\\"'))]
+    raise ValueError(f"Locator '{name}' uses unsupported engine '{engine}=' in a snapshot: {locator}")
+
+
+@lru_cache(maxsize=128)
+def _compile(locators: Tuple[Tuple[str, str], ...]) -> List[List[str]]:
+    return [_compile_locator(name, locator) for name, locator in locators]
+
+
+def compile_locators(locators: Dict[str, str]) -> List[List[str]]:
+    """
+    Compile {name: locator} into the script argument (cached per locator set)
+
+    Raises:
+        ValueError: If a locator cannot be resolved inside the page
+    """
+    return _compile(tuple(locators.items()))
+
+
+@lru_cache(maxsize=64)
+def _compile_tables(tables: Tuple[Tuple[str, Tuple], ...]) -> List[List[Any]]:
+    compiled = []
+    for name, (rows, columns, numeric, limit) in tables:
+        _, engine, selector = _compile_locator(name, rows)
+        compiled.append([name, engine, selector, [list(c) for c in columns], list(numeric), int(limit)])
+    return compiled
+
+
+def compile_tables(tables: Dict[str, TableSpec], decimal: str = ',') -> List[Any]:
+    """
+    Compile {name: TableSpec} into the TABLE_SCRIPT argument (cached per table set)
+
+    Args:
+        tables: Tables to read
+        decimal: Decimal separator of the page's numbers (',' for id-ID formatting)
+    """
+    key = tuple(
+        (name, (spec.rows, tuple(spec.columns.items()), tuple(spec.numeric), spec.limit))
+        for name, spec in tables.items()
+    )
+    return [_compile_tables(key), decimal]
+
+
+def collect_snapshot(
+    evaluate: Callable[[List[List[str]]], Dict[str, Optional[str]]],
+    locators: Dict[str, str],
+    timeout: float = 0.0,
+    poll_interval: float = 0.1
+) -> Dict[str, Optional[str]]:
+    """
+    Evaluate SNAPSHOT_SCRIPT until every locator matched or timeout expires
+
+    Args:
+        evaluate: Runs SNAPSHOT_SCRIPT in the page with the given argument
+        locators: {name: locator}
+        timeout: Seconds to keep polling while some locators match nothing
+        poll_interval: Seconds between polls
+
+    Returns:
+        {name: text} in locator order; None for locators still unmatched
+    """
+    specs = compile_locators(locators)
+    deadline = time.monotonic() + timeout
+    while True:
+        values = evaluate(specs)
+        if all(values.get(name) is not None for name in locators) or time.monotonic() >= deadline:
+            return {name: values.get(name) for name in locators}
+        time.sleep(poll_interval)
+
+
+async def collect_snapshot_async(
+    evaluate: Callable[[List[List[str]]], Awaitable[Dict[str, Optional[str]]]],
+    locators: Dict[str, str],
+    timeout: float = 0.0,
+    poll_interval: float = 0.1
+) -> Dict[str, Optional[str]]:
+    """collect_snapshot for async pages: evaluate is awaited, polls yield to the event loop"""
+    specs = compile_locators(locators)
+    deadline = time.monotonic() + timeout
+    while True:
+        values = await evaluate(specs)
+        if all(values.get(name) is not None for name in locators) or time.monotonic() >= deadline:
+            return {name: values.get(name) for name in locators}
+        await asyncio.sleep(poll_interval)
@@ -0,0 +1,407 @@
+"""
+Selector profiling and a cache of stable locator equivalents
+
+Attribute-substring selectors ([class*='current-price']) and Playwright
+text engines (button:has-text('Buy')) scan the whole DOM on every
+resolution. The profiler measures, for each locator:
+
+- count: nodes it matches
+- resolve_ms: time to resolve it inside the page (averaged over `repeat`
+  resolutions; for Playwright-only engines, which cannot run in the page,
+  the Python round trip of locator.count() instead, and the equivalent is
+  timed the same way so the two are comparable)
+- stable: a faster CSS equivalent derived from the matched nodes, tried in
+  order #id, [data-testid]/[data-test]/[name]/..., tag.class shared by
+  every match, then a tight child path from the nearest ancestor with an
+  id. A candidate is kept only if it matches exactly the same nodes.
+
+Locators that select by text (text=, :has-text(), role=...[name], xpath
+text()/contains(.)) are profiled but never cached: a structural CSS
+equivalent would keep matching after the text changed.
+
+LocatorCache keeps the accepted equivalents and a per-locator history
+across runs in one JSON file. It is validated instead of trusted:
+
+- a page signature (script and stylesheet URLs) changes on every deploy
+  of the SPA bundle; a new signature drops every cached equivalent
+- sync() re-checks each equivalent in one evaluate call (same match count
+  and element fingerprint) and drops the ones that drifted
+- page objects fall back to the original locator and drop the entry when
+  a cached equivalent fails during an action; reads (text, attributes,
+  state) first check the element's fingerprint (FINGERPRINT_SCRIPT)
+
+Dropped entries are re-learnt by the next profile run.
+"""
+
+import hashlib
+import json
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from libraries.web.dom_snapshot import compile_locators
+
+_FRAMEWORK_DIR = Path(__file__).parent.parent.parent
+
+# Shared helpers: stable-selector candidates and element fingerprints
+_HELPERS = """
+    const STABLE_ATTRIBUTES = [
+        'data-testid', 'data-test', 'data-qa', 'data-id', 'name', 'aria-label',
+    ];
+    const VOLATILE = /\\d{3,}|^(active|hover|focus|selected|show|open|up|down|blink|flash)$/;
+    const esc = (value) => CSS.escape(value);
+    const stableClasses = (el) => Array.from(el.classList).filter((c) => !VOLATILE.test(c)).sort();
+    const fingerprint = (el) => el ? [el.localName, ...stableClasses(el)].join('.') : null;
+    const sameNodes = (selector, els) => {
+        let found;
+        try { found = document.querySelectorAll(selector); } catch (e) { return false; }
+        return found.length === els.length && els.every((el, i) => found[i] === el);
+    };
+    const childPath = (el) => {
+        const steps = [];
+        for (let node = el; node && node !== document.body && steps.length < 8;
+             node = node.parentElement) {
+            if (node !== el && node.id && !VOLATILE.test(node.id)) {
+                return ['#' + esc(node.id), ...steps].join(' > ');
+            }
+            const index = Array.prototype.indexOf.call(node.parentElement.children, node) + 1;
+            steps.unshift(`${node.localName}:nth-child(${index})`);
+        }
+        return null;
+    };
+    const stableSelector = (els) => {
+        if (!els.length) return null;
+        const el = els[0];
+        const candidates = [];
+        if (els.length === 1) {
+            if (el.id && !VOLATILE.test(el.id)) candidates.push('#' + esc(el.id));
+            for (const attr of STABLE_ATTRIBUTES) {
+                const value = el.getAttribute(attr);
+                if (!value) continue;
+                const quoted = value.replace(/"/g, '\\\\"');
+                candidates.push(`${el.localName}[${attr}="${quoted}"]`);
+            }
+        }
+        const shared = stableClasses(el).filter((c) => els.every(
+            (other) => other.localName === el.localName && other.classList.contains(c)));
+        for (const c of shared) candidates.push(`${el.localName}.${esc(c)}`);
+        if (shared.length > 1) {
+            candidates.push(el.localName + shared.map((c) => '.' + esc(c)).join(''));
+        }
+        if (els.length === 1) candidates.push(childPath(el));
+        return candidates.find((candidate) => candidate && sameNodes(candidate, els)) || null;
+    };
+    const timeCss = (selector, repeat) => {
+        const start = performance.now();
+        for (let i = 0; i < repeat; i++) document.querySelectorAll(selector);
+        return (performance.now() - start) / repeat;
+    };
+"""
+
+# ([specs, repeat]) => {name: {count, resolve_ms, stable, stable_ms, fingerprint}}
+PROFILE_SCRIPT = """([specs, repeat]) => {""" + _HELPERS + """
+    const resolve = (engine, selector) => {
+        if (engine !== 'xpath') return Array.from(document.querySelectorAll(selector));
+        const found = document.evaluate(selector, document, null,
+                                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+    };
+    const out = {};
+    for (const [name, engine, selector] of specs) {
+        const els = resolve(engine, selector);
+        const start = performance.now();
+        for (let i = 0; i < repeat; i++) resolve(engine, selector);
+        const stable = stableSelector(els);
+        out[name] = {
+            count: els.length,
+            resolve_ms: (performance.now() - start) / repeat,
+            stable,
+            stable_ms: stable ? timeCss(stable, repeat) : null,
+            fingerprint: fingerprint(els[0]),
+        };
+    }
+    return out;
+}"""
+
+# (elements) => {count, stable, stable_ms, fingerprint}; for locators only Playwright can resolve
+ELEMENTS_SCRIPT = """(els) => {""" + _HELPERS + """
+    const stable = stableSelector(els);
+    return {
+        count: els.length,
+        stable,
+        stable_ms: stable ? timeCss(stable, 20) : null,
+        fingerprint: fingerprint(els[0]),
+    };
+}"""
+
+# (entries) => {locator: true | false | null}; null = nothing rendered yet, cannot tell
+VALIDATE_SCRIPT = """(entries) => {""" + _HELPERS + """
+    const out = {};
+    for (const [locator, stable, count, expected] of entries) {
+        const els = Array.from(document.querySelectorAll(stable));
+        out[locator] = els.length === 0
+            ? null
+            : els.length === count && fingerprint(els[0]) === expected;
+    }
+    return out;
+}"""
+
+# () => sorted script / stylesheet URLs; changes when the SPA bundle is redeployed
+SIGNATURE_SCRIPT = """() => Array.from(
+    document.querySelectorAll('script[src], link[rel="stylesheet"][href]'),
+    (el) => (el.src || el.href).split('#')[0]
+).sort()"""
+
+# (element) => fingerprint; checked before reading through a cached equivalent
+FINGERPRINT_SCRIPT = """(el) => {""" + _HELPERS + """
+    return fingerprint(el);
+}"""
+
+_HISTORY_LIMIT = 50
+
+# Locators whose match depends on the element's text or accessible name
+_TEXT_LOCATOR = re.compile(
+    r"""^\s*(?:text=|role=|["'])|:(?:has-text|text|text-is|text-matches)\(|"""
+    r"""text\(\)|normalize-space\(|contains\(\s*\.|string\(\s*\)|>>\s*(?:text|role)="""
+)
+
+
+def is_text_locator(locator: str) -> bool:
+    """True when the locator selects by text, so a structural equivalent is not equivalent"""
+    return bool(_TEXT_LOCATOR.search(locator))
+
+
+@dataclass(frozen=True)
+class LocatorProfile:
+    """Resolution cost of one locator and its stable equivalent"""
+    name: str
+    locator: str
+    engine: str                         # css | xpath | playwright
+    count: int
+    resolve_ms: float
+    stable: Optional[str] = None        # CSS equivalent; None if none matched the same nodes
+    stable_ms: Optional[float] = None
+    fingerprint: Optional[str] = None
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """resolve_ms / stable_ms (None without an equivalent)"""
+        if self.stable is None or self.stable_ms is None:
+            return None
+        return self.resolve_ms / max(self.stable_ms, 1e-6)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'speedup': self.speedup}
+
+
+def page_signature(urls: List[str]) -> str:
+    """Short hash of SIGNATURE_SCRIPT's result"""
+    return hashlib.sha1('\n'.join(urls).encode()).hexdigest()[:12]
+
+
+def _timed_count(count: Callable[[str], int], locator: str) -> float:
+    started = time.perf_counter()
+    count(locator)
+    return (time.perf_counter() - started) * 1000
+
+
+def profile_locators(
+    evaluate: Callable[[str, Any], Any],
+    evaluate_all: Callable[[str, str], Dict[str, Any]],
+    count: Callable[[str], int],
+    locators: Dict[str, str],
+    repeat: int = 20
+) -> List[LocatorProfile]:
+    """
+    Profile locators on the current page
+
+    CSS / xpath / id= locators are measured together with one PROFILE_SCRIPT
+    call; each Playwright-only locator costs one timed count(), one
+    ELEMENTS_SCRIPT call and, when an equivalent is found, one timed
+    count() of the equivalent.
+
+    Args:
+        evaluate: Runs a page script with one argument
+        evaluate_all: Runs a script on all elements matched by a locator
+        count: Number of elements matched by a locator
+        locators: {name: locator}
+        repeat: Resolutions averaged per locator
+
+    Returns:
+        One LocatorProfile per locator, in input order
+    """
+    specs, playwright_only = [], []
+    for name, locator in locators.items():
+        try:
+            specs.extend(compile_locators({name: locator}))
+        except ValueError:
+            playwright_only.append(name)
+
+    results = dict(evaluate(PROFILE_SCRIPT, [specs, int(repeat)])) if specs else {}
+    engines = {name: engine for name, engine, _ in specs}
+    for name in playwright_only:
+        resolve_ms = _timed_count(count, locators[name])
+        results[name] = {**evaluate_all(locators[name], ELEMENTS_SCRIPT), 'resolve_ms': resolve_ms}
+        if results[name].get('stable'):
+            # Same round trip as the original, not the in-page time ELEMENTS_SCRIPT measured
+            results[name]['stable_ms'] = _timed_count(count, 'css=' + results[name]['stable'])
+        engines[name] = 'playwright'
+
+    return [
+        LocatorProfile(
+            name, locator, engines[name],
+            int(results[name]['count']), float(results[name]['resolve_ms']),
+            results[name].get('stable'), results[name].get('stable_ms'),
+            results[name].get('fingerprint')
+        )
+        for name, locator in locators.items()
+    ]
+
+
+class LocatorCache:
+    """Stable locator equivalents plus profiling history, persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = 'results/locators/locator_cache.json'):
+        """
+        Load the cache (a missing or unreadable file starts empty).
+
+        Args:
+            path: JSON file (relative paths are under the framework root); None = in memory only
+        """
+        self.path = None
+        if path:
+            self.path = Path(path) if Path(path).is_absolute() else _FRAMEWORK_DIR / path
+        self.signature: Optional[str] = None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.history: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'fallbacks': 0, 'dropped': 0}
+        if self.path is not None and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                data = {}
+            self.signature = data.get('signature')
+            self.entries = data.get('entries') or {}
+            self.history = data.get('history') or {}
+
+    def lookup(self, locator: str) -> str:
+        """The cached equivalent as a css= locator, or the locator itself"""
+        entry = self.entries.get(locator)
+        if entry is None:
+            self.stats['misses'] += 1
+            return locator
+        self.stats['hits'] += 1
+        return 'css=' + entry['stable']
+
+    def fingerprint(self, locator: str) -> Optional[str]:
+        """Fingerprint the cached equivalent of locator was learnt with (None if not cached)"""
+        entry = self.entries.get(locator)
+        return entry['fingerprint'] if entry else None
+
+    def invalidate(self, locator: str, fallback: bool = True) -> None:
+        """Drop a locator's equivalent (fallback: it failed during an action)"""
+        if self.entries.pop(locator, None) is not None:
+            self.stats['fallbacks' if fallback else 'dropped'] += 1
+
+    def record(self, profiles: List[LocatorProfile], signature: Optional[str] = None) -> List[str]:
+        """
+        Add a profile run to the history and learn equivalents.
+
+        An equivalent is accepted when it resolves no slower than the original,
+        measured the same way for both. Text locators (is_text_locator) are
+        never cached.
+
+        Returns:
+            Locators whose equivalent was learnt or changed
+        """
+        if signature is not None and signature != self.signature:
+            self.entries.clear()
+            self.signature = signature
+        at = time.strftime('%Y-%m-%dT%H:%M:%S')
+        learnt = []
+        for profile in profiles:
+            runs = self.history.setdefault(profile.locator, [])
+            runs.append(
+                {'at': at, 'count': profile.count, 'resolve_ms': round(profile.resolve_ms, 4)})
+            del runs[:-_HISTORY_LIMIT]
+
+            faster = profile.stable_ms is not None and profile.stable_ms <= profile.resolve_ms
+            locator = profile.locator
+            original = locator[4:] if locator.startswith('css=') else locator
+            if (not profile.stable or not faster or profile.stable == original
+                    or is_text_locator(locator)):
+                self.invalidate(profile.locator, fallback=False)
+                continue
+            entry = {
+                'stable': profile.stable,
+                'count': profile.count,
+                'fingerprint': profile.fingerprint,
+                'resolve_ms': round(profile.resolve_ms, 4),
+                'stable_ms': round(profile.stable_ms, 4) if profile.stable_ms is not None else None,
+            }
+            if self.entries.get(profile.locator, {}).get('stable') != profile.stable:
+                learnt.append(profile.locator)
+            self.entries[profile.locator] = entry
+        return learnt
+
+    def sync(
+        self,
+        signature: str,
+        validate: Callable[[List[List[Any]]], Dict[str, Optional[bool]]]
+    ) -> List[str]:
+        """
+        Validate the cache against the current page.
+
+        Args:
+            signature: page_signature() of the current page
+            validate: Runs VALIDATE_SCRIPT with [[locator, stable, count, fingerprint], ...]
+
+        Returns:
+            Locators whose equivalent was dropped
+        """
+        if signature != self.signature:
+            dropped = list(self.entries) if self.signature is not None else []
+            self.stats['dropped'] += len(dropped)
+            self.entries.clear()
+            self.signature = signature
+            return dropped
+        if not self.entries:
+            return []
+        checks = validate([
+            [locator, entry['stable'], entry['count'], entry['fingerprint']]
+            for locator, entry in self.entries.items()
+        ])
+        dropped = [locator for locator, valid in checks.items() if valid is False]
+        for locator in dropped:
+            self.invalidate(locator, fallback=False)
+        return dropped
+
+    def save(self) -> Optional[Path]:
+        """Write the cache file (no-op for an in-memory cache)"""
+        if self.path is None:
+            return None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'signature': self.signature, 'entries': self.entries, 'history': self.history}
+        self.path.write_text(json.dumps(data, indent=2))
+        return self.path
+
+    def trend(self, locator: str) -> Tuple[int, Optional[float]]:
+        """(runs recorded, median resolve_ms across runs) of a locator"""
+        values = sorted(run['resolve_ms'] for run in self.history.get(locator, []))
+        return len(values), values[len(values) // 2] if values else None
+
+
+def format_profiles(profiles: List[LocatorProfile]) -> str:
+    """Text table of profiles, slowest first"""
+    lines = [
+        f"{'locator':<48} {'engine':<10} {'count':>5} {'resolve_ms':>10} {'stable_ms':>9}  stable"
+    ]
+    for profile in sorted(profiles, key=lambda p: p.resolve_ms, reverse=True):
+        stable_ms = f"{profile.stable_ms:.4f}" if profile.stable_ms is not None else '-'
+        lines.append(
+            f"{profile.locator[:48]:<48} {profile.engine:<10} {profile.count:>5} "
+            f"{profile.resolve_ms:>10.4f} {stable_ms:>9}  {profile.stable or '-'}"
+        )
+    return '\n'.join(lines)
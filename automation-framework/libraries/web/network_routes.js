@@ -0,0 +1,55 @@
+// Browser-library JS extension: declarative routing for the current context.
+//
+// Imported with `Library    Browser    jsextension=.../network_routes.js`;
+// each exported function becomes a keyword (installRouteRules -> Install Route Rules).
+// Rules are produced by network_routes.RouteRules.to_json() (regex sources, not globs).
+
+async function installRouteRules(rules, context, logger) {
+    const spec = typeof rules === 'string' ? JSON.parse(rules) : rules;
+    const stats = { blocked: 0, stubbed: 0, passed: 0 };
+    context.__routeStats = stats;
+
+    if (spec.har && spec.har.mode !== 'off') {
+        await context.routeFromHAR(spec.har.path, {
+            update: spec.har.mode === 'record',
+            notFound: spec.har.not_found || 'fallback',
+        });
+        logger(`HAR ${spec.har.mode}: ${spec.har.path}`);
+    }
+
+    const types = new Set(spec.block_resource_types || []);
+    const blocked = (spec.block_urls || []).length
+        ? new RegExp(spec.block_urls.map((p) => `(?:${p})`).join('|'))
+        : null;
+    const stubs = (spec.stubs || []).map((stub) => ({ ...stub, re: new RegExp(stub.url) }));
+    if (!types.size && !blocked && !stubs.length) {
+        return stats;
+    }
+
+    // Registered after the HAR route, so it runs first and falls back to it
+    await context.route('**/*', (route) => {
+        const request = route.request();
+        const url = request.url();
+        if (types.has(request.resourceType()) || (blocked && blocked.test(url))) {
+            stats.blocked += 1;
+            return route.abort();
+        }
+        const stub = stubs.find((s) => s.re.test(url));
+        if (stub) {
+            stats.stubbed += 1;
+            return route.fulfill({ status: stub.status, body: stub.body, contentType: stub.content_type });
+        }
+        stats.passed += 1;
+        return route.fallback();
+    });
+    logger(`Route rules: ${types.size} resource types, ${(spec.block_urls || []).length} URL blocks, ${stubs.length} stubs`);
+    return stats;
+}
+
+async function getRouteRuleStats(context) {
+    return context.__routeStats || { blocked: 0, stubbed: 0, passed: 0 };
+}
+
+exports.__esModule = true;
+exports.installRouteRules = installRouteRules;
+exports.getRouteRuleStats = getRouteRuleStats;
@@ -0,0 +1,228 @@
+"""
+Declarative network routing for web tests
+
+Rules come from the env YAML (web.routing / web.har) and are installed on a
+browser context before the first page loads:
+
+- block_resource_types: Playwright resource types to abort (image, font,
+  media, stylesheet, ...)
+- block_urls: URL globs to abort (third-party analytics, tag managers)
+- stubs: {url, status, body, content_type} answered locally
+- har: {mode: off|record|replay, path, not_found: fallback|abort} — record
+  the page and its XHR bootstrap to a HAR archive, or serve it from one
+
+URL globs follow Playwright: '**' matches anything, '*' anything but '/';
+prefix a pattern with 're:' to give a regular expression. Globs are
+compiled once, and a single catch-all route handles every rule.
+
+The same rules drive the Playwright page objects (RouteRules.apply) and the
+Browser library (network_routes.js, via NetworkRoutesLibrary).
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+_FRAMEWORK_DIR = Path(__file__).parent.parent.parent
+HAR_MODES = ('off', 'record', 'replay')
+_BLOCK = object()
+
+# () => transfer/load summary of the current document from the Performance API
+NETWORK_SUMMARY_SCRIPT = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    let bytes = nav ? nav.transferSize : 0;
+    for (const entry of resources) bytes += entry.transferSize || 0;
+    return {
+        transferred_bytes: bytes,
+        resources: resources.length,
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+        load_ms: nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : null,
+    };
+}"""
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a Playwright URL glob ('re:' prefix = regex as-is) into a regex source"""
+    if pattern.startswith('re:'):
+        return pattern[3:]
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return '^' + ''.join(parts) + '$'
+
+
+class RouteRules:
+    """Compiled blocking / stubbing / HAR rules for one browser context."""
+
+    def __init__(
+        self,
+        block_resource_types: Sequence[str] = (),
+        block_urls: Sequence[str] = (),
+        stubs: Sequence[Dict[str, Any]] = (),
+        har: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Compile routing rules.
+
+        Args:
+            block_resource_types: Resource types to abort
+            block_urls: URL globs to abort
+            stubs: Dicts with url (glob) and optional status, body, content_type
+            har: Dict with mode (off/record/replay), path and optional not_found
+
+        Raises:
+            ValueError: If the HAR mode is unknown or replay has no archive
+        """
+        self.block_resource_types = frozenset(block_resource_types or ())
+        self.block_urls = [glob_to_regex(p) for p in block_urls or ()]
+        self.stubs = [
+            {
+                'url': glob_to_regex(stub['url']),
+                'status': int(stub.get('status', 200)),
+                'body': str(stub.get('body', '')),
+                'content_type': stub.get('content_type', 'text/plain'),
+            }
+            for stub in stubs or ()
+        ]
+        self._block_re = re.compile('|'.join(f'(?:{p})' for p in self.block_urls)) if self.block_urls else None
+        self._stub_res = [(re.compile(stub['url']), stub) for stub in self.stubs]
+
+        har = dict(har or {})
+        # YAML reads a bare `off` as False
+        mode = 'off' if har.get('mode') in (None, False) else str(har['mode']).lower()
+        if mode not in HAR_MODES:
+            raise ValueError(f"web.har.mode must be one of {', '.join(HAR_MODES)}, got '{mode}'")
+        self.har_mode = mode
+        self.har_path = None
+        if mode != 'off':
+            path = Path(har.get('path') or 'har/market.har')
+            self.har_path = path if path.is_absolute() else _FRAMEWORK_DIR / path
+            if mode == 'replay' and not self.har_path.exists():
+                raise ValueError(f"HAR replay archive not found: {self.har_path} (record it with web.har.mode: record)")
+        self.har_not_found = har.get('not_found', 'fallback')
+
+    @classmethod
+    def from_config(cls, env_config: Dict[str, Any]) -> 'RouteRules':
+        """Build rules from an env config's web.routing and web.har blocks (missing = no rules)"""
+        web_cfg = (env_config or {}).get('web') or {}
+        routing = web_cfg.get('routing') or {}
+        return cls(
+            block_resource_types=routing.get('block_resource_types') or (),
+            block_urls=routing.get('block_urls') or (),
+            stubs=routing.get('stubs') or (),
+            har=web_cfg.get('har'),
+        )
+
+    @property
+    def has_routes(self) -> bool:
+        return bool(self.block_resource_types or self._block_re or self._stub_res)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rules as plain data (regex sources) for the Browser-library JS extension"""
+        return {
+            'block_resource_types': sorted(self.block_resource_types),
+            'block_urls': self.block_urls,
+            'stubs': self.stubs,
+            'har': {
+                'mode': self.har_mode,
+                'path': str(self.har_path) if self.har_path else None,
+                'not_found': self.har_not_found,
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def apply(self, context) -> Dict[str, int]:
+        """
+        Install the rules on a Playwright (sync API) BrowserContext.
+
+        Must run before the context opens the pages it should affect.
+
+        Returns:
+            Live counters {blocked, stubbed, passed} updated as requests are routed
+        """
+        stats = {'blocked': 0, 'stubbed': 0, 'passed': 0}
+
+        if self.har_mode != 'off':
+            context.route_from_har(
+                str(self.har_path),
+                update=self.har_mode == 'record',
+                not_found=self.har_not_found,
+            )
+
+        if self.has_routes:
+            # Registered after the HAR route, so it runs first and falls back to it
+            def handle(route):
+                stub = self._match(route.request, stats)
+                if stub is None:
+                    return route.fallback()
+                if stub is _BLOCK:
+                    return route.abort()
+                return route.fulfill(status=stub['status'], body=stub['body'], content_type=stub['content_type'])
+
+            context.route('**/*', handle)
+
+        return stats
+
+    async def apply_async(self, context) -> Dict[str, int]:
+        """apply() for a Playwright async-API BrowserContext"""
+        stats = {'blocked': 0, 'stubbed': 0, 'passed': 0}
+
+        if self.har_mode != 'off':
+            await context.route_from_har(
+                str(self.har_path),
+                update=self.har_mode == 'record',
+                not_found=self.har_not_found,
+            )
+
+        if self.has_routes:
+            async def handle(route):
+                stub = self._match(route.request, stats)
+                if stub is None:
+                    await route.fallback()
+                elif stub is _BLOCK:
+                    await route.abort()
+                else:
+                    await route.fulfill(status=stub['status'], body=stub['body'], content_type=stub['content_type'])
+
+            await context.route('**/*', handle)
+
+        return stats
+
+    def _match(self, request, stats: Dict[str, int]):
+        """_BLOCK, the matching stub, or None to pass the request through (counted in stats)"""
+        if request.resource_type in self.block_resource_types or (
+                self._block_re is not None and self._block_re.search(request.url)):
+            stats['blocked'] += 1
+            return _BLOCK
+        for pattern, stub in self._stub_res:
+            if pattern.search(request.url):
+                stats['stubbed'] += 1
+                return stub
+        stats['passed'] += 1
+        return None
+
+
+def summarise(summary: Dict[str, Any], stats: Optional[Dict[str, int]] = None) -> List[str]:
+    """Human-readable lines for a NETWORK_SUMMARY_SCRIPT result plus route counters"""
+    load = summary.get('load_ms')
+    lines = [
+        'Network: {:.1f} KiB transferred over {} resources, load {}'.format(
+            (summary.get('transferred_bytes') or 0) / 1024, summary.get('resources', 0),
+            f'{load:.0f}ms' if load is not None else 'n/a')
+    ]
+    if stats:
+        lines.append('Routing: {blocked} blocked, {stubbed} stubbed, {passed} passed through'.format(**stats))
+    return lines
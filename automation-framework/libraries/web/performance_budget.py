@@ -0,0 +1,197 @@
+"""
+Web performance budgets for page loads
+
+Metrics are read after navigation with one script evaluation:
+
+- Navigation Timing: ttfb_ms, dom_content_loaded_ms, load_ms
+- Largest Contentful Paint: lcp_ms
+- Long tasks: long_tasks, long_task_total_ms, total_blocking_ms (time
+  beyond 50ms per task, as in Total Blocking Time)
+- performance.memory (Chromium): js_heap_mb
+- Resource Timing: transferred_kb, resources
+
+In Chromium the CDP Performance domain adds js_heap_mb (authoritative),
+script_duration_ms, layout_duration_ms, task_duration_ms and dom_nodes.
+
+Budgets live per environment under web.performance_budget in the env
+YAML. Like THRESHOLD in load_test/locustfile.py, each key is max_<metric>
+or min_<metric>. Metrics a browser cannot report (no LCP in WebKit, no
+heap outside Chromium) are listed as skipped, not failed.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_FRAMEWORK_DIR = Path(__file__).parent.parent.parent
+
+# async () => metrics; buffered observers replay entries recorded before the call
+PERFORMANCE_SCRIPT = """async () => {
+    const observe = (type) => new Promise((resolve) => {
+        const supported = PerformanceObserver.supportedEntryTypes;
+        if (!supported || !supported.includes(type)) {
+            resolve(null);
+            return;
+        }
+        const entries = [];
+        const observer = new PerformanceObserver((list) => entries.push(...list.getEntries()));
+        observer.observe({ type, buffered: true });
+        setTimeout(() => { observer.disconnect(); resolve(entries); }, 50);
+    });
+    const [lcp, longTasks] = await Promise.all([
+        observe('largest-contentful-paint'), observe('longtask'),
+    ]);
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    let bytes = nav ? nav.transferSize : 0;
+    for (const entry of resources) bytes += entry.transferSize || 0;
+    const durations = (longTasks || []).map((task) => task.duration);
+    return {
+        ttfb_ms: nav ? nav.responseStart : null,
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+        load_ms: nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : null,
+        lcp_ms: lcp && lcp.length ? lcp[lcp.length - 1].startTime : null,
+        long_tasks: longTasks ? longTasks.length : null,
+        long_task_total_ms: longTasks ? durations.reduce((a, b) => a + b, 0) : null,
+        total_blocking_ms: longTasks
+            ? durations.reduce((a, b) => a + Math.max(0, b - 50), 0)
+            : null,
+        js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+        transferred_kb: bytes / 1024,
+        resources: resources.length,
+    };
+}"""
+
+# CDP Performance.getMetrics name -> (metric, scale)
+CDP_METRICS = {
+    'JSHeapUsedSize': ('js_heap_mb', 1 / 1048576),
+    'ScriptDuration': ('script_duration_ms', 1000),
+    'LayoutDuration': ('layout_duration_ms', 1000),
+    'TaskDuration': ('task_duration_ms', 1000),
+    'Nodes': ('dom_nodes', 1),
+}
+
+
+def merge_cdp_metrics(metrics: Dict[str, Any], cdp: Optional[Dict[str, float]]) -> Dict[str, Any]:
+    """Add CDP Performance.getMetrics values ({name: value}) to page metrics"""
+    merged = dict(metrics)
+    for name, (metric, scale) in CDP_METRICS.items():
+        if cdp and cdp.get(name) is not None:
+            merged[metric] = cdp[name] * scale
+    return merged
+
+
+class PerformanceBudget:
+    """max_/min_ thresholds for page metrics."""
+
+    def __init__(self, thresholds: Optional[Dict[str, float]] = None):
+        """
+        Compile thresholds.
+
+        Args:
+            thresholds: {max_<metric> | min_<metric>: limit}, e.g. {'max_lcp_ms': 4000}
+
+        Raises:
+            ValueError: If a key has no max_/min_ prefix or a limit is not numeric
+        """
+        self.thresholds = dict(thresholds or {})
+        self._checks: List[Tuple[str, str, str, float]] = []
+        for key, limit in self.thresholds.items():
+            bound, _, metric = key.partition('_')
+            if bound not in ('max', 'min') or not metric:
+                raise ValueError(f"Budget key must be max_<metric> or min_<metric>, got '{key}'")
+            try:
+                self._checks.append((key, bound, metric, float(limit)))
+            except (TypeError, ValueError):
+                raise ValueError(f"Budget '{key}' must be a number, got {limit!r}") from None
+
+    @classmethod
+    def from_config(cls, env_config: Dict[str, Any]) -> 'PerformanceBudget':
+        """Build the budget from an env config's web.performance_budget block (none = no checks)"""
+        web_cfg = (env_config or {}).get('web') or {}
+        return cls(web_cfg.get('performance_budget') or {})
+
+    def check(self, metrics: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """
+        Compare metrics with the thresholds.
+
+        Returns:
+            (violations, skipped): human-readable violations, and the budget
+            keys whose metric the browser did not report
+        """
+        violations, skipped = [], []
+        for key, bound, metric, limit in self._checks:
+            value = metrics.get(metric)
+            if value is None:
+                skipped.append(key)
+            elif bound == 'max' and value > limit:
+                violations.append(f"{metric} {value:.1f} > {limit:g} ({key})")
+            elif bound == 'min' and value < limit:
+                violations.append(f"{metric} {value:.1f} < {limit:g} ({key})")
+        return violations, skipped
+
+
+class PerformanceReport:
+    """Machine-readable per-run report: one JSON file, rewritten after every result."""
+
+    def __init__(self, report_dir: str = 'results/performance', environment: str = ''):
+        """
+        Start a report file for this run.
+
+        Args:
+            report_dir: Directory (relative paths are under the framework root)
+            environment: Environment name recorded in the report and file name
+        """
+        directory = Path(report_dir)
+        if not directory.is_absolute():
+            directory = _FRAMEWORK_DIR / directory
+        started = time.strftime('%Y%m%d_%H%M%S')
+        # pid keeps pabot workers of the same run in separate files
+        self.path = directory / f"perf_{environment or 'run'}_{started}_{os.getpid()}.json"
+        self.data = {
+            'environment': environment,
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'passed': True,
+            'results': [],
+        }
+
+    def add(
+        self,
+        name: str,
+        url: str,
+        metrics: Dict[str, Any],
+        budget: PerformanceBudget,
+        violations: List[str],
+        skipped: List[str]
+    ) -> Path:
+        """Record one page's metrics and budget outcome and rewrite the file"""
+        passed = not violations
+        self.data['results'].append({
+            'name': name,
+            'url': url,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'passed': passed,
+            'metrics': {k: round(v, 2) if isinstance(v, float) else v for k, v in metrics.items()},
+            'budget': budget.thresholds,
+            'violations': violations,
+            'skipped': skipped,
+        })
+        self.data['passed'] = self.data['passed'] and passed
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2))
+        return self.path
+
+
+def summarise(metrics: Dict[str, Any]) -> str:
+    """One log line with the headline metrics"""
+    def fmt(key: str, unit: str) -> str:
+        return f"{metrics[key]:.0f}{unit}" if metrics.get(key) is not None else 'n/a'
+
+    return (
+        'TTFB {} | DCL {} | load {} | LCP {} | long tasks {} ({}) | heap {} | {} transferred'
+    ).format(
+        fmt('ttfb_ms', 'ms'), fmt('dom_content_loaded_ms', 'ms'), fmt('load_ms', 'ms'),
+        fmt('lcp_ms', 'ms'), metrics.get('long_tasks', 'n/a'), fmt('long_task_total_ms', 'ms'),
+        fmt('js_heap_mb', 'MB'), fmt('transferred_kb', 'KiB'))
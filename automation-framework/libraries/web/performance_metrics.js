@@ -0,0 +1,24 @@
+// Browser-library JS extension: CDP performance counters for the current page.
+//
+// Imported with the other extensions in `Library    Browser    jsextension=...`.
+// Chromium only; other browsers return null (the Performance API metrics
+// from performance_budget.PERFORMANCE_SCRIPT still apply).
+
+async function getCdpPerformanceMetrics(page) {
+    let session;
+    try {
+        session = await page.context().newCDPSession(page);
+    } catch (error) {
+        return null;
+    }
+    try {
+        await session.send('Performance.enable');
+        const { metrics } = await session.send('Performance.getMetrics');
+        return Object.fromEntries(metrics.map((metric) => [metric.name, metric.value]));
+    } finally {
+        await session.detach();
+    }
+}
+
+exports.__esModule = true;
+exports.getCdpPerformanceMetrics = getCdpPerformanceMetrics;
@@ -0,0 +1,73 @@
+// Browser-library JS extension: capture the current page's WebSocket frames.
+//
+// Imported with the other extensions in `Library    Browser    jsextension=...`.
+// Frames are kept raw in a bounded buffer on the page; PriceStreamLibrary
+// fetches them and decodes them with price_stream.PriceStream. The keywords
+// are named after the frame buffer (Start Frame Capture), not the stream, so
+// they do not clash with PriceStreamLibrary's Start Price Stream.
+
+async function startFrameCapture(capacity, page, logger) {
+    const stream = {
+        frames: [], seq: 0, sockets: 0, capacity: Number(capacity) || 1000, waiters: [],
+    };
+    page.__priceStream = stream;
+    page.on('websocket', (ws) => {
+        stream.sockets += 1;
+        ws.on('framereceived', (event) => {
+            const payload = typeof event.payload === 'string'
+                ? event.payload
+                : event.payload.toString('utf8');
+            stream.seq += 1;
+            stream.frames.push({ seq: stream.seq, received_ms: Date.now(), payload });
+            if (stream.frames.length > stream.capacity) {
+                stream.frames.shift();
+            }
+            const waiters = stream.waiters;
+            stream.waiters = [];
+            waiters.forEach((wake) => wake());
+        });
+    });
+    logger(`Capturing WebSocket frames (buffer ${stream.capacity})`);
+}
+
+// Resolve with the frames after `since` once `count` of them contain `match`
+// (substring, '' = any), or when timeoutMs expires (timed_out: true). With
+// count 0 it returns the buffered frames and the current seq immediately.
+async function waitForStreamFrames(since, count, timeoutMs, match, page) {
+    const stream = page.__priceStream;
+    if (!stream) {
+        throw new Error(
+            'Price stream not started on this page (call Start Price Stream before navigating)');
+    }
+    const after = Number(since) || 0;
+    const needed = count === undefined || count === null || count === '' ? 1 : Number(count);
+    const deadline = Date.now() + (Number(timeoutMs) || 0);
+    const matching = () => stream.frames.filter(
+        (f) => f.seq > after && (!match || f.payload.includes(match))).length;
+
+    let timedOut = false;
+    while (matching() < needed) {
+        const remaining = deadline - Date.now();
+        if (remaining <= 0) {
+            timedOut = true;
+            break;
+        }
+        await new Promise((resolve) => {
+            const timer = setTimeout(resolve, remaining);
+            stream.waiters.push(() => {
+                clearTimeout(timer);
+                resolve();
+            });
+        });
+    }
+    return {
+        frames: stream.frames.filter((f) => f.seq > after),
+        seq: stream.seq,
+        sockets: stream.sockets,
+        timed_out: timedOut,
+    };
+}
+
+exports.__esModule = true;
+exports.startFrameCapture = startFrameCapture;
+exports.waitForStreamFrames = waitForStreamFrames;
@@ -0,0 +1,385 @@
+"""
+WebSocket price-stream capture for event-driven market assertions
+
+The market page receives ticker, order-book and trade pushes over a
+WebSocket (Centrifugo channels such as market:summary-24h,
+market:order-book-usdtidr, market:trade-activity-usdtidr). Instead of
+polling the DOM for a changed price, the frames are decoded as they arrive
+and kept in a bounded ring buffer:
+
+- waits complete as soon as N updates have arrived (or fail after T)
+- the latest order-book push gives the bid/ask the DOM should show
+- arrival times give update rate, inter-message gaps and server lag
+
+Frames come from Playwright's websocket 'framereceived' event (PriceStream.
+attach) or, with the Browser library, from the price_stream.js extension
+(PriceStreamLibrary). Either way they go through PriceStream.feed.
+"""
+
+import json
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+STREAM_KINDS = ('ticker', 'orderbook', 'trade')
+
+# Channel name fragment -> kind
+_CHANNEL_KINDS = (
+    ('summary-24h', 'ticker'),
+    ('ticker', 'ticker'),
+    ('order-book', 'orderbook'),
+    ('orderbook', 'orderbook'),
+    ('depth', 'orderbook'),
+    ('trade-activity', 'trade'),
+    ('trade', 'trade'),
+)
+
+
+@dataclass(frozen=True)
+class StreamUpdate:
+    """One decoded market push (prices are floats, times epoch milliseconds)"""
+    index: int
+    received_ms: float
+    kind: str
+    channel: str
+    pair: Optional[str] = None
+    price: Optional[float] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    side: Optional[str] = None
+    server_ms: Optional[float] = None
+
+
+def parse_number(text: Any, decimal: str = ',') -> Optional[float]:
+    """
+    Parse a price as sent by the stream (plain numbers) or shown by the page
+
+    Page texts use id-ID grouping ('16.245,5'); pass decimal='.' for
+    en-US texts. Currency symbols and spaces are ignored.
+    """
+    if text is None or isinstance(text, bool):
+        return None
+    if isinstance(text, (int, float)):
+        return float(text)
+    grouping = '.' if decimal == ',' else ','
+    cleaned = ''.join(ch for ch in str(text) if ch.isdigit() or ch in '.,-')
+    cleaned = cleaned.replace(grouping, '').replace(decimal, '.')
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _server_ms(value: Any) -> Optional[float]:
+    """Epoch seconds or milliseconds -> milliseconds"""
+    ts = _to_float(value)
+    if ts is None:
+        return None
+    return ts * 1000 if ts < 1e12 else ts
+
+
+def _channel_kind(channel: str) -> Optional[str]:
+    for fragment, kind in _CHANNEL_KINDS:
+        if fragment in channel:
+            return kind
+    return None
+
+
+def _unwrap(message: Dict[str, Any]) -> Tuple[str, Any]:
+    """(channel, payload data) of a Centrifugo push in v2 (result) or v3+ (push) shape"""
+    if 'push' in message:
+        push = message['push'] or {}
+        channel, data = push.get('channel', ''), (push.get('pub') or {}).get('data')
+    elif 'result' in message:
+        result = message['result'] or {}
+        channel, data = result.get('channel', ''), result.get('data')
+    else:
+        channel, data = message.get('channel', ''), message.get('data')
+    # Publication payloads wrap the market data once more: {data: ..., offset: n}
+    if isinstance(data, dict) and 'data' in data:
+        data = data['data']
+    return channel or '', data
+
+
+def _best(levels: Any, pick: Callable) -> Optional[float]:
+    prices = []
+    for level in levels or ():
+        price = level.get('price') if isinstance(level, dict) else (level[0] if level else None)
+        value = _to_float(price)
+        if value is not None:
+            prices.append(value)
+    return pick(prices) if prices else None
+
+
+def decode_frame(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Decode one WebSocket frame into update fields (without index/received_ms)
+
+    A frame may hold several newline-separated JSON messages, and a ticker
+    push may carry rows for many pairs. Pings, replies to commands and
+    unknown channels decode to nothing.
+    """
+    if isinstance(payload, (bytes, bytearray)):
+        payload = payload.decode('utf-8', 'replace')
+    decoded = []
+    for line in str(payload).splitlines():
+        line = line.strip()
+        if not line.startswith('{'):
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(message, dict):
+            continue
+        channel, data = _unwrap(message)
+        kind = _channel_kind(channel)
+        if kind is None or data is None:
+            continue
+
+        if kind == 'orderbook':
+            book = data if isinstance(data, dict) else {}
+            decoded.append({
+                'kind': kind, 'channel': channel, 'pair': book.get('pair'),
+                'bid': _best(book.get('bid') or book.get('buy'), max),
+                'ask': _best(book.get('ask') or book.get('sell'), min),
+            })
+            continue
+
+        rows = data if isinstance(data, list) else [data]
+        for row in rows:
+            if kind == 'ticker' and isinstance(row, list) and len(row) >= 3:
+                # [pair, ts, last, low, high, price_24h_ago, idr_volume, coin_volume]
+                decoded.append({'kind': kind, 'channel': channel, 'pair': row[0],
+                                'price': _to_float(row[2]), 'server_ms': _server_ms(row[1])})
+            elif kind == 'trade' and isinstance(row, list) and len(row) >= 5:
+                # [pair, ts, sequence, side, price, idr_volume, coin_volume]
+                decoded.append({'kind': kind, 'channel': channel, 'pair': row[0], 'side': row[3],
+                                'price': _to_float(row[4]), 'server_ms': _server_ms(row[1])})
+            elif isinstance(row, dict):
+                decoded.append({
+                    'kind': kind, 'channel': channel, 'pair': row.get('pair'),
+                    'price': _to_float(row.get('last', row.get('price'))),
+                    'side': row.get('type', row.get('side')),
+                    'server_ms': _server_ms(row.get('timestamp', row.get('server_time'))),
+                })
+    return decoded
+
+
+def _percentiles(samples: Iterable[float]) -> Dict[str, Optional[float]]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {'p50': None, 'p95': None, 'max': None}
+
+    def pick(pct: float) -> float:
+        return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+    return {'p50': pick(0.5), 'p95': pick(0.95), 'max': ordered[-1]}
+
+
+class PriceStream:
+    """Ring buffer of decoded market pushes with event-driven waits."""
+
+    def __init__(self, capacity: int = 1000, pair: Optional[str] = None):
+        """
+        Initialize an empty stream.
+
+        Args:
+            capacity: Updates kept; older ones are dropped (and counted)
+            pair: Keep only this pair's updates (e.g. 'usdtidr'); None keeps all
+        """
+        if int(capacity) < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = int(capacity)
+        self.pair = pair.lower() if pair else None
+        self._updates: Deque[StreamUpdate] = deque(maxlen=self.capacity)
+        self._latest: Dict[str, StreamUpdate] = {}
+        self._last_received: Dict[str, float] = {}
+        self._gaps: Dict[str, Deque[float]] = {
+            kind: deque(maxlen=self.capacity) for kind in STREAM_KINDS
+        }
+        self._lags: Deque[float] = deque(maxlen=self.capacity)
+        self._counts = {kind: 0 for kind in STREAM_KINDS}
+        self._index = 0
+        self.frames = 0
+        self.sockets = 0
+        self.started_ms = time.time() * 1000
+
+    @property
+    def last_index(self) -> int:
+        """Index of the newest update (0 before the first); pass as since= to wait for newer ones"""
+        return self._index
+
+    def attach(self, page) -> 'PriceStream':
+        """
+        Capture the WebSocket frames of a Playwright (sync API) page.
+
+        Attach before navigating: sockets opened earlier are not seen.
+        """
+        page.on('websocket', self._on_websocket)
+        return self
+
+    def _on_websocket(self, websocket) -> None:
+        self.sockets += 1
+        websocket.on('framereceived', self.feed)
+
+    def feed(self, payload: Any, received_ms: Optional[float] = None) -> List[StreamUpdate]:
+        """
+        Decode a frame and append its updates.
+
+        Args:
+            payload: Frame text (or bytes)
+            received_ms: Arrival time in epoch milliseconds (default: now)
+
+        Returns:
+            The updates added (after the pair filter)
+        """
+        received_ms = time.time() * 1000 if received_ms is None else float(received_ms)
+        self.frames += 1
+        added = []
+        for fields in decode_frame(payload):
+            pair = fields.get('pair')
+            if self.pair and pair and str(pair).lower() != self.pair:
+                continue
+            if self.pair and not pair and self.pair not in fields['channel']:
+                continue
+            self._index += 1
+            update = StreamUpdate(index=self._index, received_ms=received_ms, **fields)
+            kind = update.kind
+            if kind in self._last_received:
+                self._gaps[kind].append(received_ms - self._last_received[kind])
+            self._last_received[kind] = received_ms
+            if update.server_ms is not None:
+                self._lags.append(received_ms - update.server_ms)
+            self._counts[kind] += 1
+            self._latest[kind] = update
+            self._updates.append(update)
+            added.append(update)
+        return added
+
+    def updates(self, kind: Optional[str] = None, since: int = 0) -> List[StreamUpdate]:
+        """Buffered updates newer than index `since`, optionally of one kind"""
+        return [u for u in self._updates if u.index > since and (kind is None or u.kind == kind)]
+
+    def latest(self, kind: str) -> Optional[StreamUpdate]:
+        """Newest update of a kind (kept even after it leaves the ring buffer)"""
+        return self._latest.get(kind)
+
+    def wait_for_updates(
+        self,
+        count: int,
+        within: float,
+        kind: Optional[str] = 'ticker',
+        pump: Callable[[float], None] = time.sleep,
+        since: Optional[int] = None
+    ) -> List[StreamUpdate]:
+        """
+        Wait until `count` updates newer than `since` have arrived.
+
+        Args:
+            count: Updates to wait for
+            within: Seconds to wait
+            kind: ticker, orderbook, trade, or None for any
+            pump: Called with the seconds left; returns once new frames may
+                  have arrived (or that time is up). With the sync API it
+                  must let Playwright dispatch events, see BasePage
+            since: Update index to count from (default: now)
+
+        Returns:
+            The updates that arrived (at least count)
+
+        Raises:
+            AssertionError: If fewer than count updates arrived within the time
+        """
+        since = self._index if since is None else since
+        deadline = time.monotonic() + float(within)
+        while True:
+            arrived = self.updates(kind, since)
+            if len(arrived) >= int(count):
+                return arrived
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise AssertionError(
+                    f"Expected {count} {kind or 'stream'} update(s) within {within}s, "
+                    f"got {len(arrived)} "
+                    f"({self.frames} frames on {self.sockets} socket(s))"
+                )
+            pump(remaining)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Update counts, rates and timing distributions.
+
+        Returns:
+            Dictionary with frames, sockets, updates ({kind: n}), dropped,
+            rate_per_s ({kind: updates per second since start}),
+            gap_ms ({kind: {p50, p95, max}} between consecutive updates) and
+            lag_ms ({p50, p95, max} arrival minus server timestamp)
+        """
+        elapsed_s = max(time.time() * 1000 - self.started_ms, 1.0) / 1000
+        total = sum(self._counts.values())
+        return {
+            'frames': self.frames,
+            'sockets': self.sockets,
+            'updates': dict(self._counts),
+            'dropped': max(total - len(self._updates), 0),
+            'rate_per_s': {kind: n / elapsed_s for kind, n in self._counts.items()},
+            'gap_ms': {kind: _percentiles(gaps) for kind, gaps in self._gaps.items()},
+            'lag_ms': _percentiles(self._lags),
+        }
+
+
+def bid_ask_mismatches(
+    update: Optional[StreamUpdate],
+    dom_bid: Any,
+    dom_ask: Any,
+    tolerance: float = 0.0,
+    decimal: str = ','
+) -> List[str]:
+    """
+    Compare the page's bid/ask texts with an order-book update
+
+    Returns:
+        Human-readable mismatches (empty when consistent)
+    """
+    if update is None:
+        return ['no order-book update received']
+    problems = []
+    for name, streamed, text in (('bid', update.bid, dom_bid), ('ask', update.ask, dom_ask)):
+        shown = parse_number(text, decimal)
+        if streamed is None or shown is None:
+            problems.append(f"{name}: stream={streamed} page={text!r}")
+        elif abs(shown - streamed) > float(tolerance):
+            problems.append(f"{name}: stream={streamed:g} page={shown:g}")
+    return problems
+
+
+def summarise(stats: Dict[str, Any]) -> List[str]:
+    """Human-readable lines for PriceStream.get_stats()"""
+    def fmt(value: Optional[float]) -> str:
+        return f'{value:.0f}ms' if value is not None else 'n/a'
+
+    lines = [
+        'Price stream: {} frames on {} socket(s), {} dropped from buffer'.format(
+            stats['frames'], stats['sockets'], stats['dropped'])
+    ]
+    for kind in STREAM_KINDS:
+        if stats['updates'][kind]:
+            gaps = stats['gap_ms'][kind]
+            lines.append('Stream [{}]: {} updates, {:.2f}/s, gap p50={} p95={} max={}'.format(
+                kind, stats['updates'][kind], stats['rate_per_s'][kind],
+                fmt(gaps['p50']), fmt(gaps['p95']), fmt(gaps['max'])))
+    lag = stats['lag_ms']
+    if lag['max'] is not None:
+        lines.append(
+            f"Stream lag (arrival - server time): "
+            f"p50={fmt(lag['p50'])} p95={fmt(lag['p95'])} max={fmt(lag['max'])}")
+    return lines
@@ -0,0 +1,31 @@
+// Browser-library JS extension: return a screenshot's bytes without a file.
+//
+// Browser's Take Screenshot writes the image to disk even with
+// return_as=bytes, then reads it back and deletes it on the test thread.
+// Playwright's page/locator screenshot() returns the buffer directly; it is
+// sent back base64-encoded and ScreenshotServiceLibrary queues it for the
+// background writer.
+
+// options: JSON {type, quality?, full_page?, selector?, clip?}
+async function grabScreenshot(options, page) {
+    const spec = typeof options === 'string' ? JSON.parse(options) : options;
+    const shot = { type: spec.type };
+    if (spec.quality !== undefined) {
+        shot.quality = Number(spec.quality);
+    }
+    let buffer;
+    if (spec.selector) {
+        buffer = await page.locator(spec.selector).screenshot(shot);
+    } else {
+        if (spec.clip) {
+            shot.clip = spec.clip;
+        } else {
+            shot.fullPage = Boolean(spec.full_page);
+        }
+        buffer = await page.screenshot(shot);
+    }
+    return buffer.toString('base64');
+}
+
+exports.__esModule = true;
+exports.grabScreenshot = grabScreenshot;
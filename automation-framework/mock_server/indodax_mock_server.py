@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+indodax_mock_server.py
+──────────────────────
+Local, offline mock of the Indodax public and private (TAPI) HTTP API.
+
+Lets the API suites and Locust run at high RPS without touching indodax.com,
+so client-side throughput can be benchmarked deterministically.
+
+Endpoints:
+  GET  /api/ticker/{pair}    → {"ticker": {...}}
+  GET  /api/depth/{pair}     → {"buy": [[price, amount], ...], "sell": [...]}
+  GET  /api/trades/{pair}    → [{"trade_id", "type", "price", "amount", "date"}, ...]
+  GET  /api/summaries        → {"tickers": {...}, "prices_24h": {...}, "prices_7d": {...}}
+  POST /tapi                 → getInfo, getBalance, trade, cancelOrder, openOrders, tradeHistory
+  GET  /__stats              → request counters (not part of the Indodax API)
+
+Private requests are authenticated exactly like Indodax: the Key header must
+match a configured key, Sign must be the HMAC-SHA512 of the raw body
+(IndodaxSigner.verify_signature) and nonce must be greater than the last
+nonce accepted for that key.
+
+Payloads are generated once from --seed and served from pre-encoded bytes;
+the server is a single asyncio process speaking keep-alive HTTP/1.1.
+
+Usage:
+    uv run python mock_server/indodax_mock_server.py --port 8089
+    uv run python mock_server/indodax_mock_server.py --latency-ms 20 --error-rate 0.01 \\
+        --depth-levels 1000 --trade-count 500
+
+Then point the suites at it (.env.dev):
+    API_BASE_URL=http://127.0.0.1:8089
+    PRIVATE_API_BASE_URL=http://127.0.0.1:8089/tapi
+    INDODAX_API_KEY=mock_api_key_0123456789
+    INDODAX_API_SECRET=mock_api_secret_0123456789
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import urllib.parse
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "libraries", "api"))
+
+from indodax_signer import IndodaxSigner  # noqa: E402
+
+DEFAULT_PAIRS = {
+    "btc_idr": 1_650_000_000,
+    "eth_idr": 52_000_000,
+    "xrp_idr": 9_500,
+    "ada_idr": 7_800,
+    "usdt_idr": 16_300,
+}
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+INVALID_PAIR = {"error": "invalid_pair", "error_description": "Invalid Pair"}
+INVALID_KEY = {
+    "success": 0,
+    "error": "Invalid credentials. API not found or session has expired.",
+    "error_code": "invalid_credentials",
+}
+INVALID_SIGN = {
+    "success": 0,
+    "error": "Invalid credentials. Bad sign.",
+    "error_code": "invalid_credentials",
+}
+INVALID_NONCE = {
+    "success": 0,
+    "error": "Invalid nonce value. Nonce must be greater than the previous one.",
+    "error_code": "invalid_nonce",
+}
+
+
+def _response(status, body, content_type="application/json"):
+    """Encode a complete HTTP/1.1 response."""
+    if not isinstance(body, bytes):
+        body = json.dumps(body, separators=(",", ":")).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: keep-alive\r\n\r\n"
+    ).encode("ascii")
+    return head + body
+
+
+class IndodaxMockServer:
+    """Asyncio mock of the Indodax public and private HTTP API."""
+
+    def __init__(
+        self,
+        credentials=None,
+        pairs=None,
+        latency_ms=0.0,
+        latency_jitter_ms=0.0,
+        error_rate=0.0,
+        depth_levels=150,
+        trade_count=200,
+        seed=42,
+    ):
+        """
+        Initialize the mock.
+
+        Args:
+            credentials: {api_key: api_secret} accepted on /tapi
+            pairs: {pair_id: reference_price}; defaults to DEFAULT_PAIRS
+            latency_ms: Fixed delay added to every response
+            latency_jitter_ms: Uniform random delay added on top of latency_ms
+            error_rate: Fraction (0..1) of requests answered with HTTP 500
+            depth_levels: Levels per side in /api/depth
+            trade_count: Trades returned by /api/trades
+            seed: Seed for deterministic payloads and error injection
+        """
+        self.credentials = credentials or {}
+        self.pairs = pairs or DEFAULT_PAIRS
+        self.latency = latency_ms / 1000
+        self.jitter = latency_jitter_ms / 1000
+        self.error_rate = error_rate
+        self.depth_levels = depth_levels
+        self.trade_count = trade_count
+        self.rng = random.Random(seed)
+
+        self.stats = Counter()
+        self._signers = {k: IndodaxSigner(k, s) for k, s in self.credentials.items()}
+        self._last_nonce = {}
+        self._orders = {}
+        self._next_order_id = 1000
+
+        self._public = self._build_public_payloads()
+        self._not_found = _response(404, {"error": "not_found"})
+        self._server_error = _response(500, {"error": "mock_injected_error"})
+
+    # ── Payload generation ─────────────────────────────────────────
+
+    def _build_public_payloads(self):
+        """Pre-encode every public response once."""
+        now = int(time.time())
+        payloads = {}
+        tickers, prices_24h, prices_7d = {}, {}, {}
+
+        for pair, price in self.pairs.items():
+            tick = max(1, price // 10_000)
+            bids = [[price - tick * (i + 1), round(self.rng.uniform(0.01, 5), 8)]
+                    for i in range(self.depth_levels)]
+            asks = [[price + tick * (i + 1), round(self.rng.uniform(0.01, 5), 8)]
+                    for i in range(self.depth_levels)]
+            trades = [
+                {
+                    "date": str(now - i),
+                    "price": str(price + self.rng.randint(-5, 5) * tick),
+                    "amount": f"{self.rng.uniform(0.0001, 2):.8f}",
+                    "tid": str(10_000_000 - i),
+                    "trade_id": str(10_000_000 - i),
+                    "type": self.rng.choice(("buy", "sell")),
+                }
+                for i in range(self.trade_count)
+            ]
+            base = pair.split("_")[0]
+            ticker = {
+                "high": str(price + 50 * tick),
+                "low": str(price - 50 * tick),
+                f"vol_{base}": f"{self.rng.uniform(10, 1000):.8f}",
+                "vol_idr": str(self.rng.randint(10**9, 10**11)),
+                "last": str(price),
+                "buy": str(bids[0][0]),
+                "sell": str(asks[0][0]),
+                "server_time": now,
+                "name": base.upper(),
+            }
+            tickers[pair] = ticker
+            prices_24h[pair.replace("_", "")] = str(price - 10 * tick)
+            prices_7d[pair.replace("_", "")] = str(price - 100 * tick)
+
+            payloads[f"/api/ticker/{pair}"] = _response(200, {"ticker": ticker})
+            payloads[f"/api/depth/{pair}"] = _response(200, {"buy": bids, "sell": asks})
+            payloads[f"/api/trades/{pair}"] = _response(200, trades)
+
+        payloads["/api/summaries"] = _response(
+            200, {"tickers": tickers, "prices_24h": prices_24h, "prices_7d": prices_7d}
+        )
+        return payloads
+
+    # ── Private API ────────────────────────────────────────────────
+
+    def _handle_private(self, headers, body):
+        """Authenticate and dispatch a /tapi request."""
+        key = headers.get("key", "")
+        signer = self._signers.get(key)
+        if signer is None:
+            return _response(200, INVALID_KEY)
+
+        message = body.decode("utf-8")
+        if not signer.verify_signature(message, headers.get("sign", "")):
+            return _response(200, INVALID_SIGN)
+
+        params = dict(urllib.parse.parse_qsl(message))
+        try:
+            nonce = int(params.get("nonce", ""))
+        except ValueError:
+            return _response(200, INVALID_NONCE)
+        if nonce <= self._last_nonce.get(key, 0):
+            self.stats["tapi:invalid_nonce"] += 1
+            return _response(200, INVALID_NONCE)
+        self._last_nonce[key] = nonce
+
+        method = params.get("method", "")
+        self.stats[f"tapi:{method}"] += 1
+        handler = getattr(self, f"_tapi_{method}", None)
+        if handler is None:
+            return _response(200, {"success": 0, "error": "Invalid method.", "error_code": "invalid_method"})
+        return _response(200, {"success": 1, "return": handler(params)})
+
+    def _tapi_getInfo(self, params):
+        balance = {"idr": 10_000_000}
+        balance.update({pair.split("_")[0]: 1.5 for pair in self.pairs})
+        return {
+            "server_time": int(time.time()),
+            "balance": balance,
+            "balance_hold": {currency: 0 for currency in balance},
+            "address": {},
+            "user_id": "mock_user",
+            "name": "Mock User",
+        }
+
+    def _tapi_getBalance(self, params):
+        return self._tapi_getInfo(params)["balance"]
+
+    def _tapi_trade(self, params):
+        order_id = self._next_order_id
+        self._next_order_id += 1
+        order = {
+            "order_id": order_id,
+            "type": params.get("type", "buy"),
+            "pair": params.get("pair", "btc_idr"),
+            "price": float(params.get("price", 0)),
+            "amount": float(params.get("amount", params.get("idr", 0))),
+            "status": "open",
+        }
+        self._orders[order_id] = order
+        return order
+
+    def _tapi_cancelOrder(self, params):
+        order = self._orders.pop(int(params.get("order_id", 0) or 0), None)
+        return {"order_id": params.get("order_id"), "type": params.get("type"),
+                "pair": params.get("pair"), "cancelled": order is not None}
+
+    def _tapi_openOrders(self, params):
+        pair = params.get("pair")
+        return {str(oid): order for oid, order in self._orders.items()
+                if pair is None or order["pair"] == pair}
+
+    def _tapi_tradeHistory(self, params):
+        return {"trades": [], "server_time": int(time.time())}
+
+    # ── HTTP plumbing ──────────────────────────────────────────────
+
+    def _route(self, method, path, headers, body):
+        path = path.split("?", 1)[0]
+        self.stats["requests"] += 1
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.stats["injected_errors"] += 1
+            return self._server_error
+
+        if method == "GET":
+            payload = self._public.get(path)
+            if payload is not None:
+                self.stats[path.rsplit("/", 1)[0] if path.count("/") > 2 else path] += 1
+                return payload
+            if path.startswith("/api/ticker/") or path.startswith("/api/depth/") \
+                    or path.startswith("/api/trades/"):
+                return _response(200, INVALID_PAIR)
+            if path == "/__stats":
+                return _response(200, dict(self.stats))
+        elif method == "POST" and path.rstrip("/") == "/tapi":
+            return self._handle_private(headers, body)
+
+        return self._not_found
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    writer.write(_response(400, {"error": "bad_request"}))
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0) or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                if self.latency or self.jitter:
+                    await asyncio.sleep(self.latency + self.rng.uniform(0, self.jitter))
+
+                writer.write(self._route(method, path, headers, body))
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8089):
+        """Serve until cancelled."""
+        server = await asyncio.start_server(self._handle_connection, host, port, backlog=1024)
+        print(f"Indodax mock listening on http://{host}:{port} "
+              f"(pairs={len(self.pairs)}, depth={self.depth_levels}, trades={self.trade_count}, "
+              f"latency={self.latency * 1000:.0f}ms, error_rate={self.error_rate})")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Indodax API mock server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--api-key", default=os.getenv("MOCK_API_KEY", "mock_api_key_0123456789"))
+    parser.add_argument("--api-secret",
+                        default=os.getenv("MOCK_API_SECRET", "mock_api_secret_0123456789"))
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--depth-levels", type=int, default=150)
+    parser.add_argument("--trade-count", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = IndodaxMockServer(
+        credentials={args.api_key: args.api_secret},
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        depth_levels=args.depth_levels,
+        trade_count=args.trade_count,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,18 @@ Contains page object models for web UI automation
 """
 
 from resources.page_objects.web.base_page import BasePage
-from resources.page_objects.web.indodax_market_page import IndodaxMarketPage
+from resources.page_objects.web.indodax_usdtidr_market_page import IndodaxMarketPage, TradingPairInfo
+from resources.page_objects.web.async_base_page import AsyncBasePage
+from resources.page_objects.web.async_indodax_usdtidr_market_page import (
+    AsyncIndodaxMarketPage, PairSweepResult, sweep_trading_pairs
+)
 
 __all__ = [
     'BasePage',
     'IndodaxMarketPage',
+    'TradingPairInfo',
+    'AsyncBasePage',
+    'AsyncIndodaxMarketPage',
+    'PairSweepResult',
+    'sweep_trading_pairs',
 ]
@@ -0,0 +1,152 @@
+"""
+Async Base Page Object for Web UI Automation
+Async (playwright.async_api) counterpart of BasePage for driving many pages
+concurrently from one event loop
+"""
+
+from playwright.async_api import Page
+from typing import Dict, Optional, Any, Type, TypeVar, Union
+import logging
+
+from libraries.web.action_tracer import ActionTracer, get_action_tracer, traced_async
+from libraries.web.dom_snapshot import (
+    SNAPSHOT_SCRIPT, TABLE_SCRIPT, TableSpec, collect_snapshot_async, compile_tables
+)
+from libraries.web.network_routes import NETWORK_SUMMARY_SCRIPT
+
+T = TypeVar('T')
+
+
+class AsyncBasePage:
+    """
+    Async Base Page Object class for async page objects
+    
+    Same actions, snapshots, tracing and logging as BasePage; every
+    browser call is a coroutine, so a sweep can await many pages at once.
+    """
+    
+    def __init__(self, page: Page, tracer: Optional[ActionTracer] = None):
+        """
+        Initialize async base page
+        
+        Args:
+            page: Playwright async page instance
+            tracer: Action latency tracer (default: the process-wide one)
+        """
+        self.page = page
+        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.tracer = tracer or get_action_tracer()
+    
+    async def get_network_summary(self) -> Dict[str, Any]:
+        """Transferred bytes, resource count and load timings of the current page"""
+        summary = await self.page.evaluate(NETWORK_SUMMARY_SCRIPT)
+        self.logger.debug("Network summary: %s", summary)
+        return summary
+    
+    @traced_async("navigate_to")
+    async def navigate_to(self, url: str, wait_until: str = "load") -> None:
+        """Navigate to URL"""
+        self.logger.info("Navigating to: %s", url)
+        await self.page.goto(url, wait_until=wait_until)
+    
+    def get_current_url(self) -> str:
+        """Get current page URL"""
+        return self.page.url
+    
+    @traced_async("get_page_title")
+    async def get_page_title(self) -> str:
+        """Get page title"""
+        title = await self.page.title()
+        self.logger.debug("Page title: %s", title)
+        return title
+    
+    @traced_async("click")
+    async def click(self, selector: str, timeout: int = 5000) -> None:
+        """Click element"""
+        self.logger.info("Clicking: %s", selector)
+        await self.page.click(selector, timeout=timeout)
+    
+    @traced_async("fill_text")
+    async def fill_text(self, selector: str, text: str, timeout: int = 5000) -> None:
+        """Fill text in input field"""
+        self.logger.info("Filling '%s' with text: %s", selector, text)
+        await self.page.fill(selector, text, timeout=timeout)
+    
+    @traced_async("get_text")
+    async def get_text(self, selector: str) -> str:
+        """Get element text"""
+        text = await self.page.text_content(selector)
+        self.logger.debug("Text from '%s': %s", selector, text)
+        return text
+    
+    @traced_async("is_visible")
+    async def is_visible(self, selector: str) -> bool:
+        """Check if element is visible"""
+        is_visible = await self.page.is_visible(selector)
+        self.logger.debug("Element '%s' visible: %s", selector, is_visible)
+        return is_visible
+    
+    @traced_async("wait_for_selector")
+    async def wait_for_selector(self, selector: str, timeout: int = 5000) -> None:
+        """Wait for element to appear"""
+        self.logger.info("Waiting for selector: %s", selector)
+        await self.page.wait_for_selector(selector, timeout=timeout)
+    
+    @traced_async("wait_for_url")
+    async def wait_for_url(self, url_pattern: str, timeout: int = 5000) -> None:
+        """Wait for URL to match pattern"""
+        self.logger.info("Waiting for URL pattern: %s", url_pattern)
+        await self.page.wait_for_url(f"**{url_pattern}**", timeout=timeout)
+    
+    @traced_async("snapshot")
+    async def snapshot(
+        self,
+        locators: Dict[str, str],
+        record: Optional[Type[T]] = None,
+        timeout: int = 0
+    ) -> Union[Dict[str, Optional[str]], T]:
+        """
+        Read the text of several elements in one page.evaluate call
+        
+        Args:
+            locators: {name: selector} (CSS, 'css=', 'xpath=' or 'id=')
+            record: Optional class built as record(**texts), e.g. a dataclass
+            timeout: Milliseconds to keep polling while a locator matches nothing
+        
+        Returns:
+            {name: text} (None when a locator matched nothing), or the record
+        """
+        texts = await collect_snapshot_async(
+            lambda specs: self.page.evaluate(SNAPSHOT_SCRIPT, specs), locators, timeout / 1000
+        )
+        self.logger.debug("Snapshot of %s locators: %s", len(texts), texts)
+        return record(**texts) if record is not None else texts
+    
+    @traced_async("snapshot_tables")
+    async def snapshot_tables(
+        self,
+        tables: Dict[str, TableSpec],
+        decimal: str = ","
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        Read several tables in one page.evaluate call
+        
+        Args:
+            tables: {name: TableSpec(rows, columns, numeric, limit)}
+            decimal: Decimal separator used by the page (',' for id-ID numbers)
+        
+        Returns:
+            {name: {column: [values]}} with one list entry per complete row
+        """
+        return await self.page.evaluate(TABLE_SCRIPT, compile_tables(tables, decimal))
+    
+    @traced_async("take_screenshot", keyed=False)
+    async def take_screenshot(self, filename: str) -> None:
+        """Take screenshot"""
+        self.logger.info("Taking screenshot: %s", filename)
+        await self.page.screenshot(path=filename)
+    
+    async def close(self) -> None:
+        """Close page"""
+        self.logger.info("Closing page")
+        await self.page.close()
@@ -0,0 +1,193 @@
+"""
+Async Indodax Market Page Object
+Async counterpart of IndodaxMarketPage plus a bounded-concurrency sweep
+that reads many trading pairs from one event loop
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from playwright.async_api import Browser, Page, async_playwright
+from typing import Any, Dict, Iterable, List, Optional
+from libraries.web.dom_snapshot import TableSpec
+from libraries.web.network_routes import RouteRules
+from resources.page_objects.web.async_base_page import AsyncBasePage
+from resources.page_objects.web.indodax_usdtidr_market_page import IndodaxMarketPage, TradingPairInfo
+
+
+@dataclass(frozen=True)
+class PairSweepResult:
+    """Outcome of reading one pair during a sweep"""
+    pair: str
+    info: TradingPairInfo = field(default_factory=TradingPairInfo)
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {'pair': self.pair, 'elapsed_ms': self.elapsed_ms, 'error': self.error, **self.info.as_dict()}
+
+
+class AsyncIndodaxMarketPage(AsyncBasePage):
+    """
+    Async Page Object for Indodax Market/Trading page
+    
+    URL: https://indodax.com/market/{PAIR}
+    Locators are shared with IndodaxMarketPage.
+    """
+    
+    CURRENT_PRICE = IndodaxMarketPage.CURRENT_PRICE
+    TRADES_ROWS = IndodaxMarketPage.TRADES_ROWS
+    TRADES_COLUMNS = IndodaxMarketPage.TRADES_COLUMNS
+    DECIMAL_SEPARATOR = IndodaxMarketPage.DECIMAL_SEPARATOR
+    PAIR_INFO_LOCATORS = IndodaxMarketPage.PAIR_INFO_LOCATORS
+    
+    def __init__(self, page: Page, base_url: str = "https://indodax.com"):
+        """Initialize async Indodax market page"""
+        super().__init__(page)
+        self.base_url = f"{base_url.rstrip('/')}/market"
+    
+    async def navigate_to_pair(self, pair: str) -> None:
+        """
+        Navigate to trading pair page
+        
+        Args:
+            pair: Trading pair (e.g., 'usdtidr', 'btcidr'; API ids like 'btc_idr' also work)
+        """
+        pair = pair.replace('_', '').lower()
+        await self.navigate_to(f"{self.base_url}/{pair}", wait_until="domcontentloaded")
+        self.logger.info("Navigated to market pair: %s", pair)
+    
+    async def is_page_loaded(self, timeout: int = 10000) -> bool:
+        """Check if market page is fully loaded"""
+        try:
+            await self.wait_for_selector(self.CURRENT_PRICE, timeout=timeout)
+            return True
+        except Exception as e:
+            self.logger.warning("Market page not loaded: %s", e)
+            return False
+    
+    async def _read_text(self, selector: str) -> Optional[str]:
+        """Trimmed text of the first element matching selector, or None"""
+        try:
+            text = await self.get_text(selector)
+        except Exception:
+            return None
+        return text.strip() if text is not None else None
+    
+    async def get_trading_pair_info(self) -> TradingPairInfo:
+        """
+        Get complete trading pair information in one browser round trip
+        
+        Falls back to one first-match read per field when the strict
+        snapshot fails (see IndodaxMarketPage.get_trading_pair_info).
+        
+        Returns:
+            TradingPairInfo with price, change, volume, market cap, bid and ask
+        """
+        try:
+            texts = await self.snapshot(self.PAIR_INFO_LOCATORS)
+        except Exception as e:
+            self.logger.warning("Trading pair snapshot failed, reading fields one by one: %s", e)
+            texts = {
+                name: await self._read_text(locator)
+                for name, locator in self.PAIR_INFO_LOCATORS.items()
+            }
+        
+        missing = [name for name, text in texts.items() if text is None]
+        if missing:
+            self.logger.warning("Could not get: %s", ", ".join(missing))
+        
+        info = TradingPairInfo(**{name: text or "" for name, text in texts.items()})
+        self.logger.info("Trading pair info: %s", info)
+        return info
+    
+    async def get_recent_trades(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get recent trades (one browser round trip, parsed in the page)
+        
+        Returns:
+            List of trades, newest first: {time, type, price, amount}
+        """
+        try:
+            spec = TableSpec(self.TRADES_ROWS, self.TRADES_COLUMNS, ('price', 'amount'), int(limit))
+            columns = (await self.snapshot_tables({'trades': spec}, self.DECIMAL_SEPARATOR))['trades']
+            return [dict(zip(columns, row)) for row in zip(*columns.values())]
+        except Exception as e:
+            self.logger.warning("Could not get recent trades: %s", e)
+            return []
+
+
+async def _read_pair(
+    browser: Browser,
+    pair: str,
+    base_url: str,
+    semaphore: asyncio.Semaphore,
+    context_options: Dict[str, Any],
+    routes: Optional[RouteRules],
+    load_timeout: int
+) -> PairSweepResult:
+    async with semaphore:
+        started = time.perf_counter()
+        context = None
+        try:
+            context = await browser.new_context(**context_options)
+            if routes is not None:
+                await routes.apply_async(context)
+            market_page = AsyncIndodaxMarketPage(await context.new_page(), base_url)
+            await market_page.navigate_to_pair(pair)
+            if not await market_page.is_page_loaded(load_timeout):
+                return PairSweepResult(
+                    pair, elapsed_ms=(time.perf_counter() - started) * 1000,
+                    error=f"Market page did not load within {load_timeout}ms"
+                )
+            info = await market_page.get_trading_pair_info()
+            return PairSweepResult(pair, info, (time.perf_counter() - started) * 1000)
+        except Exception as e:
+            return PairSweepResult(pair, elapsed_ms=(time.perf_counter() - started) * 1000, error=str(e))
+        finally:
+            if context is not None:
+                await context.close()
+
+
+async def sweep_trading_pairs(
+    pairs: Iterable[str],
+    base_url: str = "https://indodax.com",
+    max_concurrency: int = 4,
+    browser_type: str = "chromium",
+    launch_options: Optional[Dict[str, Any]] = None,
+    context_options: Optional[Dict[str, Any]] = None,
+    routes: Optional[RouteRules] = None,
+    load_timeout: int = 10000
+) -> List[PairSweepResult]:
+    """
+    Read get_trading_pair_info for many pairs concurrently
+    
+    One browser is launched; each pair gets its own context (clean cookies
+    and storage) and at most max_concurrency pages load at the same time.
+    A pair that fails is reported with its error instead of stopping the sweep.
+    
+    Args:
+        pairs: Pair ids ('btc_idr' or 'btcidr')
+        base_url: Site root
+        max_concurrency: Pages loading at once
+        browser_type: 'chromium', 'firefox' or 'webkit'
+        launch_options: Keyword arguments for browser_type.launch()
+        context_options: Keyword arguments for browser.new_context()
+        routes: Network rules installed on every context
+        load_timeout: Milliseconds to wait for each page's price element
+    
+    Returns:
+        One PairSweepResult per pair, in input order
+    """
+    if int(max_concurrency) < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+    semaphore = asyncio.Semaphore(int(max_concurrency))
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_type).launch(**(launch_options or {}))
+        try:
+            return list(await asyncio.gather(*(
+                _read_pair(browser, pair, base_url, semaphore, context_options or {}, routes, load_timeout)
+                for pair in pairs
+            )))
+        finally:
+            await browser.close()
@@ -4,9 +4,24 @@ Provides core functionality for page interactions with Playwright
 """
 
 from playwright.sync_api import Page, BrowserContext, expect
-from typing import Optional, List, Any, Tuple
+from typing import Callable, Dict, Optional, List, Any, Tuple, Type, TypeVar, Union
 import logging
 
+from libraries.base.screenshot_service import ScreenshotService, get_screenshot_service
+from libraries.web.action_tracer import ActionTracer, get_action_tracer, traced
+from libraries.web.dom_snapshot import (
+    SNAPSHOT_SCRIPT, TABLE_SCRIPT, TableSpec, collect_snapshot, compile_tables
+)
+from libraries.web.locator_profiler import (
+    FINGERPRINT_SCRIPT, SIGNATURE_SCRIPT, VALIDATE_SCRIPT, LocatorCache, LocatorProfile,
+    page_signature, profile_locators
+)
+from libraries.web.network_routes import NETWORK_SUMMARY_SCRIPT, RouteRules
+from libraries.web.performance_budget import PERFORMANCE_SCRIPT, merge_cdp_metrics
+from libraries.web.price_stream import PriceStream, StreamUpdate
+
+T = TypeVar('T')
+
 
 class BasePage:
     """
@@ -16,167 +31,507 @@ class BasePage:
     - Element locators and interactions
     - Wait conditions
     - Common assertions
+    - Batched DOM snapshots (many locators, one browser round trip)
+    - WebSocket price-stream capture for event-driven waits
+    - Per-action latency tracing (see libraries.web.action_tracer)
+    - Selector profiling and a validated cache of stable locators
+    - Policy-driven, clipped screenshots written in the background
     - Logging and debugging
     """
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, tracer: Optional[ActionTracer] = None):
         """
         Initialize base page
         
         Args:
             page: Playwright page instance
+            tracer: Action latency tracer (default: the process-wide one)
         """
         self.page = page
         self.logger = self._setup_logger()
+        self.tracer = tracer or get_action_tracer()
+        self.route_stats: Optional[Dict[str, int]] = None
+        self.price_stream: Optional[PriceStream] = None
+        self.locator_cache: Optional[LocatorCache] = None
+        self.screenshot_service: Optional[ScreenshotService] = get_screenshot_service()
     
     def _setup_logger(self) -> logging.Logger:
-        """Setup logging for page object"""
-        logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        """
+        Setup logging for page object
         
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.DEBUG)
+        Level and handlers come from the application's logging config (the
+        logger propagates to the root); nothing is formatted for disabled levels.
+        """
+        return logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+    
+    def use_locator_cache(self, cache: LocatorCache) -> None:
+        """
+        Resolve actions through stable equivalents learnt by profile_locators
+        
+        A cached equivalent that fails during an action is dropped and the
+        action is retried with the original selector.
+        """
+        self.locator_cache = cache
+    
+    def profile_locators(self, locators: Dict[str, str], repeat: int = 20) -> List[LocatorProfile]:
+        """
+        Time how long each locator takes to resolve and how many nodes it matches
+        
+        With a locator cache, the run is added to its history, faster
+        equivalents are learnt and the cache file is saved.
+        
+        Args:
+            locators: {name: selector}; Playwright-only engines (:has-text, text=) are allowed
+            repeat: Resolutions averaged per locator
+        
+        Returns:
+            One LocatorProfile per locator
+        """
+        profiles = profile_locators(
+            lambda script, arg: self.page.evaluate(script, arg),
+            lambda selector, script: self.page.locator(selector).evaluate_all(script),
+            lambda selector: self.page.locator(selector).count(),
+            locators,
+            repeat
+        )
+        if self.locator_cache is not None:
+            signature = page_signature(self.page.evaluate(SIGNATURE_SCRIPT))
+            learnt = self.locator_cache.record(profiles, signature)
+            self.locator_cache.save()
+            self.logger.info("Locator cache learnt %s equivalent(s): %s", len(learnt), learnt)
+        return profiles
+    
+    def sync_locator_cache(self) -> List[str]:
+        """
+        Validate cached equivalents against the loaded page (two evaluate calls)
+        
+        Returns:
+            Selectors whose equivalent was dropped (all of them after a redeploy)
+        """
+        if self.locator_cache is None:
+            return []
+        dropped = self.locator_cache.sync(
+            page_signature(self.page.evaluate(SIGNATURE_SCRIPT)),
+            lambda entries: self.page.evaluate(VALIDATE_SCRIPT, entries)
+        )
+        if dropped:
+            self.logger.info("Locator cache dropped %s stale equivalent(s): %s",
+                             len(dropped), dropped)
+        return dropped
+    
+    def _with_locator(
+        self,
+        selector: str,
+        action: Callable[[str], T],
+        retry_if: Optional[Callable[[T], bool]] = None,
+        verify: bool = False
+    ) -> T:
+        """
+        Run action with the cached equivalent of selector, falling back to selector itself
+        
+        The fallback runs when the equivalent raises, or when retry_if(result)
+        is true (for checks like is_visible that report a miss instead of
+        raising); the entry is dropped only if the original selector disagrees.
+        With verify (reads that return data, not a miss), the element's
+        fingerprint is checked first, so a drifted equivalent never returns
+        another node's text or state.
+        """
+        if self.locator_cache is None:
+            return action(selector)
+        resolved = self.locator_cache.lookup(selector)
+        if resolved == selector:
+            return action(selector)
+        try:
+            expected = self.locator_cache.fingerprint(selector)
+            drifted = verify and (
+                self.page.eval_on_selector(resolved, FINGERPRINT_SCRIPT) != expected)
+            if not drifted:
+                result = action(resolved)
+        except Exception as e:
+            self.logger.warning("Cached locator '%s' for '%s' failed, falling back: %s",
+                                resolved, selector, e)
+            self.locator_cache.invalidate(selector)
+            return action(selector)
+        if drifted:
+            self.logger.warning("Cached locator '%s' now matches another element than '%s', "
+                                "dropped", resolved, selector)
+            self.locator_cache.invalidate(selector)
+            return action(selector)
+        if retry_if is None or not retry_if(result):
+            return result
+        original = action(selector)
+        if original != result:
+            self.logger.warning("Cached locator '%s' disagrees with '%s', dropped",
+                                resolved, selector)
+            self.locator_cache.invalidate(selector)
+        return original
+    
+    def apply_network_routes(self, rules: RouteRules) -> None:
+        """
+        Install blocking / stub / HAR rules on this page's browser context
+        
+        Call before navigate_to; contexts from BrowserPool(routes=...) already
+        have them.
+        
+        Args:
+            rules: RouteRules, e.g. RouteRules.from_config(env_config)
+        """
+        self.route_stats = rules.apply(self.page.context)
+        self.logger.info("Network routes applied (HAR %s)", rules.har_mode)
+    
+    def get_network_summary(self) -> Dict[str, Any]:
+        """
+        Transferred bytes, resource count and load timings of the current page
+        
+        Returns:
+            {transferred_bytes, resources, dom_content_loaded_ms, load_ms}
+            plus blocked/stubbed/passed counters when routes were applied
+        """
+        summary = self.page.evaluate(NETWORK_SUMMARY_SCRIPT)
+        if self.route_stats is not None:
+            summary.update(self.route_stats)
+        self.logger.debug("Network summary: %s", summary)
+        return summary
+    
+    @traced("get_performance_metrics")
+    def get_performance_metrics(self, cdp: bool = True) -> Dict[str, Any]:
+        """
+        Navigation Timing, LCP, long tasks, JS heap and transferred bytes of the current page
+        
+        Args:
+            cdp: In Chromium, add CDP Performance counters (heap, script/layout/task
+                 time, DOM nodes)
+        
+        Returns:
+            Metrics dict (see libraries.web.performance_budget); None for metrics
+            the browser does not report
+        """
+        metrics = self.page.evaluate(PERFORMANCE_SCRIPT)
+        counters = None
+        browser = self.page.context.browser
+        if cdp and browser is not None and browser.browser_type.name == "chromium":
+            session = self.page.context.new_cdp_session(self.page)
+            try:
+                session.send("Performance.enable")
+                counters = {
+                    m["name"]: m["value"] for m in session.send("Performance.getMetrics")["metrics"]
+                }
+            finally:
+                session.detach()
+        metrics = merge_cdp_metrics(metrics, counters)
+        self.logger.debug("Performance metrics: %s", metrics)
+        return metrics
+    
+    def start_price_stream(self, capacity: int = 1000, pair: Optional[str] = None) -> PriceStream:
+        """
+        Capture this page's WebSocket market pushes into a ring buffer
+        
+        Call before navigate_to: sockets opened earlier are not seen.
+        
+        Args:
+            capacity: Updates kept in the buffer
+            pair: Keep only this pair's updates (e.g. 'usdtidr')
+        """
+        self.price_stream = PriceStream(capacity, pair).attach(self.page)
+        self.logger.info("Price stream started (buffer %s, pair %s)", capacity, pair or 'all')
+        return self.price_stream
+    
+    @traced("wait_for_stream_updates")
+    def wait_for_stream_updates(
+        self,
+        count: int = 1,
+        timeout: int = 10000,
+        kind: Optional[str] = "ticker"
+    ) -> List[StreamUpdate]:
+        """
+        Wait until count stream updates arrive, without polling the DOM
+        
+        Args:
+            count: Updates to wait for
+            timeout: Milliseconds to wait
+            kind: 'ticker', 'orderbook', 'trade' or None for any
         
-        return logger
+        Raises:
+            AssertionError: If fewer updates arrived in time
+        """
+        if self.price_stream is None:
+            raise AssertionError(
+                "Price stream not started (call start_price_stream before navigating)")
+        # Sync API events are dispatched while Playwright waits, so wait in short slices;
+        # frames that arrived before this call are dispatched first and not counted
+        self.page.wait_for_timeout(0)
+        since = self.price_stream.last_index
+        updates = self.price_stream.wait_for_updates(
+            count, timeout / 1000, kind,
+            pump=lambda seconds: self.page.wait_for_timeout(min(seconds, 0.05) * 1000), since=since
+        )
+        self.logger.debug("%s %s updates received", len(updates), kind or 'stream')
+        return updates
     
+    @traced("navigate_to")
     def navigate_to(self, url: str) -> None:
         """Navigate to URL"""
-        self.logger.info(f"Navigating to: {url}")
+        self.logger.info("Navigating to: %s", url)
         self.page.goto(url)
     
     def get_current_url(self) -> str:
         """Get current page URL"""
         url = self.page.url
-        self.logger.debug(f"Current URL: {url}")
+        self.logger.debug("Current URL: %s", url)
         return url
     
+    @traced("get_page_title")
     def get_page_title(self) -> str:
         """Get page title"""
         title = self.page.title()
-        self.logger.debug(f"Page title: {title}")
+        self.logger.debug("Page title: %s", title)
         return title
     
+    @traced("click")
     def click(self, selector: str, timeout: int = 5000) -> None:
         """Click element"""
-        self.logger.info(f"Clicking: {selector}")
-        self.page.click(selector, timeout=timeout)
+        self.logger.info("Clicking: %s", selector)
+        self._with_locator(selector, lambda s: self.page.click(s, timeout=timeout))
     
+    @traced("fill_text")
     def fill_text(self, selector: str, text: str, timeout: int = 5000) -> None:
         """Fill text in input field"""
-        self.logger.info(f"Filling '{selector}' with text: {text}")
-        self.page.fill(selector, text)
+        self.logger.info("Filling '%s' with text: %s", selector, text)
+        self._with_locator(selector, lambda s: self.page.fill(s, text))
     
+    @traced("get_text")
     def get_text(self, selector: str) -> str:
         """Get element text"""
-        text = self.page.text_content(selector)
-        self.logger.debug(f"Text from '{selector}': {text}")
+        text = self._with_locator(selector, self.page.text_content, verify=True)
+        self.logger.debug("Text from '%s': %s", selector, text)
         return text
     
+    @traced("get_attribute")
     def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
         """Get element attribute"""
-        value = self.page.get_attribute(selector, attribute)
-        self.logger.debug(f"Attribute '{attribute}' from '{selector}': {value}")
+        value = self._with_locator(
+            selector, lambda s: self.page.get_attribute(s, attribute), verify=True)
+        self.logger.debug("Attribute '%s' from '%s': %s", attribute, selector, value)
         return value
     
+    @traced("is_visible")
     def is_visible(self, selector: str) -> bool:
         """Check if element is visible"""
-        is_visible = self.page.is_visible(selector)
-        self.logger.debug(f"Element '{selector}' visible: {is_visible}")
+        is_visible = self._with_locator(
+            selector, self.page.is_visible, retry_if=lambda visible: not visible)
+        self.logger.debug("Element '%s' visible: %s", selector, is_visible)
         return is_visible
     
+    @traced("is_enabled")
     def is_enabled(self, selector: str) -> bool:
         """Check if element is enabled"""
-        is_enabled = self.page.is_enabled(selector)
-        self.logger.debug(f"Element '{selector}' enabled: {is_enabled}")
+        is_enabled = self._with_locator(selector, self.page.is_enabled, verify=True)
+        self.logger.debug("Element '%s' enabled: %s", selector, is_enabled)
         return is_enabled
     
+    @traced("wait_for_selector")
     def wait_for_selector(self, selector: str, timeout: int = 5000) -> None:
         """Wait for element to appear"""
-        self.logger.info(f"Waiting for selector: {selector}")
-        self.page.wait_for_selector(selector, timeout=timeout)
+        self.logger.info("Waiting for selector: %s", selector)
+        self._with_locator(selector, lambda s: self.page.wait_for_selector(s, timeout=timeout))
     
+    @traced("wait_for_url")
     def wait_for_url(self, url_pattern: str, timeout: int = 5000) -> None:
         """Wait for URL to match pattern"""
-        self.logger.info(f"Waiting for URL pattern: {url_pattern}")
+        self.logger.info("Waiting for URL pattern: %s", url_pattern)
         self.page.wait_for_url(f"**{url_pattern}**", timeout=timeout)
     
+    @traced("get_all_text_contents")
     def get_all_text_contents(self, selector: str) -> List[str]:
         """Get text content from all matching elements"""
         elements = self.page.query_selector_all(selector)
         texts = [el.text_content() for el in elements]
-        self.logger.debug(f"Found {len(texts)} elements for '{selector}'")
+        self.logger.debug("Found %s elements for '%s'", len(texts), selector)
         return texts
     
+    @traced("snapshot")
+    def snapshot(
+        self,
+        locators: Dict[str, str],
+        record: Optional[Type[T]] = None,
+        timeout: int = 0
+    ) -> Union[Dict[str, Optional[str]], T]:
+        """
+        Read the text of several elements in one page.evaluate call
+        
+        Args:
+            locators: {name: selector} (CSS, 'css=', 'xpath=' or 'id=')
+            record: Optional class built as record(**texts), e.g. a dataclass
+            timeout: Milliseconds to keep polling while a locator matches nothing
+        
+        Returns:
+            {name: text} (None when a locator matched nothing), or the record
+        
+        Raises:
+            playwright Error: If a locator matches more than one element
+        """
+        texts = collect_snapshot(
+            lambda specs: self.page.evaluate(SNAPSHOT_SCRIPT, specs), locators, timeout / 1000
+        )
+        self.logger.debug("Snapshot of %s locators: %s", len(texts), texts)
+        return record(**texts) if record is not None else texts
+    
+    @traced("snapshot_tables")
+    def snapshot_tables(
+        self,
+        tables: Dict[str, TableSpec],
+        decimal: str = ","
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        Read several tables in one page.evaluate call
+        
+        Numeric columns are parsed inside the page, so a 100-row table costs
+        one round trip instead of one query plus one text_content per row.
+        
+        Args:
+            tables: {name: TableSpec(rows, columns, numeric, limit)}
+            decimal: Decimal separator used by the page (',' for id-ID numbers)
+        
+        Returns:
+            {name: {column: [values]}} with one list entry per complete row
+        """
+        data = self.page.evaluate(TABLE_SCRIPT, compile_tables(tables, decimal))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Table snapshot: %s", ", ".join(
+                    f"{name}={len(next(iter(columns.values()), []))} rows"
+                    for name, columns in data.items()
+                )
+            )
+        return data
+    
+    @traced("press_key")
     def press_key(self, key: str) -> None:
         """Press keyboard key"""
-        self.logger.info(f"Pressing key: {key}")
+        self.logger.info("Pressing key: %s", key)
         self.page.press("body", key)
     
-    def take_screenshot(self, filename: str) -> None:
-        """Take screenshot"""
-        self.logger.info(f"Taking screenshot: {filename}")
-        self.page.screenshot(path=filename)
+    def use_screenshot_service(self, service: ScreenshotService) -> None:
+        """
+        Route take_screenshot through a ScreenshotService (policy, format, background writes)
+        
+        Page objects use the service configured by ScreenshotServiceLibrary
+        by default; this overrides it for one page.
+        """
+        self.screenshot_service = service
+    
+    @traced("take_screenshot", keyed=False)
+    def take_screenshot(
+        self,
+        filename: str,
+        selector: Optional[str] = None,
+        clip: Optional[Dict[str, float]] = None,
+        failed: bool = False,
+        force: bool = True
+    ) -> Optional[str]:
+        """
+        Take screenshot
+        
+        Without a screenshot service the PNG is written to filename on this
+        thread. With one, the service's policy decides whether to capture
+        (force: explicit screenshots are kept unless screenshots are off) and
+        in which format, and the file is written in the background.
+        
+        Args:
+            filename: Target path, or file name stem with a screenshot service
+            selector: Capture only this element
+            clip: Capture only this page region {x, y, width, height}
+            failed: The test failed (for failure / sampled policies)
+            force: Capture regardless of the policy's mode
+        
+        Returns:
+            Path of the image, or None when the policy skipped it
+        """
+        def grab(options: Dict[str, Any]) -> bytes:
+            if selector:
+                # Element screenshots have no full_page option
+                options = {k: v for k, v in options.items() if k != 'full_page'}
+                return self._with_locator(
+                    selector, lambda s: self.page.locator(s).screenshot(**options))
+            if clip:
+                options = {**options, 'clip': clip, 'full_page': False}
+            return self.page.screenshot(**options)
+        
+        if self.screenshot_service is None:
+            self.logger.info("Taking screenshot: %s", filename)
+            grab({'path': filename})
+            return filename
+        
+        path = self.screenshot_service.capture(grab, filename, failed=failed, force=force)
+        self.logger.info("Screenshot %s: %s", "queued" if path else "skipped", path or filename)
+        return str(path) if path else None
     
+    @traced("scroll_to_element")
     def scroll_to_element(self, selector: str) -> None:
         """Scroll to element"""
-        self.logger.info(f"Scrolling to element: {selector}")
-        self.page.locator(selector).scroll_into_view_if_needed()
+        self.logger.info("Scrolling to element: %s", selector)
+        self._with_locator(selector, lambda s: self.page.locator(s).scroll_into_view_if_needed())
     
+    @traced("hover")
     def hover(self, selector: str) -> None:
         """Hover over element"""
-        self.logger.info(f"Hovering over: {selector}")
-        self.page.hover(selector)
+        self.logger.info("Hovering over: %s", selector)
+        self._with_locator(selector, self.page.hover)
     
+    @traced("double_click")
     def double_click(self, selector: str) -> None:
         """Double click element"""
-        self.logger.info(f"Double clicking: {selector}")
+        self.logger.info("Double clicking: %s", selector)
         self.page.dblclick(selector)
     
+    @traced("right_click")
     def right_click(self, selector: str) -> None:
         """Right click element"""
-        self.logger.info(f"Right clicking: {selector}")
+        self.logger.info("Right clicking: %s", selector)
         self.page.click(selector, button="right")
     
+    @traced("drag_and_drop")
     def drag_and_drop(self, source: str, target: str) -> None:
         """Drag element to target"""
-        self.logger.info(f"Dragging '{source}' to '{target}'")
+        self.logger.info("Dragging '%s' to '%s'", source, target)
         self.page.drag_and_drop(source, target)
     
+    @traced("select_option")
     def select_option(self, selector: str, value: str) -> None:
         """Select option in dropdown"""
-        self.logger.info(f"Selecting '{value}' from '{selector}'")
+        self.logger.info("Selecting '%s' from '%s'", value, selector)
         self.page.select_option(selector, value)
     
+    @traced("get_selected_option")
     def get_selected_option(self, selector: str) -> str:
         """Get selected option from dropdown"""
         selected = self.page.input_value(selector)
-        self.logger.debug(f"Selected option: {selected}")
+        self.logger.debug("Selected option: %s", selected)
         return selected
     
+    @traced("clear_text")
     def clear_text(self, selector: str) -> None:
         """Clear text from input field"""
-        self.logger.info(f"Clearing text from: {selector}")
+        self.logger.info("Clearing text from: %s", selector)
         self.page.fill(selector, "")
     
+    @traced("is_checked")
     def is_checked(self, selector: str) -> bool:
         """Check if checkbox is checked"""
         is_checked = self.page.is_checked(selector)
-        self.logger.debug(f"Checkbox '{selector}' checked: {is_checked}")
+        self.logger.debug("Checkbox '%s' checked: %s", selector, is_checked)
         return is_checked
     
+    @traced("check")
     def check(self, selector: str) -> None:
         """Check checkbox"""
-        self.logger.info(f"Checking: {selector}")
+        self.logger.info("Checking: %s", selector)
         self.page.check(selector)
     
+    @traced("uncheck")
     def uncheck(self, selector: str) -> None:
         """Uncheck checkbox"""
-        self.logger.info(f"Unchecking: {selector}")
+        self.logger.info("Unchecking: %s", selector)
         self.page.uncheck(selector)
     
     def close(self) -> None:
@@ -3,11 +3,32 @@ Indodax Market Page Object
 Represents the Indodax cryptocurrency market trading page
 """
 
+import time
+from dataclasses import asdict, dataclass
 from playwright.sync_api import Page
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
+from libraries.api.depth_book import DepthBook
+from libraries.web.dom_snapshot import TableSpec
+from libraries.web.locator_profiler import LocatorProfile, format_profiles
+from libraries.web.performance_budget import PerformanceBudget, PerformanceReport, summarise
+from libraries.web.price_stream import bid_ask_mismatches
 from resources.page_objects.web.base_page import BasePage
 
 
+@dataclass(frozen=True)
+class TradingPairInfo:
+    """Market summary texts of one pair ('' when an element was not found)"""
+    current_price: str = ""
+    price_change_24h: str = ""
+    volume_24h: str = ""
+    market_cap: str = ""
+    bid: str = ""
+    ask: str = ""
+    
+    def as_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+
 class IndodaxMarketPage(BasePage):
     """
     Page Object for Indodax Market/Trading page
@@ -40,6 +61,7 @@ class IndodaxMarketPage(BasePage):
     ORDER_BOOK_ROWS = "[class*='order-book'] tbody tr"
     BUY_ORDERS = "[class*='buy-orders'] tr"
     SELL_ORDERS = "[class*='sell-orders'] tr"
+    ORDER_BOOK_COLUMNS = {'price': 0, 'amount': 1}   # td index per column
     
     # Trading panel
     BUY_BUTTON = "button:has-text('Buy')"
@@ -52,22 +74,102 @@ class IndodaxMarketPage(BasePage):
     # Trading history
     TRADES_TABLE = "[class*='trades-history']"
     TRADES_ROWS = "[class*='trades-history'] tbody tr"
+    TRADES_COLUMNS = {'time': 0, 'type': 1, 'price': 2, 'amount': 3}
+    
+    # Numbers are rendered id-ID style: 16.245 = sixteen thousand, 0,5 = one half
+    DECIMAL_SEPARATOR = ","
+    
+    # Read together by get_trading_pair_info in one snapshot
+    PAIR_INFO_LOCATORS = {
+        'current_price': CURRENT_PRICE,
+        'price_change_24h': PRICE_CHANGE,
+        'volume_24h': VOLUME_24H,
+        'market_cap': MARKET_CAP,
+        'bid': BID_PRICE,
+        'ask': ASK_PRICE,
+    }
+    
+    # Timed by profile_page_locators; the substring / :has-text ones are the slow candidates
+    PROFILED_LOCATORS = {
+        **PAIR_INFO_LOCATORS,
+        'market_header': MARKET_HEADER,
+        'chart_container': CHART_CONTAINER,
+        'order_book_rows': ORDER_BOOK_ROWS,
+        'trades_rows': TRADES_ROWS,
+        'buy_button': BUY_BUTTON,
+        'sell_button': SELL_BUTTON,
+        'place_order_button': PLACE_ORDER_BUTTON,
+    }
     
     def __init__(self, page: Page):
         """Initialize Indodax market page"""
         super().__init__(page)
         self.base_url = "https://indodax.com/market"
+        self.performance_metrics: Optional[Dict[str, Any]] = None
     
-    def navigate_to_pair(self, pair: str) -> None:
+    def navigate_to_pair(self, pair: str, measure: bool = False) -> None:
         """
         Navigate to trading pair page
         
         Args:
             pair: Trading pair (e.g., 'usdtidr', 'btcidr')
+            measure: Collect performance_metrics once the page has loaded
         """
         url = f"{self.base_url}/{pair}"
+        if self.price_stream is None:
+            self.start_price_stream(pair=pair)
         self.navigate_to(url)
         self.logger.info(f"Navigated to market pair: {pair}")
+        if self.locator_cache is not None:
+            self.sync_locator_cache()
+        if measure:
+            self.performance_metrics = self.get_performance_metrics()
+            self.logger.info(f"Performance [{pair}]: {summarise(self.performance_metrics)}")
+    
+    def check_performance_budget(
+        self,
+        budget: PerformanceBudget,
+        report: Optional[PerformanceReport] = None,
+        name: str = "market_page"
+    ) -> List[str]:
+        """
+        Check the page's performance metrics against a budget
+        
+        Uses the metrics from navigate_to_pair(measure=True), or collects them now.
+        
+        Args:
+            budget: PerformanceBudget, e.g. PerformanceBudget.from_config(env_config)
+            report: Optional run report the result is appended to
+            name: Label of this measurement in the report
+        
+        Returns:
+            Budget violations (empty when within budget)
+        """
+        if self.performance_metrics is None:
+            self.performance_metrics = self.get_performance_metrics()
+        violations, skipped = budget.check(self.performance_metrics)
+        if report is not None:
+            report.add(name, self.get_current_url(), self.performance_metrics, budget, violations, skipped)
+        if violations:
+            self.logger.warning(f"Performance budget exceeded: {'; '.join(violations)}")
+        return violations
+    
+    def profile_page_locators(self, repeat: int = 20) -> List[LocatorProfile]:
+        """
+        Profile PROFILED_LOCATORS on the loaded page
+        
+        With a locator cache (use_locator_cache), faster equivalents found
+        here are used by later clicks, waits and reads.
+        
+        Args:
+            repeat: Resolutions averaged per locator
+        
+        Returns:
+            One LocatorProfile per locator
+        """
+        profiles = self.profile_locators(self.PROFILED_LOCATORS, repeat)
+        self.logger.info(f"Locator profile:\n{format_profiles(profiles)}")
+        return profiles
     
     def get_current_price(self) -> str:
         """Get current trading price"""
@@ -129,40 +231,46 @@ class IndodaxMarketPage(BasePage):
             self.logger.warning(f"Could not get ask price: {e}")
             return ""
     
-    def get_order_book_data(self) -> Dict[str, Any]:
+    def get_order_book_data(self, bands_pct: Iterable[float] = (0.1, 0.5, 1.0, 2.0)) -> Dict[str, Any]:
         """
         Get order book data
         
+        Both sides are read and parsed in one browser round trip; spread and
+        cumulative depth are computed in Python.
+        
+        Args:
+            bands_pct: Price bands (% of mid) for the cumulative depth report
+        
         Returns:
-            Dictionary with buy and sell orders
+            Dictionary with buy_orders / sell_orders ([{price, amount}], best
+            first), bid_ask_spread, spread_pct and depth (see DepthBook.cumulative_depth)
         """
         try:
-            buy_orders = self._extract_orders(self.BUY_ORDERS)
-            sell_orders = self._extract_orders(self.SELL_ORDERS)
+            numeric = tuple(self.ORDER_BOOK_COLUMNS)
+            tables = self.snapshot_tables({
+                'buy': TableSpec(self.BUY_ORDERS, self.ORDER_BOOK_COLUMNS, numeric),
+                'sell': TableSpec(self.SELL_ORDERS, self.ORDER_BOOK_COLUMNS, numeric),
+            }, self.DECIMAL_SEPARATOR)
+            bids = list(zip(tables['buy']['price'], tables['buy']['amount']))
+            asks = list(zip(tables['sell']['price'], tables['sell']['amount']))
+            
+            buy_orders = [{'price': price, 'amount': amount} for price, amount in bids]
+            sell_orders = [{'price': price, 'amount': amount} for price, amount in asks]
+            book = DepthBook({'buy': bids, 'sell': asks})
             
             order_book = {
                 'buy_orders': buy_orders,
                 'sell_orders': sell_orders,
-                'bid_ask_spread': self._calculate_spread(buy_orders, sell_orders)
+                'bid_ask_spread': self._calculate_spread(buy_orders, sell_orders),
+                'spread_pct': book.spread_pct,
+                'depth': book.cumulative_depth(bands_pct),
             }
             
             self.logger.info(f"Order book: {len(buy_orders)} buy orders, {len(sell_orders)} sell orders")
             return order_book
         except Exception as e:
             self.logger.warning(f"Could not get order book: {e}")
-            return {'buy_orders': [], 'sell_orders': [], 'bid_ask_spread': None}
-    
-    def _extract_orders(self, selector: str) -> List[Dict[str, str]]:
-        """Extract order data from table rows"""
-        orders = []
-        try:
-            texts = self.get_all_text_contents(selector)
-            # Parse order data from text (implementation depends on actual HTML structure)
-            self.logger.debug(f"Extracted {len(texts)} orders")
-        except Exception as e:
-            self.logger.warning(f"Error extracting orders: {e}")
-        
-        return orders
+            return {'buy_orders': [], 'sell_orders': [], 'bid_ask_spread': None, 'spread_pct': None, 'depth': []}
     
     def _calculate_spread(self, buy_orders: List, sell_orders: List) -> Optional[float]:
         """Calculate bid-ask spread"""
@@ -178,43 +286,122 @@ class IndodaxMarketPage(BasePage):
         
         return None
     
-    def get_recent_trades(self, limit: int = 10) -> List[Dict[str, str]]:
+    def get_recent_trades(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Get recent trades
+        Get recent trades (one browser round trip, parsed in the page)
         
         Args:
             limit: Number of trades to retrieve
             
         Returns:
-            List of recent trades
+            List of trades, newest first: {time, type, price, amount} with
+            numeric price and amount
         """
         try:
-            trades = self.get_all_text_contents(self.TRADES_ROWS)
+            spec = TableSpec(self.TRADES_ROWS, self.TRADES_COLUMNS, ('price', 'amount'), int(limit))
+            columns = self.snapshot_tables({'trades': spec}, self.DECIMAL_SEPARATOR)['trades']
+            trades = [dict(zip(columns, row)) for row in zip(*columns.values())]
             self.logger.info(f"Retrieved {len(trades)} recent trades (limit: {limit})")
-            return trades[:limit]
+            return trades
         except Exception as e:
             self.logger.warning(f"Could not get recent trades: {e}")
             return []
     
-    def get_trading_pair_info(self) -> Dict[str, str]:
+    def _read_text(self, selector: str) -> Optional[str]:
+        """Trimmed text of the first element matching selector, or None"""
+        try:
+            text = self.get_text(selector)
+        except Exception:
+            return None
+        return text.strip() if text is not None else None
+    
+    def get_trading_pair_info(self) -> TradingPairInfo:
         """
-        Get complete trading pair information
+        Get complete trading pair information in one browser round trip
+        
+        The snapshot is strict; when it fails (e.g. a substring locator
+        matches several nodes) each field is read on its own, first match
+        wins, as the individual getters do.
         
         Returns:
-            Dictionary with price, change, volume, market cap
+            TradingPairInfo with price, change, volume, market cap, bid and ask
+            (use .as_dict() for a plain dictionary)
         """
-        info = {
-            'current_price': self.get_current_price(),
-            'price_change_24h': self.get_price_change(),
-            'volume_24h': self.get_volume_24h(),
-            'market_cap': self.get_market_cap(),
-            'bid': self.get_bid_price(),
-            'ask': self.get_ask_price(),
-        }
+        try:
+            texts = self.snapshot(self.PAIR_INFO_LOCATORS)
+        except Exception as e:
+            self.logger.warning(f"Trading pair snapshot failed, reading fields one by one: {e}")
+            texts = {
+                name: self._read_text(locator) for name, locator in self.PAIR_INFO_LOCATORS.items()
+            }
+        
+        missing = [name for name, text in texts.items() if text is None]
+        if missing:
+            self.logger.warning(f"Could not get: {', '.join(missing)}")
         
+        info = TradingPairInfo(**{name: text or "" for name, text in texts.items()})
         self.logger.info(f"Trading pair info: {info}")
         return info
     
+    def wait_for_price_updates(self, count: int = 1, timeout: int = 10000) -> List[float]:
+        """
+        Wait for count ticker pushes on the price stream
+        
+        Args:
+            count: Price updates to wait for
+            timeout: Milliseconds to wait
+        
+        Returns:
+            The streamed prices, oldest first
+        
+        Raises:
+            AssertionError: If fewer updates arrived in time
+        """
+        updates = self.wait_for_stream_updates(count, timeout, "ticker")
+        prices = [update.price for update in updates]
+        self.logger.info(f"Received {len(prices)} price updates: {prices}")
+        return prices
+    
+    def is_bid_ask_consistent_with_stream(
+        self,
+        tolerance: float = 0.0,
+        timeout: int = 10000
+    ) -> bool:
+        """
+        Check the shown bid/ask against the latest order-book push
+        
+        The DOM renders a push shortly after it arrives, so the check is
+        repeated after each new order-book update until timeout.
+        
+        Args:
+            tolerance: Allowed absolute price difference
+            timeout: Milliseconds to wait for a consistent state
+        """
+        problems = ["price stream not started"]
+        try:
+            deadline = time.monotonic() + timeout / 1000
+            while self.price_stream is not None:
+                texts = self.snapshot({'bid': self.BID_PRICE, 'ask': self.ASK_PRICE})
+                problems = bid_ask_mismatches(
+                    self.price_stream.latest("orderbook"), texts['bid'], texts['ask'], tolerance,
+                    self.DECIMAL_SEPARATOR
+                )
+                remaining_ms = (deadline - time.monotonic()) * 1000
+                if not problems or remaining_ms <= 0:
+                    break
+                try:
+                    self.wait_for_stream_updates(1, remaining_ms, "orderbook")
+                except AssertionError:
+                    break  # no newer push; report the last comparison
+        except Exception as e:
+            problems = [str(e)]
+        
+        if problems:
+            self.logger.warning(f"Bid/ask differ from price stream: {'; '.join(problems)}")
+            return False
+        self.logger.info("Bid/ask consistent with price stream")
+        return True
+    
     def is_page_loaded(self) -> bool:
         """Check if market page is fully loaded"""
         try:
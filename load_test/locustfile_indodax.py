@@ -0,0 +1,62 @@
+"""
+Load Test terhadap Indodax API (public + private TAPI).
+Default target: mock server lokal (automation-framework/mock_server/indodax_mock_server.py)
+agar throughput client bisa diukur tanpa rate limit indodax.com.
+
+Usage:
+    python automation-framework/mock_server/indodax_mock_server.py --port 8089
+    locust -f load_test/locustfile_indodax.py --host http://127.0.0.1:8089
+"""
+
+import os
+import random
+import sys
+
+from locust import HttpUser, task, between
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "automation-framework", "libraries", "api"))
+
+from indodax_signer import IndodaxSigner  # noqa: E402
+from nonce_allocator import NonceAllocator  # noqa: E402
+
+PAIRS = ["btc_idr", "eth_idr", "xrp_idr", "ada_idr"]
+API_KEY = os.getenv("INDODAX_API_KEY", "mock_api_key_0123456789")
+API_SECRET = os.getenv("INDODAX_API_SECRET", "mock_api_secret_0123456789")
+
+# Satu allocator per key — dibagi semua user & worker Locust agar nonce tidak bentrok
+SIGNER = IndodaxSigner(API_KEY, API_SECRET, nonce_allocator=NonceAllocator(API_KEY))
+
+
+class IndodaxApiUser(HttpUser):
+    """Simulasi pengguna yang membaca market data dan akun via API Indodax."""
+    wait_time = between(float(os.getenv("LOCUST_WAIT_MIN", "0")), float(os.getenv("LOCUST_WAIT_MAX", "0.1")))
+
+    @task(4)
+    def get_ticker(self):
+        pair = random.choice(PAIRS)
+        with self.client.get(f"/api/ticker/{pair}", name="GET /api/ticker/{pair}",
+                             catch_response=True) as response:
+            if response.status_code != 200 or "ticker" not in response.json():
+                response.failure(f"HTTP {response.status_code}")
+
+    @task(2)
+    def get_depth(self):
+        pair = random.choice(PAIRS)
+        with self.client.get(f"/api/depth/{pair}", name="GET /api/depth/{pair}",
+                             catch_response=True) as response:
+            if response.status_code != 200 or "buy" not in response.json():
+                response.failure(f"HTTP {response.status_code}")
+
+    @task(1)
+    def get_trades(self):
+        pair = random.choice(PAIRS)
+        self.client.get(f"/api/trades/{pair}", name="GET /api/trades/{pair}")
+
+    @task(1)
+    def get_info(self):
+        body, headers = SIGNER.sign_request("getInfo")
+        with self.client.post("/tapi", data=body, headers=headers, name="POST /tapi getInfo",
+                              catch_response=True) as response:
+            data = response.json()
+            if data.get("success") != 1:
+                response.failure(data.get("error_code", "tapi_error"))